@@ -0,0 +1,147 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+BACKGROUND BENCHMARK - vector vs pre-rasterized .bg-shapes layers
+
+Builds the deck both ways and times each stage:
+
+- build:  build_all_slides() from scratch: the slide fragment, blob and
+          component caches are off, and every run rasterizes into a fresh
+          background cache
+- render: WeasyPrint HTML -> PDF
+- scroll: drawing every PDF page at screen resolution, which is what a
+          viewer does while scrolling (pypdfium2, or poppler's pdftoppm)
+
+Usage:
+    python bench_backgrounds.py                # 150 dpi backgrounds, 3 runs
+    python bench_backgrounds.py --dpi 200 --repeat 5
+"""
+
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
+
+import build_slides_html as deck
+
+try:
+    import pypdfium2
+except ImportError:  # falls back to pdftoppm, or skips the scroll timing
+    pypdfium2 = None
+
+SCREEN_DPI = 96
+
+# =============================================================================
+# STAGES
+# =============================================================================
+
+def time_call(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def render_pdf(html, pdf_path):
+    HTML(string=html, base_url=deck.BASE_PATH + os.sep).write_pdf(
+        pdf_path, font_config=FontConfiguration())
+
+
+def scroll_pdf(pdf_path):
+    """Draw every page once at screen resolution; None when no rasterizer is available"""
+    if pypdfium2 is not None:
+        pdf = pypdfium2.PdfDocument(pdf_path)
+        start = time.perf_counter()
+        for page in pdf:
+            page.render(scale=SCREEN_DPI / 72).to_pil()
+        elapsed = time.perf_counter() - start
+        pdf.close()
+        return elapsed
+
+    if shutil.which('pdftoppm'):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            subprocess.run(['pdftoppm', '-r', str(SCREEN_DPI), '-png', pdf_path,
+                            os.path.join(tmp, 'page')], check=True)
+            return time.perf_counter() - start
+    return None
+
+
+def bench(label, raster_dpi, repeat, workdir):
+    runs = {'build': [], 'render': [], 'scroll': []}
+    pdf_path = os.path.join(workdir, f"{label}.pdf")
+    slide_cache, raster_dir = deck.SLIDE_CACHE, deck.BG_RASTER_DIR
+    deck.SLIDE_CACHE = False
+    try:
+        for _ in range(repeat):
+            deck.clear_blob_cache()
+            deck.clear_component_cache()
+            # Beside the deck, so the PNGs resolve against its base URL
+            with tempfile.TemporaryDirectory(prefix=".bench-backgrounds-", dir=deck.BASE_PATH) as tmp:
+                deck.BG_RASTER_DIR = tmp
+                html, seconds = time_call(deck.build_all_slides, font_format='truetype',
+                                          static_weights=True, raster_dpi=raster_dpi)
+                runs['build'].append(seconds)
+                _, seconds = time_call(render_pdf, html, pdf_path)
+                runs['render'].append(seconds)
+            seconds = scroll_pdf(pdf_path)
+            if seconds is not None:
+                runs['scroll'].append(seconds)
+    finally:
+        deck.SLIDE_CACHE, deck.BG_RASTER_DIR = slide_cache, raster_dir
+    return {
+        'label': label,
+        'html': len(html.encode('utf-8')),
+        'pdf': os.path.getsize(pdf_path),
+        **{stage: statistics.median(times) if times else None for stage, times in runs.items()},
+    }
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare vector and rasterized slide backgrounds")
+    parser.add_argument('--dpi', type=float, default=deck.BG_RASTER_DPI,
+                        help="resolution of the rasterized backgrounds")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per mode (median is reported)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("BAILEY VANN - BACKGROUND BENCHMARK")
+    print("=" * 60)
+
+    if not deck.raster_available():
+        print("  cairosvg not installed - nothing to compare (pip install cairosvg)")
+        return
+    if pypdfium2 is None and not shutil.which('pdftoppm'):
+        print("  no PDF rasterizer (pip install pypdfium2) - scroll time skipped")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        results = [
+            bench("vector", None, args.repeat, workdir),
+            bench(f"raster {args.dpi:g}dpi", args.dpi, args.repeat, workdir),
+        ]
+
+    def fmt(seconds):
+        return f"{seconds:>8.2f}s" if seconds is not None else f"{'-':>9}"
+
+    print(f"  {'mode':<14} {'build':>9} {'render':>9} {'scroll':>9} {'HTML bytes':>12} {'PDF bytes':>12}")
+    for r in results:
+        print(f"  {r['label']:<14} {fmt(r['build'])} {fmt(r['render'])} {fmt(r['scroll'])} "
+              f"{r['html']:>12,} {r['pdf']:>12,}")
+    print(f"  Backgrounds: {deck.BG_RASTER_STATS['rendered']} layers rendered "
+          f"({deck.BG_RASTER_STATS['seconds']:.2f}s) over {args.repeat} cold runs")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+PDF BACKEND BENCHMARK - every deck through every installed backend
+
+Each backend (pdf_backends.py) runs in its own fresh process, is opened
+once and renders every deck on that warm instance, as export_decks.py
+does.  Per deck and backend it reports:
+
+- time:   median render time over --repeat runs
+- memory: how far the resident memory of the backend process and
+          everything it started (wkhtmltopdf, Chromium) rises above its
+          level just before the deck renders
+- size:   bytes of the PDF written
+
+plus each backend's start-up time, and which backend was fastest and which
+wrote the smallest PDF for every deck.
+
+Usage:
+    python bench_pdf_backends.py                              # all decks, installed backends
+    python bench_pdf_backends.py --backends chromium wkhtmltopdf --repeat 3
+    python bench_pdf_backends.py "DAY 2 slides 1-37.html" --csv backends.csv
+"""
+
+import os
+import csv
+import time
+import argparse
+import tempfile
+import threading
+import statistics
+from concurrent.futures import ProcessPoolExecutor
+
+import export_decks
+from compact_decks import discover_decks
+from pdf_backends import BACKENDS, available_backends, get_backend
+
+# Every backend prints backgrounds, so the PDFs stay comparable
+BACKEND_OPTIONS = {'wkhtmltopdf': {'backgrounds': True}}
+
+SAMPLE_INTERVAL = 0.02        # seconds between memory samples
+PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# =============================================================================
+# PEAK MEMORY
+# =============================================================================
+
+def _process_tree(pid):
+    """pid and all its descendants, from /proc"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'rb') as f:
+                stat = f.read()
+        except OSError:  # exited meanwhile
+            continue
+        # "pid (comm) state ppid ..." - comm may itself contain spaces or parens
+        ppid = int(stat[stat.rindex(b')') + 2:].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    tree, todo = [], [pid]
+    while todo:
+        p = todo.pop()
+        tree.append(p)
+        todo.extend(children.get(p, ()))
+    return tree
+
+
+def tree_rss(pid):
+    """Resident bytes of pid and its descendants"""
+    total = 0
+    for p in _process_tree(pid):
+        try:
+            with open(f'/proc/{p}/statm', 'rb') as f:
+                total += int(f.read().split()[1]) * PAGE_SIZE
+        except (OSError, IndexError, ValueError):
+            continue
+    return total
+
+
+class PeakMemory:
+    """
+    Samples tree_rss() of this process in a thread; rise is the largest
+    sample above the baseline taken on entry (stays 0 without /proc)
+    """
+
+    def __init__(self):
+        self.baseline = self.peak = 0
+        self._stop = threading.Event()
+
+    @property
+    def rise(self):
+        return max(0, self.peak - self.baseline)
+
+    def _run(self):
+        while True:
+            self.peak = max(self.peak, tree_rss(os.getpid()))
+            if self._stop.wait(SAMPLE_INTERVAL):
+                break
+
+    def __enter__(self):
+        self._thread = None
+        if os.path.isdir('/proc'):
+            self.baseline = self.peak = tree_rss(os.getpid())
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+# =============================================================================
+# BENCHMARK
+# =============================================================================
+
+def bench_backend(job):
+    """Worker: one backend over every deck; returns (startup seconds, {deck: result})"""
+    name, decks, repeat, out_dir = job
+    backend = get_backend(name, **BACKEND_OPTIONS.get(name, {}))
+    start = time.perf_counter()
+    backend.open()
+    startup = time.perf_counter() - start
+
+    results = {}
+    try:
+        for deck in decks:
+            pdf_path = os.path.join(out_dir, f"{name}-{os.path.splitext(os.path.basename(deck))[0]}.pdf")
+            runs, peak, error = [], 0, None
+            for _ in range(repeat):
+                with PeakMemory() as memory:
+                    start = time.perf_counter()
+                    try:
+                        backend.render(deck, pdf_path)
+                    except RuntimeError as e:
+                        error = str(e)
+                    runs.append(time.perf_counter() - start)
+                peak = max(peak, memory.rise)
+                if error:
+                    break
+            results[deck] = {'seconds': statistics.median(runs), 'peak': peak, 'error': error,
+                             'bytes': os.path.getsize(pdf_path) if not error else 0}
+    finally:
+        backend.close()
+    return startup, results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the PDF backends deck by deck")
+    parser.add_argument('decks', nargs='*', help="decks to render (default: every deck in the project)")
+    parser.add_argument('--backends', nargs='+', choices=sorted(BACKENDS),
+                        help="backends to compare (default: every installed one)")
+    parser.add_argument('--repeat', type=int, default=1, help="runs per deck (median is reported)")
+    parser.add_argument('--csv', metavar='FILE', help="also write the results to this CSV file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("BAILEY VANN - PDF BACKEND BENCHMARK")
+    print("=" * 60)
+
+    backends = [b for b in (args.backends or BACKENDS) if BACKENDS[b].available()]
+    missing = sorted(set(args.backends or BACKENDS) - set(backends))
+    if missing:
+        print(f"  Not installed: {', '.join(missing)}")
+    if not backends:
+        print(f"  No backend to compare (installed: {', '.join(available_backends()) or 'none'})")
+        return
+    if not os.path.isdir('/proc'):
+        print("  No /proc - peak memory is not measured")
+
+    decks = args.decks or [d for d in discover_decks(export_decks.BASE_PATH)
+                           if os.path.basename(d) not in export_decks.GENERATED_DECKS]
+    print(f"  {len(decks)} decks x {len(backends)} backends ({', '.join(backends)}), "
+          f"{max(1, args.repeat)} run(s) each")
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="bench-backends-") as out_dir:
+        for name in backends:
+            # A fresh process per backend: no warm state or memory carries over
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                startup, results[name] = pool.submit(
+                    bench_backend, (name, decks, max(1, args.repeat), out_dir)).result()
+            print(f"  {name:<12} started in {startup:.2f}s, "
+                  f"{sum(r['seconds'] for r in results[name].values()):.2f}s for all decks")
+
+    print("-" * 60)
+    header = "".join(f" {name:>33}" for name in backends)
+    print(f"  {'deck':<34}{header}   fastest / smallest")
+    for deck in decks:
+        cells = []
+        for name in backends:
+            r = results[name][deck]
+            cells.append(f" {'failed':>33}" if r['error'] else
+                          f" {r['seconds']:>7.2f}s {r['peak'] / 2**20:>7.0f} MB {r['bytes'] / 1024:>9,.0f} KB")
+        ok = [n for n in backends if not results[n][deck]['error']]
+        best = (f"   {min(ok, key=lambda n: results[n][deck]['seconds'])} / "
+                f"{min(ok, key=lambda n: results[n][deck]['bytes'])}") if ok else ""
+        print(f"  {os.path.basename(deck)[:34]:<34}{''.join(cells)}{best}")
+
+    for name in backends:
+        errors = [(d, r['error']) for d, r in results[name].items() if r['error']]
+        for deck, error in errors:
+            print(f"  {name} failed on {os.path.basename(deck)}: {error}")
+
+    if args.csv:
+        with open(args.csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['deck', 'backend', 'seconds', 'peak_rise_bytes', 'pdf_bytes', 'error'])
+            for deck in decks:
+                for name in backends:
+                    r = results[name][deck]
+                    writer.writerow([os.path.basename(deck), name, f"{r['seconds']:.3f}",
+                                     r['peak'], r['bytes'], r['error'] or ''])
+        print(f"  CSV: {args.csv}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
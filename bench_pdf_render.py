@@ -0,0 +1,75 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+PDF RENDER BENCHMARK - chunked WeasyPrint renders on 1..N processes
+
+Builds the PDF document once, then renders it with pdf_render.render_pdf()
+on 1, 2, ... N processes (one chunk each) and reports the median wall
+time, the speedup over one process and what the merge's deduplication
+saved.
+
+Usage:
+    python bench_pdf_render.py                 # 1..cpu_count processes, 3 runs
+    python bench_pdf_render.py --max-jobs 8 --repeat 5
+    python bench_pdf_render.py --copies 4      # the deck 4 times over (~100 slides)
+"""
+
+import os
+import argparse
+import tempfile
+import statistics
+
+import build_slides_html as deck
+from pdf_render import RENDER_STATS, merge_available, render_pdf
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time the PDF render on 1..N processes")
+    parser.add_argument('--max-jobs', type=int, default=os.cpu_count() or 1,
+                        help="largest process count to try")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per process count (median is reported)")
+    parser.add_argument('--copies', type=int, default=1,
+                        help="repeat the slides this many times to stand in for a longer deck")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("BAILEY VANN - PDF RENDER BENCHMARK")
+    print("=" * 60)
+
+    if not merge_available():
+        print("  pypdf not installed - nothing to compare (pip install pypdf)")
+        return
+
+    pieces = list(deck.iter_deck_pieces(font_format='truetype', static_weights=True))
+    slides = [p for p in pieces if p[0] == 'slide']
+    head = [p for p in pieces if p[0] == 'head']
+    tail = [p for p in pieces if p[0] == 'tail']
+    pieces = head + slides * args.copies + tail
+    print(f"  {len(slides) * args.copies} slides, {sum(len(html) for _, html in pieces):,} bytes of HTML")
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        pdf_path = os.path.join(workdir, "deck.pdf")
+        for jobs in range(1, max(1, args.max_jobs) + 1):
+            runs = []
+            for _ in range(args.repeat):
+                render_pdf(pieces, pdf_path, deck.BASE_PATH + os.sep, jobs=jobs)
+                runs.append(dict(RENDER_STATS))
+            results.append((jobs, statistics.median(r['wall'] for r in runs), runs[-1]))
+
+    baseline = results[0][1]
+    print(f"  {'jobs':>4} {'wall':>9} {'speedup':>8} {'merge':>8} {'chunk bytes':>13} {'PDF bytes':>12}")
+    for jobs, wall, stats in results:
+        print(f"  {jobs:>4} {wall:>8.2f}s {baseline / wall:>7.2f}x {stats['merge']:>7.2f}s "
+              f"{stats['chunk_bytes']:>13,} {stats['pdf_bytes']:>12,}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
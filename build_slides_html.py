@@ -9,10 +9,54 @@ Benefits:
 - No font substitution
 """
 
+import io
 import os
+import re
+import math
+import random
+import sys
+import json
+import time
 import base64
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
+import hashlib
+import inspect
+import tempfile
+import argparse
+from collections import namedtuple
+from functools import lru_cache
+from html import unescape
+from html.parser import HTMLParser
+
+from font_metrics import MetricsUnavailable
+from text_fit import fit_text, text_width
+from placement import BLOB, Decoration, scatter
+from slide_registry import SlideRegistry, add_selection_args, selected_slides
+from css_prune import UsedNames, prune_css, split_statements
+from pdf_render import RENDER_STATS, evict_pages, merge_available, render_file, render_pages, render_pdf
+
+try:
+    from fontTools import subset as ft_subset
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:  # subsetting is optional - full fonts are embedded instead
+    ft_subset = None
+    TTFont = None
+    instancer = None
+
+try:
+    import brotli  # noqa: F401 - fontTools needs it to write WOFF2
+except ImportError:
+    brotli = None
+
+try:
+    import numpy as np
+except ImportError:  # the blob kernel falls back to plain Python loops
+    np = None
+
+try:
+    import cairosvg
+except (ImportError, OSError):  # OSError: the cairo library itself is missing
+    cairosvg = None
 
 # =============================================================================
 # DESIGN SYSTEM
@@ -42,10 +86,65 @@ COLORS = {
 SLIDE_WIDTH = 1920
 SLIDE_HEIGHT = 1080
 
+# Project root and on-disk build cache (fonts, fragments, pages...)
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_PATH, ".build_cache")
+
 # =============================================================================
 # FONT EMBEDDING
 # =============================================================================
 
+FONTS = [
+    ('Ogg Bold', 'Ogg Bold Font.ttf'),
+    ('Ogg Medium', 'Ogg Medium Font.ttf'),
+    ('Ogg Light', 'Ogg Light Font.ttf'),
+    ('Ogg Text', 'Ogg Text Book.ttf'),
+    ('Ogg Text Medium', 'Ogg Text Medium.ttf'),
+    ('Satoshi', 'Satoshi-Variable.ttf'),
+]
+
+# Variable fonts and their wght axis range; with fontTools these are
+# embedded as one static instance per weight the deck uses, unless the
+# instances together come out bigger than the variable font itself.
+VARIABLE_FONT_WEIGHTS = {
+    'Satoshi': (300, 900),
+}
+
+FONT_CACHE_DIR = os.path.join(CACHE_DIR, "fonts")
+FONT_CACHE_INDEX = os.path.join(FONT_CACHE_DIR, "index.json")
+
+# Filled in by get_font_css() so the build can report what the cache saved
+FONT_CACHE_STATS = {'hits': 0, 'misses': 0, 'seconds': 0.0}
+
+# (font name, original bytes, embedded bytes) per font of the last get_font_css()
+FONT_SIZE_REPORT = []
+
+# variable font name -> ('static' or 'variable', instance bytes, variable
+# font bytes): which one the last get_font_css() embedded, and why
+FONT_INSTANCE_CHOICES = {}
+
+# Embeddable font formats -> data URI mime type.  woff2 suits browser
+# previews; the WeasyPrint PDF path keeps plain truetype.
+FONT_FORMATS = {
+    'truetype': 'font/truetype',
+    'woff2': 'font/woff2',
+}
+
+FONT_EXTENSIONS = {
+    'truetype': 'ttf',
+    'woff2': 'woff2',
+}
+
+def woff2_available():
+    return TTFont is not None and brotli is not None
+
+# 'inline' embeds base64 fonts in every deck (single-file sharing);
+# 'link' points decks at the shared fonts.css + fonts/ bundle.
+FONT_MODES = ('inline', 'link')
+FONT_BUNDLE_DIR = os.path.join(BASE_PATH, "fonts")
+FONT_BUNDLE_CSS = os.path.join(BASE_PATH, "fonts.css")
+
+
 def get_font_base64(font_path):
     """Read font file and return base64 encoded string"""
     if os.path.exists(font_path):
@@ -53,38 +152,683 @@ def get_font_base64(font_path):
             return base64.b64encode(f.read()).decode('utf-8')
     return None
 
-def get_font_css():
-    """Generate @font-face CSS with embedded fonts"""
-    fonts = [
-        ('Ogg Bold', 'Ogg Bold Font.ttf'),
-        ('Ogg Medium', 'Ogg Medium Font.ttf'),
-        ('Ogg Light', 'Ogg Light Font.ttf'),
-        ('Ogg Text', 'Ogg Text Book.ttf'),
-        ('Ogg Text Medium', 'Ogg Text Medium.ttf'),
-        ('Satoshi', 'Satoshi-Variable.ttf'),
-    ]
+def _load_font_cache_index():
+    """Load the font path -> (mtime, size, sha256) index, empty if missing/corrupt"""
+    try:
+        with open(FONT_CACHE_INDEX) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_font_cache_index(index):
+    os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+    tmp_path = FONT_CACHE_INDEX + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(index, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, FONT_CACHE_INDEX)
+
+def _font_file_hash(font_path, index):
+    """
+    Content hash of a font file.
 
-    css = ""
-    base_path = "/home/user/webby-slides-bailey"
+    The file is only re-read when its mtime or size differ from the index,
+    so a warm build never touches the font bytes.
+    """
+    st = os.stat(font_path)
+    entry = index.get(font_path)
+    if entry and entry['mtime'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        return entry['sha256']
 
-    for font_name, font_file in fonts:
-        font_path = os.path.join(base_path, font_file)
-        if os.path.exists(font_path):
-            b64 = get_font_base64(font_path)
-            css += f"""
+    with open(font_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    index[font_path] = {'mtime': st.st_mtime_ns, 'size': st.st_size, 'sha256': digest}
+    return digest
+
+def _font_face_rule(font_name, src, weight='normal'):
+    return f"""
 @font-face {{
     font-family: '{font_name}';
-    src: url('data:font/truetype;base64,{b64}') format('truetype');
-    font-weight: normal;
+    src: {src};
+    font-weight: {weight};
     font-style: normal;
 }}
 """
-    return css
+
+def _font_face_block(font_name, b64, mime='font/truetype', fmt='truetype', weight='normal'):
+    return _font_face_rule(font_name, f"url('data:{mime};base64,{b64}') format('{fmt}')", weight)
+
+def _embedded_size(block):
+    """Decoded byte size of the base64 payload inside an @font-face block"""
+    b64 = block.split('base64,', 1)[1].split("'", 1)[0]
+    return len(b64) * 3 // 4 - b64[-2:].count('=')
+
+class _TextCollector(HTMLParser):
+    """Collects every rendered text node, including SVG <text>, skipping <style>/<script>"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.chunks = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('style', 'script'):
+            self._skip += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('style', 'script') and self._skip:
+            self._skip -= 1
+
+    def handle_data(self, data):
+        if not self._skip:
+            self.chunks.append(data)
+
+def collect_used_text(html):
+    """
+    Return the sorted set of characters a deck can render.
+
+    Both cases of every letter are kept since CSS text-transform (e.g. .pill)
+    changes case after this scan.
+    """
+    collector = _TextCollector()
+    collector.feed(html)
+    collector.close()
+
+    chars = set()
+    for ch in "".join(collector.chunks):
+        if ch in '\n\r\t':
+            continue
+        chars.update((ch, ch.upper(), ch.lower()))
+    chars.add(' ')
+    return "".join(sorted(c for c in chars if len(c) == 1))
+
+_FONT_DECL_RE = re.compile(r"(font-family|font-weight)\s*:\s*([^;]+)")
+_FONT_WEIGHT_KEYWORDS = {'normal': 400, 'bold': 700}
+_BOLD_TAGS = {'b', 'strong', 'th', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+_VOID_TAGS = {'br', 'hr', 'img', 'input', 'link', 'meta', 'source', 'wbr'}
+
+def _font_value(prop, value):
+    """First family name (lower case) or numeric weight of a declaration; None if unknown"""
+    value = value.strip().strip('"\'')
+    if prop == 'font-family':
+        return value.split(',')[0].strip().strip('"\'').lower() or None
+    if value.isdigit():
+        return int(value)
+    return _FONT_WEIGHT_KEYWORDS.get(value.lower())
+
+@lru_cache(maxsize=8)
+def css_class_fonts(css):
+    """{class: {'font-family': name, 'font-weight': n}} from the .class rules of css"""
+    statements, _ = split_statements(css)
+    fonts = {}
+    for _, prelude, block in statements:
+        if block is None:
+            continue
+        declared = {}
+        for prop, value in _FONT_DECL_RE.findall(block):
+            value = _font_value(prop, value)
+            if value is not None:
+                declared[prop] = value
+        if not declared:
+            continue
+        for selector in prelude.split(','):
+            selector = selector.strip()
+            if re.fullmatch(r'\.[\w-]+', selector):
+                fonts.setdefault(selector[1:], {}).update(declared)
+    return fonts
+
+class _WeightCollector(HTMLParser):
+    """
+    Follows font-family and font-weight down the element tree (class rules,
+    style attributes, SVG attributes, bold tags) and records the weight of
+    every text node set in `family`
+    """
+
+    def __init__(self, family, class_fonts):
+        super().__init__(convert_charrefs=True)
+        self.family = family
+        self.class_fonts = class_fonts
+        self.weights = set()
+        self._stack = [(None, None, 400)]  # (tag, family, weight)
+
+    def handle_starttag(self, tag, attrs):
+        _, family, weight = self._stack[-1]
+        if tag in _BOLD_TAGS:
+            weight = 700
+        attrs = dict(attrs)
+        declared = {}
+        for name in (attrs.get('class') or "").split():
+            declared.update(self.class_fonts.get(name, {}))
+        for prop in ('font-family', 'font-weight'):
+            if attrs.get(prop):
+                declared[prop] = _font_value(prop, attrs[prop])
+        for prop, value in _FONT_DECL_RE.findall(attrs.get('style') or ""):
+            declared[prop] = _font_value(prop, value)
+        family = declared.get('font-family') or family
+        weight = declared.get('font-weight') or weight
+        if tag not in _VOID_TAGS:
+            self._stack.append((tag, family, weight))
+
+    def handle_startendtag(self, tag, attrs):
+        pass  # <circle .../>: no text inside
+
+    def handle_endtag(self, tag):
+        for i in range(len(self._stack) - 1, 0, -1):
+            if self._stack[i][0] == tag:
+                del self._stack[i:]
+                break
+
+    def handle_data(self, data):
+        tag, family, weight = self._stack[-1]
+        if data.strip() and tag not in ('style', 'script') and family == self.family:
+            self.weights.add(weight)
+
+def collect_used_weights(html, css, family='Satoshi'):
+    """
+    Return the sorted numeric weights at which family sets text in html,
+    following the .class rules of css, inline styles and SVG attributes.
+    """
+    collector = _WeightCollector(family.lower(), css_class_fonts(css))
+    collector.feed(html)
+    collector.close()
+    return sorted(collector.weights)
+
+def _font_instances(font_name, weights):
+    """Weights to instance font_name at ([None] = embed the font as-is)"""
+    if not weights or instancer is None or font_name not in VARIABLE_FONT_WEIGHTS:
+        return [None]
+    low, high = VARIABLE_FONT_WEIGHTS[font_name]
+    return sorted({min(max(w, low), high) for w in weights})
+
+def subset_font(font, text):
+    """Reduce a TTFont in place to the glyphs needed for text"""
+    options = ft_subset.Options()
+    options.layout_features = ['*']  # keep kerning and ligatures
+    options.name_IDs = ['*']
+    options.name_languages = ['*']
+    options.notdef_outline = True
+    options.glyph_names = False
+
+    subsetter = ft_subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+
+def subset_font_bytes(font_path, text, weight=None):
+    """
+    Return the font at font_path reduced to the glyphs needed for text.
+
+    With a weight, a variable font is first pinned to a static instance.
+    """
+    font = TTFont(font_path)
+    if weight is not None:
+        font = instancer.instantiateVariableFont(font, {'wght': weight}, updateFontNames=False)
+        font['OS/2'].usWeightClass = weight
+    if text is not None:
+        subset_font(font, text)
+
+    buf = io.BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+def woff2_font_bytes(data):
+    """Recompress sfnt font bytes as WOFF2"""
+    font = TTFont(io.BytesIO(data))
+    font.flavor = 'woff2'
+    buf = io.BytesIO()
+    font.save(buf)
+    return buf.getvalue()
+
+def _cached_font_face(font_name, font_path, index, text=None, font_format='truetype', weight=None):
+    """Return the finished @font-face block for one font, from disk cache if possible"""
+    digest = _font_file_hash(font_path, index)
+    variant = "full"
+    if text is not None:
+        variant = "subset-" + hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+    if weight is not None:
+        variant += f"-wght{weight}"
+    key = hashlib.sha256(f"{font_name}|{digest}|{font_format}|{variant}".encode('utf-8')).hexdigest()
+    block_path = os.path.join(FONT_CACHE_DIR, f"{key}.css")
+
+    if os.path.exists(block_path):
+        FONT_CACHE_STATS['hits'] += 1
+        with open(block_path) as f:
+            return f.read()
+
+    FONT_CACHE_STATS['misses'] += 1
+    if text is not None or weight is not None:
+        data = subset_font_bytes(font_path, text, weight)
+    else:
+        with open(font_path, 'rb') as f:
+            data = f.read()
+    if font_format == 'woff2':
+        data = woff2_font_bytes(data)
+    b64 = base64.b64encode(data).decode('utf-8')
+    block = _font_face_block(font_name, b64, FONT_FORMATS[font_format], font_format,
+                             weight if weight is not None else 'normal')
+    os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+    tmp_path = block_path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(block)
+    os.replace(tmp_path, block_path)
+    return block
+
+def get_font_css(text=None, font_format='truetype', weights=None, families=None):
+    return "".join(iter_font_css(text, font_format, weights, families))
+
+def iter_font_css(text=None, font_format='truetype', weights=None, families=None):
+    """
+    Yield @font-face CSS with embedded fonts (cached on disk by font hash),
+    one rule at a time.
+
+    When text is given and fontTools is installed, every font is subset to
+    just the characters in text (see collect_used_text).  font_format is a
+    FONT_FORMATS key; woff2 falls back to truetype without fontTools/brotli.
+    With weights (see collect_used_weights), each VARIABLE_FONT_WEIGHTS font
+    becomes one static @font-face per weight, or stays variable when that is
+    fewer bytes (see FONT_INSTANCE_CHOICES).  families (lower-case names,
+    see css_prune) leaves out every font the deck never asks for.
+    """
+    if font_format not in FONT_FORMATS:
+        raise ValueError(f"Unknown font format: {font_format!r}")
+    if font_format == 'woff2' and not woff2_available():
+        font_format = 'truetype'
+
+    start = time.perf_counter()
+    if ft_subset is None:
+        text = None
+    index = _load_font_cache_index()
+    index_before = json.dumps(index, sort_keys=True)
+    del FONT_SIZE_REPORT[:]
+    FONT_INSTANCE_CHOICES.clear()
+
+    for font_name, font_file in FONTS:
+        font_path = os.path.join(BASE_PATH, font_file)
+        if not os.path.exists(font_path):
+            continue
+        if families is not None and font_name.lower() not in families:
+            continue
+        blocks = [(weight, _cached_font_face(font_name, font_path, index, text, font_format, weight))
+                  for weight in _font_instances(font_name, weights)]
+        if blocks[0][0] is not None:
+            whole = _cached_font_face(font_name, font_path, index, text, font_format)
+            static_size = sum(_embedded_size(block) for _, block in blocks)
+            variable_size = _embedded_size(whole)
+            if variable_size < static_size:
+                blocks = [(None, whole)]
+            FONT_INSTANCE_CHOICES[font_name] = ('variable' if variable_size < static_size else 'static',
+                                                static_size, variable_size)
+        for weight, block in blocks:
+            label = font_name if weight is None else f"{font_name} {weight}"
+            FONT_SIZE_REPORT.append((label, index[font_path]['size'], _embedded_size(block)))
+            FONT_CACHE_STATS['seconds'] += time.perf_counter() - start
+            yield block
+            start = time.perf_counter()
+
+    if json.dumps(index, sort_keys=True) != index_before:
+        _save_font_cache_index(index)
+
+    FONT_CACHE_STATS['seconds'] += time.perf_counter() - start
+
+def _write_if_changed(path, data):
+    """Atomically write bytes to path unless it already holds exactly data"""
+    if os.path.exists(path) and os.path.getsize(path) == len(data):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+def write_font_bundle():
+    """
+    Write the shared fonts/ directory and fonts.css used by linked decks.
+
+    Font files are named by content hash so browsers can cache them across
+    every deck; woff2 is listed first when available, truetype as fallback.
+    Returns the path of fonts.css.
+    """
+    start = time.perf_counter()
+    index = _load_font_cache_index()
+    index_before = json.dumps(index, sort_keys=True)
+    formats = ['woff2', 'truetype'] if woff2_available() else ['truetype']
+    os.makedirs(FONT_BUNDLE_DIR, exist_ok=True)
+
+    css = ""
+    for font_name, font_file in FONTS:
+        font_path = os.path.join(BASE_PATH, font_file)
+        if not os.path.exists(font_path):
+            continue
+        digest = _font_file_hash(font_path, index)
+        slug = font_name.lower().replace(' ', '-')
+
+        srcs = []
+        for font_format in formats:
+            file_name = f"{slug}-{digest[:12]}.{FONT_EXTENSIONS[font_format]}"
+            out_path = os.path.join(FONT_BUNDLE_DIR, file_name)
+            if os.path.exists(out_path):
+                FONT_CACHE_STATS['hits'] += 1
+            else:
+                FONT_CACHE_STATS['misses'] += 1
+                with open(font_path, 'rb') as f:
+                    data = f.read()
+                if font_format == 'woff2':
+                    data = woff2_font_bytes(data)
+                _write_if_changed(out_path, data)
+            srcs.append(f"url('fonts/{file_name}') format('{font_format}')")
+
+        css += _font_face_rule(font_name, ", ".join(srcs))
+
+    _write_if_changed(FONT_BUNDLE_CSS, css.encode('utf-8'))
+    if json.dumps(index, sort_keys=True) != index_before:
+        _save_font_cache_index(index)
+
+    FONT_CACHE_STATS['seconds'] += time.perf_counter() - start
+    return FONT_BUNDLE_CSS
+
+_FONT_FACE_RE = re.compile(r"@font-face\s*\{[^}]*\}\s*")
+_FONT_FAMILY_RE = re.compile(r"font-family:\s*['\"]?([^'\";]+)")
+
+def link_deck_fonts(html, href="fonts.css"):
+    """
+    Swap a deck's inline @font-face blocks for a link to the shared bundle.
+
+    Only faces whose family is one of FONTS are removed, so any other
+    embedded font in a hand-exported deck keeps working.
+    """
+    bundled = {font_name for font_name, _ in FONTS}
+    removed = []
+
+    def drop_bundled(match):
+        family = _FONT_FAMILY_RE.search(match.group(0))
+        if family and family.group(1).strip() in bundled:
+            removed.append(family.group(1))
+            return ""
+        return match.group(0)
+
+    html = _FONT_FACE_RE.sub(drop_bundled, html)
+    link = f'<link rel="stylesheet" href="{href}">'
+    if removed and link not in html:
+        html = html.replace("<head>", f"<head>\n    {link}", 1)
+    return html
+
+# =============================================================================
+# SVG PATH SERIALIZATION
+# =============================================================================
+
+# Decimal places of generated path data.  Slide SVGs draw in CSS px
+# (1920x1080 viewBox), so 1 = 0.1px; path_precision_for() derives it from
+# an output resolution.  None writes the legacy absolute "C x y, x y, x y"
+# form, byte-identical to older builds.
+DEFAULT_PATH_PRECISION = 1
+PATH_PRECISION = DEFAULT_PATH_PRECISION
+
+# Filled in by build_all_slides(): bytes of path data, absolute vs written
+PATH_STATS = {'paths': 0, 'absolute': 0, 'written': 0}
+
+# written path -> length of the same path in absolute form, for the report.
+# Per build: reset_build_state() empties it together with the blob and
+# component caches, whose hits never reach write_path()
+_path_absolute_sizes = {}
+
+def path_precision_for(dpi, units_per_inch=96):
+    """Decimals that keep path rounding under half a device pixel at dpi"""
+    return max(0, math.ceil(math.log10(dpi / units_per_inch)))
+
+def _fixed(q, decimals):
+    """Integer q in units of 10**-decimals -> shortest decimal string ("-.5", "12")"""
+    if decimals == 0 or q == 0:
+        return str(q)
+    sign = '-' if q < 0 else ''
+    whole, frac = divmod(abs(q), 10 ** decimals)
+    frac = str(frac).rjust(decimals, '0').rstrip('0')
+    if not frac:
+        return f"{sign}{whole}"
+    return f"{sign}{whole or ''}.{frac}"
+
+def _join_numbers(numbers, prev=''):
+    """Concatenate numbers, keeping only the separators the path grammar needs"""
+    out = []
+    for n in numbers:
+        # '-' always starts a number; '.' does too once prev already has one
+        if prev and not (n[0] == '-' or (n[0] == '.' and '.' in prev)):
+            out.append(' ')
+        out.append(n)
+        prev = n
+    return "".join(out), prev
+
+def write_path(commands, precision):
+    """
+    Compact path data for absolute commands [('M', (x, y)), ('C', (...)), ('Z', ())].
+
+    Supports M, L, C, Q and Z.  Every command is written absolute or
+    relative, whichever is shorter; coordinates are rounded once to the
+    precision grid, so relative steps never accumulate rounding error.
+    Separators, trailing zeros, leading zeros and repeated command
+    letters are dropped.
+    """
+    scale = 10 ** precision
+
+    out = []
+    last_letter = None
+    last_number = ''
+    cur = start = (0, 0)
+    absolute_len = 0
+    for letter, coords in commands:
+        absolute_len += len(letter) + 1 + sum(len(f"{v:.{precision}f}") + 1 for v in coords)
+        if letter == 'Z':
+            out.append('z')
+            last_letter, last_number = 'z', ''
+            cur = start
+            continue
+
+        q = [round(v * scale) for v in coords]
+        candidates = [(letter, q)]
+        if out:
+            rel = [v - cur[i % 2] for i, v in enumerate(q)]
+            if letter == 'L' and rel[1] == 0:
+                candidates.append(('h', rel[:1]))
+            elif letter == 'L' and rel[0] == 0:
+                candidates.append(('v', rel[1:]))
+            else:
+                candidates.append((letter.lower(), rel))
+
+        best = None
+        for cand_letter, values in candidates:
+            numbers = [_fixed(v, precision) for v in values]
+            repeat = cand_letter == last_letter and cand_letter not in 'Mm'
+            text, end = _join_numbers(numbers, last_number if repeat else '')
+            if not repeat:
+                text = cand_letter + text
+            if best is None or len(text) <= len(best[0]):
+                best = (text, cand_letter, end)
+        text, last_letter, last_number = best
+        out.append(text)
+
+        cur = (q[-2], q[-1])
+        if letter == 'M':
+            start = cur
+
+    path = "".join(out)
+    _path_absolute_sizes[path] = absolute_len - 1
+    return path
+
+_PATH_DATA_RE = re.compile(r'\sd="([^"]*)"')
+
+def path_report(html):
+    """Path data bytes of a built deck: absolute form vs what was written"""
+    stats = {'paths': 0, 'absolute': 0, 'written': 0}
+    for match in _PATH_DATA_RE.finditer(html):
+        d = match.group(1)
+        stats['paths'] += 1
+        stats['absolute'] += _path_absolute_sizes.get(d, len(d))
+        stats['written'] += len(d)
+    return stats
 
 # =============================================================================
 # SVG ORGANIC SHAPES
 # =============================================================================
 
+# Different point counts and variation amounts for each svg_blob style
+BLOB_STYLES = {
+    'organic': {'points': 6, 'var1': 0.22, 'var2': 0.15, 'smooth': 0.25},
+    'amoeba': {'points': 8, 'var1': 0.35, 'var2': 0.20, 'smooth': 0.30},
+    'cloud': {'points': 10, 'var1': 0.15, 'var2': 0.25, 'smooth': 0.20},
+    'wave': {'points': 5, 'var1': 0.30, 'var2': 0.10, 'smooth': 0.35},
+}
+
+# One blob for the geometry kernel.  Vertex i sits at angle a = 2*pi*i/points
+# with radius scale 0.85 + variation, where
+#   variation = amps[0]*sin(3a + seed*phases[0]) + amps[1]*cos(2a + seed*phases[1])
+#             + amps[2]*sin(5a + seed*phases[2]) + rng.uniform(-noise, noise)
+BlobSpec = namedtuple('BlobSpec', 'cx cy rx ry seed points amps phases noise smooth')
+
+def _blob_spec(cx, cy, rx, ry, seed, style):
+    config = BLOB_STYLES.get(style, BLOB_STYLES['organic'])
+    return BlobSpec(cx, cy, rx, ry, seed, config['points'],
+                    (config['var1'], config['var2'], 0.08), (0.7, 1.3, 2.1),
+                    0.05, config['smooth'])
+
+def _gradient_blob_spec(cx, cy, rx, ry, seed):
+    # No third harmonic and no noise: adding 0.0 keeps the sums bit-identical
+    return BlobSpec(cx, cy, rx, ry, seed, 7, (0.25, 0.15, 0.0), (1.0, 0.8, 0.0), 0.0, 0.25)
+
+def _blob_noise(spec):
+    """Per-vertex noise, drawn from random.Random(seed) exactly as svg_blob always has"""
+    if not spec.noise:
+        return [0.0] * spec.points
+    rng = random.Random(spec.seed)
+    return [rng.uniform(-spec.noise, spec.noise) for _ in range(spec.points)]
+
+@lru_cache(maxsize=None)
+def _path_template(points):
+    """'M x y C ..., ..., ... Z' format string for a closed blob of points vertices"""
+    curve = "C {:.1f} {:.1f}, {:.1f} {:.1f}, {:.1f} {:.1f}"
+    return " ".join(["M {:.1f} {:.1f}"] + [curve] * points + ["Z"])
+
+def _numpy_trig_exact():
+    """NumPy's sin/cos must match libm bit for bit for output to stay byte-identical"""
+    probe = [0.1 * k + 0.37 * j for k in range(64) for j in range(16)]
+    arr = np.array(probe)
+    return (np.sin(arr).tolist() == [math.sin(v) for v in probe] and
+            np.cos(arr).tolist() == [math.cos(v) for v in probe])
+
+if np is not None and _numpy_trig_exact():
+    _np_sin, _np_cos = np.sin, np.cos
+elif np is not None:
+    _np_sin = np.vectorize(math.sin, otypes=[float])
+    _np_cos = np.vectorize(math.cos, otypes=[float])
+
+def _blob_values_numpy(specs):
+    """(n, 2 + 6*points) path numbers for blobs that share a point count"""
+    points = specs[0].points
+    angle = (2 * math.pi * np.arange(points)) / points
+
+    cx, cy, rx, ry, seed = (np.array([getattr(b, f) for b in specs], dtype=float)[:, None]
+                            for f in ('cx', 'cy', 'rx', 'ry', 'seed'))
+    amps = np.array([b.amps for b in specs])
+    phases = np.array([b.phases for b in specs])
+    smooth = np.array([b.smooth for b in specs])[:, None]
+    noise = np.array([_blob_noise(b) for b in specs])
+
+    variation = (
+        amps[:, 0:1] * _np_sin(3 * angle + seed * phases[:, 0:1]) +
+        amps[:, 1:2] * _np_cos(2 * angle + seed * phases[:, 1:2]) +
+        amps[:, 2:3] * _np_sin(5 * angle + seed * phases[:, 2:3]) +
+        noise
+    )
+    x = cx + rx * (0.85 + variation) * _np_cos(angle)
+    y = cy + ry * (0.85 + variation * 0.9) * _np_sin(angle)
+
+    # Catmull-Rom to Bezier control points for every segment at once
+    next_x, next_y = np.roll(x, -1, axis=1), np.roll(y, -1, axis=1)
+    prev_x, prev_y = np.roll(x, 1, axis=1), np.roll(y, 1, axis=1)
+    next2_x, next2_y = np.roll(x, -2, axis=1), np.roll(y, -2, axis=1)
+    segments = np.stack([
+        x + (next_x - prev_x) * smooth,
+        y + (next_y - prev_y) * smooth,
+        next_x - (next2_x - x) * smooth,
+        next_y - (next2_y - y) * smooth,
+        next_x,
+        next_y,
+    ], axis=2).reshape(len(specs), -1)
+    return np.concatenate([x[:, :1], y[:, :1], segments], axis=1).tolist()
+
+def _blob_values_python(spec):
+    points = spec.points
+    noise = _blob_noise(spec)
+    (a1, a2, a3), (p1, p2, p3) = spec.amps, spec.phases
+
+    vertices = []
+    for i in range(points):
+        angle = (2 * math.pi * i) / points
+        variation = (
+            a1 * math.sin(3 * angle + spec.seed * p1) +
+            a2 * math.cos(2 * angle + spec.seed * p2) +
+            a3 * math.sin(5 * angle + spec.seed * p3) +
+            noise[i]
+        )
+        r_x = spec.rx * (0.85 + variation)
+        r_y = spec.ry * (0.85 + variation * 0.9)
+        vertices.append((spec.cx + r_x * math.cos(angle), spec.cy + r_y * math.sin(angle)))
+
+    values = [vertices[0][0], vertices[0][1]]
+    for i in range(points):
+        curr = vertices[i]
+        next_v = vertices[(i + 1) % points]
+        prev = vertices[(i - 1) % points]
+        next_next = vertices[(i + 2) % points]
+        values += [
+            curr[0] + (next_v[0] - prev[0]) * spec.smooth,
+            curr[1] + (next_v[1] - prev[1]) * spec.smooth,
+            next_v[0] - (next_next[0] - curr[0]) * spec.smooth,
+            next_v[1] - (next_next[1] - curr[1]) * spec.smooth,
+            next_v[0],
+            next_v[1],
+        ]
+    return values
+
+def _blob_commands(values, points):
+    commands = [('M', values[:2])]
+    for i in range(points):
+        commands.append(('C', values[2 + 6 * i:8 + 6 * i]))
+    commands.append(('Z', ()))
+    return commands
+
+def blob_path_data(specs, precision):
+    """
+    Path data ('d' attribute) for a batch of BlobSpecs, in order.
+
+    Blobs are grouped by point count and each group is computed in a single
+    NumPy pass (plain Python without NumPy); the output is byte-identical
+    either way.  precision as PATH_PRECISION (None = legacy absolute form).
+    """
+    paths = [None] * len(specs)
+    groups = {}
+    for i, spec in enumerate(specs):
+        groups.setdefault(spec.points, []).append(i)
+
+    for points, indices in groups.items():
+        template = _path_template(points)
+        if np is not None:
+            rows = _blob_values_numpy([specs[i] for i in indices])
+        else:
+            rows = [_blob_values_python(specs[i]) for i in indices]
+        for i, values in zip(indices, rows):
+            if precision is None:
+                paths[i] = template.format(*values)
+            else:
+                paths[i] = write_path(_blob_commands(values, points), precision)
+    return paths
+
+# Blob paths are pure functions of their inputs; repeated backgrounds (the
+# stat slides reuse identical corner blobs) are served from a bounded LRU.
+# typed=True keeps rotate(15) and rotate(15.0) apart - they format differently.
+BLOB_CACHE_SIZE = 512
+
+def _rotate_attr(rotation, cx, cy):
+    return f'transform="rotate({rotation} {cx} {cy})"' if rotation != 0 else ''
+
 def svg_blob(cx, cy, rx, ry, color, opacity=0.3, rotation=0, seed=0, style='organic'):
     """
     Generate smooth organic blob using SVG path with cubic bezier curves.
@@ -96,130 +840,395 @@ def svg_blob(cx, cy, rx, ry, color, opacity=0.3, rotation=0, seed=0, style='orga
     - 'cloud': Puffy, cloud-like shape
     - 'wave': Flowing wave-like form
     """
-    import math
-    import random
+    precision = PATH_PRECISION
+    inline = _svg_blob_cached(cx, cy, rx, ry, color, opacity, rotation, seed, style, precision)
+    # As a symbol the blob is drawn around the origin and placed by the <use>
+    transform = f"translate({cx} {cy})" + (f" rotate({rotation})" if rotation != 0 else "")
+    return svg_symbol(
+        ('blob', rx, ry, seed, style, precision),
+        lambda: f'<path d="{blob_path_data([_blob_spec(0, 0, rx, ry, seed, style)], precision)[0]}" />',
+        f'transform="{transform}" fill="{color}" fill-opacity="{opacity}"',
+        inline,
+    )
 
-    # Set random seed for reproducibility
-    rng = random.Random(seed)
+@lru_cache(maxsize=BLOB_CACHE_SIZE, typed=True)
+def _svg_blob_cached(cx, cy, rx, ry, color, opacity, rotation, seed, style, precision):
+    path = blob_path_data([_blob_spec(cx, cy, rx, ry, seed, style)], precision)[0]
+    return f'<path d="{path}" fill="{color}" fill-opacity="{opacity}" {_rotate_attr(rotation, cx, cy)} />'
+
+def svg_blobs(blobs):
+    """
+    Batch svg_blob: blobs is a sequence of svg_blob keyword dicts.
+
+    All paths go through blob_path_data in one pass, which makes generating
+    hundreds of background variants cheap.
+    """
+    defaults = {'opacity': 0.3, 'rotation': 0, 'seed': 0, 'style': 'organic'}
+    blobs = [{**defaults, **b} for b in blobs]
+    specs = [_blob_spec(b['cx'], b['cy'], b['rx'], b['ry'], b['seed'], b['style']) for b in blobs]
+    return [
+        f'<path d="{path}" fill="{b["color"]}" fill-opacity="{b["opacity"]}" '
+        f'{_rotate_attr(b["rotation"], b["cx"], b["cy"])} />'
+        for b, path in zip(blobs, blob_path_data(specs, PATH_PRECISION))
+    ]
+
+
+def svg_blob_gradient(cx, cy, rx, ry, color1, color2, opacity=0.3, rotation=0, seed=0, gradient_id=None):
+    """
+    Create a blob with a gradient fill.
+
+    The gradient id is derived from the gradient itself (see
+    linear_gradient), so blobs with equal colors share one definition and
+    different colors never collide; pass gradient_id only to force a name.
+    """
+    path, transform = _svg_blob_gradient_cached(cx, cy, rx, ry, rotation, seed, PATH_PRECISION)
+    return svg_gradient_fill(f'<path d="{path}" fill="url(#{{}})" {transform} />',
+                             color1, color2, opacity, gradient_id)
+
+@lru_cache(maxsize=BLOB_CACHE_SIZE, typed=True)
+def _svg_blob_gradient_cached(cx, cy, rx, ry, rotation, seed, precision):
+    path = blob_path_data([_gradient_blob_spec(cx, cy, rx, ry, seed)], precision)[0]
+    return path, _rotate_attr(rotation, cx, cy)
 
-    # Different point counts and variation amounts for each style
-    style_configs = {
-        'organic': {'points': 6, 'var1': 0.22, 'var2': 0.15, 'smooth': 0.25},
-        'amoeba': {'points': 8, 'var1': 0.35, 'var2': 0.20, 'smooth': 0.30},
-        'cloud': {'points': 10, 'var1': 0.15, 'var2': 0.25, 'smooth': 0.20},
-        'wave': {'points': 5, 'var1': 0.30, 'var2': 0.10, 'smooth': 0.35},
+
+def blob_cache_info():
+    """Hit/miss counters of the blob LRU caches"""
+    return {
+        'svg_blob': _svg_blob_cached.cache_info(),
+        'svg_blob_gradient': _svg_blob_gradient_cached.cache_info(),
     }
 
-    config = style_configs.get(style, style_configs['organic'])
-    points = config['points']
-    var1 = config['var1']
-    var2 = config['var2']
-    smooth = config['smooth']
+def clear_blob_cache():
+    _svg_blob_cached.cache_clear()
+    _svg_blob_gradient_cached.cache_clear()
 
-    # Calculate vertices with organic variation
-    vertices = []
-    for i in range(points):
-        angle = (2 * math.pi * i) / points
 
-        # Multi-frequency organic variation
-        variation = (
-            var1 * math.sin(3 * angle + seed * 0.7) +
-            var2 * math.cos(2 * angle + seed * 1.3) +
-            0.08 * math.sin(5 * angle + seed * 2.1) +
-            rng.uniform(-0.05, 0.05)  # Small random noise
-        )
+def svg_circle(cx, cy, r, color, opacity=1.0):
+    """Simple circle for UI elements like buttons"""
+    return f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}" fill-opacity="{opacity}" />'
 
-        r_x = rx * (0.85 + variation)
-        r_y = ry * (0.85 + variation * 0.9)
+# =============================================================================
+# SVG SYMBOL REUSE
+# =============================================================================
 
-        x = cx + r_x * math.cos(angle)
-        y = cy + r_y * math.sin(angle)
-        vertices.append((x, y))
+# Where shared decorations are defined:
+# - 'document': one hidden <svg><defs> for the whole deck (browsers resolve
+#   <use> across every inline <svg> of the page)
+# - 'svg': a <defs> per <svg> element - WeasyPrint only resolves <use>
+#   inside the <svg> it sits in, so this is the scope for PDF output
+SYMBOL_SCOPES = ('document', 'svg')
 
-    # Build smooth bezier path with catmull-rom style control points
-    path_parts = [f"M {vertices[0][0]:.1f} {vertices[0][1]:.1f}"]
+# Set by build_all_slides() while slides are generated
+_defs_registry = None
 
-    for i in range(points):
-        curr = vertices[i]
-        next_v = vertices[(i + 1) % points]
-        prev = vertices[(i - 1) % points]
-        next_next = vertices[(i + 2) % points]
+# Filled in by build_all_slides() for the build report
+SYMBOL_STATS = {'symbols': 0, 'uses': 0, 'gradients': 0, 'saved': 0}
 
-        # Catmull-Rom to Bezier control point conversion
-        cp1_x = curr[0] + (next_v[0] - prev[0]) * smooth
-        cp1_y = curr[1] + (next_v[1] - prev[1]) * smooth
-        cp2_x = next_v[0] - (next_next[0] - curr[0]) * smooth
-        cp2_y = next_v[1] - (next_next[1] - curr[1]) * smooth
+_SYMBOL_MARK_RE = re.compile(r'<!--svg-use:(\d+)-->')
+_SVG_TAG_RE = re.compile(r'<svg\b[^>]*>|</svg>')
+_GRADIENT_REF_RE = re.compile(r'url\(#([^)]+)\)')
+_INLINE_GRADIENT_RE = re.compile(r'<defs><linearGradient id="([^"]+)".*?</linearGradient></defs>', re.S)
 
-        path_parts.append(f"C {cp1_x:.1f} {cp1_y:.1f}, {cp2_x:.1f} {cp2_y:.1f}, {next_v[0]:.1f} {next_v[1]:.1f}")
+class SvgDefsRegistry:
+    """
+    Collects the shared <defs> of a deck while it is being built.
 
-    path_parts.append("Z")
+    Decorations register under a key and leave a placeholder in the slide
+    markup; substitute() / resolve_svg() turn every fragment used more than
+    once in its scope into a <symbol> + <use> pair and put the original
+    markup back for the rest, so one-off decorations come out exactly as
+    before.
 
-    transform = f'transform="rotate({rotation} {cx} {cy})"' if rotation != 0 else ''
+    Gradients are registered by id and written once per scope that paints
+    with them, next to the symbols.
+    """
 
-    return f'<path d="{" ".join(path_parts)}" fill="{color}" fill-opacity="{opacity}" {transform} />'
+    def __init__(self):
+        self.occurrences = []   # (key, use attributes, inline markup)
+        self.bodies = {}        # key -> zero-argument callable building the symbol body
+        self.ids = {}           # key -> symbol id
+        self.gradients = {}     # gradient id -> <linearGradient> markup
+        self.stats = {'symbols': 0, 'uses': 0, 'gradients': 0, 'saved': 0}
+
+    def add_gradient(self, gradient_id, definition):
+        known = self.gradients.setdefault(gradient_id, definition)
+        if known != definition:
+            raise ValueError(f"Gradient id {gradient_id!r} is already used by a different gradient")
+
+    def ref(self, key, body, use_attrs, inline):
+        if key not in self.bodies:
+            self.bodies[key] = body
+            self.ids[key] = f"{key[0]}-{len(self.ids)}"
+        self.occurrences.append((key, use_attrs, inline))
+        return f'<!--svg-use:{len(self.occurrences) - 1}-->'
+
+    def _symbol(self, key):
+        return (f'<symbol id="{self.ids[key]}" overflow="visible">'
+                f'{self.bodies[key]()}</symbol>')
+
+    def substitute(self, markup, shared):
+        """Placeholders -> <use> for keys in shared, original markup for the rest"""
+        def replace(match):
+            key, use_attrs, inline = self.occurrences[int(match.group(1))]
+            if key not in shared:
+                return inline
+            use = f'<use xlink:href="#{self.ids[key]}" {use_attrs}/>'
+            self.stats['uses'] += 1
+            self.stats['saved'] += len(inline) - len(use)
+            return use
+        return _SYMBOL_MARK_RE.sub(replace, markup)
+
+    def keys_in(self, markup):
+        """Key of every placeholder in markup, repeats included"""
+        return [self.occurrences[int(m.group(1))][0] for m in _SYMBOL_MARK_RE.finditer(markup)]
+
+    def _shared_keys(self, markup):
+        counts = {}
+        for key in self.keys_in(markup):
+            counts[key] = counts.get(key, 0) + 1
+        return [key for key, n in counts.items() if n > 1]
+
+    def new_pass(self):
+        """Forget placeholders (symbol ids, bodies and gradients stay) to build the slides again"""
+        self.occurrences = []
+        self.stats = dict.fromkeys(self.stats, 0)
+
+    def _defs(self, keys, markup=None):
+        """<defs> for the symbols in keys plus every gradient painted in markup (None: all)"""
+        symbols = "".join(self._symbol(key) for key in keys)
+        if markup is None:
+            gradients = list(self.gradients.values())
+        else:
+            gradients = []
+            for match in _GRADIENT_REF_RE.finditer(symbols + markup):
+                definition = self.gradients.get(match.group(1))
+                if definition is not None and definition not in gradients:
+                    gradients.append(definition)
+        if not keys and not gradients:
+            return ""
+
+        gradients = "".join(gradients)
+        defs = "<defs>" + symbols + gradients + "</defs>"
+        self.stats['symbols'] += len(keys)
+        self.stats['gradients'] += gradients.count('<linearGradient')
+        # Gradient definitions are needed either way; only symbols cost extra
+        self.stats['saved'] -= len(defs) - len(gradients)
+        return defs
+
+    def sprite(self, shared):
+        """'document' scope: hidden <svg> defining the shared symbols and every gradient"""
+        defs = self._defs(shared)
+        if not defs:
+            return ""
+        sprite = f'<svg width="0" height="0" style="position: absolute;" aria-hidden="true">{defs}</svg>'
+        self.stats['saved'] -= len(sprite) - len(defs)
+        return sprite
+
+    def resolve_svg(self, body):
+        """'svg' scope: every top-level <svg> element in body gets its own <defs>"""
+        out = []
+        pos = 0
+        depth = 0
+        start = None
+        for match in _SVG_TAG_RE.finditer(body):
+            if match.group(0) != '</svg>':
+                if depth == 0:
+                    start = match
+                depth += 1
+                continue
+            depth -= 1
+            if depth:
+                continue
+            element = body[start.end():match.start()]
+            shared = self._shared_keys(element)
+            element = self.substitute(element, set(shared))
+            out.append(body[pos:start.end()])
+            out.append(self._defs(shared, element) + element)
+            pos = match.start()
+        out.append(body[pos:])
+        return self.substitute("".join(out), set())
+
+def svg_symbol(key, body, use_attrs, inline):
+    """
+    Reusable decoration: inline markup, or a <use> of a shared <symbol>.
 
+    key identifies identical symbol bodies (key[0] names the kind), body is
+    a callable returning the symbol content drawn at the origin, and
+    use_attrs places and paints one instance (transform, inherited fill or
+    stroke).  Outside build_all_slides() this simply returns inline.
+    """
+    if _defs_registry is None:
+        return inline
+    return _defs_registry.ref(key, body, use_attrs, inline)
 
-def svg_blob_gradient(cx, cy, rx, ry, color1, color2, opacity=0.3, rotation=0, seed=0, gradient_id=None):
-    """Create a blob with a gradient fill"""
-    import math
-    import random
+def linear_gradient(color1, color2, opacity, gradient_id=None):
+    """
+    (id, <linearGradient> markup) of the diagonal two-stop blob gradient.
 
+    The default id is a hash of the definition: stable across builds, equal
+    for identical gradients and distinct for different ones.
+    """
+    stops = (f'<stop offset="0%" style="stop-color:{color1};stop-opacity:{opacity}" />'
+             f'<stop offset="100%" style="stop-color:{color2};stop-opacity:{opacity * 0.6}" />')
     if gradient_id is None:
-        gradient_id = f"grad_{seed}"
+        gradient_id = "grad-" + hashlib.sha1(stops.encode('utf-8')).hexdigest()[:10]
+    definition = (f'<linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="100%" y2="100%">'
+                  f'{stops}</linearGradient>')
+    return gradient_id, definition
 
-    rng = random.Random(seed)
-    points = 7
+def drop_repeated_gradients(markup, emitted):
+    """
+    Without a registry every gradient blob carries its own inline <defs>:
+    keep the first definition of each id (collected in emitted, one set
+    per document) and drop the repeats, so no id is defined twice.
+    """
+    def replace(match):
+        if match.group(1) in emitted:
+            return ""
+        emitted.add(match.group(1))
+        return match.group(0)
+    return _INLINE_GRADIENT_RE.sub(replace, markup)
+
+def svg_gradient_fill(shape, color1, color2, opacity, gradient_id=None):
+    """
+    shape (markup with a '{}' where the gradient id goes) painted with a gradient.
 
-    vertices = []
-    for i in range(points):
-        angle = (2 * math.pi * i) / points
-        variation = 0.25 * math.sin(3 * angle + seed) + 0.15 * math.cos(2 * angle + seed * 0.8)
-        r_x = rx * (0.85 + variation)
-        r_y = ry * (0.85 + variation * 0.9)
-        x = cx + r_x * math.cos(angle)
-        y = cy + r_y * math.sin(angle)
-        vertices.append((x, y))
-
-    path_parts = [f"M {vertices[0][0]:.1f} {vertices[0][1]:.1f}"]
-    for i in range(points):
-        curr = vertices[i]
-        next_v = vertices[(i + 1) % points]
-        prev = vertices[(i - 1) % points]
-        next_next = vertices[(i + 2) % points]
+    During build_all_slides() the definition goes to the shared defs;
+    otherwise it is emitted inline so the fragment stays self-contained.
+    """
+    gradient_id, definition = linear_gradient(color1, color2, opacity, gradient_id)
+    shape = shape.format(gradient_id)
+    if _defs_registry is None:
+        return f'<defs>{definition}</defs>{shape}'
+    _defs_registry.add_gradient(gradient_id, definition)
+    return shape
 
-        cp1_x = curr[0] + (next_v[0] - prev[0]) * 0.25
-        cp1_y = curr[1] + (next_v[1] - prev[1]) * 0.25
-        cp2_x = next_v[0] - (next_next[0] - curr[0]) * 0.25
-        cp2_y = next_v[1] - (next_next[1] - curr[1]) * 0.25
+# =============================================================================
+# STATIC SVG COMPONENTS
+# =============================================================================
 
-        path_parts.append(f"C {cp1_x:.1f} {cp1_y:.1f}, {cp2_x:.1f} {cp2_y:.1f}, {next_v[0]:.1f} {next_v[1]:.1f}")
+# name -> {'calls', 'compiles', 'seconds'}; seconds is time spent compiling
+COMPONENT_STATS = {}
+_components = []
 
-    path_parts.append("Z")
+def svg_component(fn):
+    """
+    Compile a static or rarely varying SVG fragment once per build.
 
-    transform = f'transform="rotate({rotation} {cx} {cy})"' if rotation != 0 else ''
+    The decorated function must return markup that depends only on its
+    arguments (and module constants); each distinct argument tuple is built
+    once and served from memory afterwards.  Calls and compile time are
+    recorded in COMPONENT_STATS for the build report.
+    """
+    compiled = {}
+    stats = COMPONENT_STATS.setdefault(fn.__name__, {'calls': 0, 'compiles': 0, 'seconds': 0.0})
+
+    def component(*args):
+        stats['calls'] += 1
+        markup = compiled.get(args)
+        if markup is None:
+            start = time.perf_counter()
+            markup = compiled[args] = fn(*args)
+            stats['compiles'] += 1
+            stats['seconds'] += time.perf_counter() - start
+        return markup
+
+    component.__name__ = fn.__name__
+    component.__doc__ = fn.__doc__
+    component.__wrapped__ = fn
+    component.cache_clear = compiled.clear
+    _components.append(component)
+    return component
+
+def clear_component_cache():
+    for component in _components:
+        component.cache_clear()
+
+def component_report():
+    """(calls, compiles, compile seconds, seconds the calls would take uncompiled)"""
+    calls = compiles = 0
+    seconds = uncached = 0.0
+    for stats in COMPONENT_STATS.values():
+        calls += stats['calls']
+        compiles += stats['compiles']
+        seconds += stats['seconds']
+        if stats['compiles']:
+            uncached += stats['seconds'] / stats['compiles'] * stats['calls']
+    return calls, compiles, seconds, uncached
 
-    gradient = f'''<defs>
-        <linearGradient id="{gradient_id}" x1="0%" y1="0%" x2="100%" y2="100%">
-            <stop offset="0%" style="stop-color:{color1};stop-opacity:{opacity}" />
-            <stop offset="100%" style="stop-color:{color2};stop-opacity:{opacity * 0.6}" />
-        </linearGradient>
-    </defs>'''
+# =============================================================================
+# BACKGROUND RASTER CACHE
+# =============================================================================
 
-    return f'{gradient}<path d="{" ".join(path_parts)}" fill="url(#{gradient_id})" {transform} />'
+# Optional: each slide's .bg-shapes layer (stacks of translucent blobs) is
+# rendered once to a PNG and referenced as an <img>, so PDF viewers and
+# WeasyPrint composite one bitmap instead of every blob.  Text stays vector.
+# Files are named by a hash of the layer + DPI, so unchanged layers are
+# never rendered twice.
+BG_RASTER_DPI = 150
+BG_RASTER_DIR = os.path.join(BASE_PATH, "backgrounds")
+BG_RASTER_STATS = {'layers': 0, 'rendered': 0, 'bytes': 0, 'seconds': 0.0}
+
+_BG_SHAPES_RE = re.compile(r'<svg class="bg-shapes"([^>]*)>(.*?)</svg>', re.S)
+
+def raster_available():
+    return cairosvg is not None
+
+def _bg_layer_png(attrs, inner, dpi):
+    """File name of the PNG for one .bg-shapes layer (rendered on a cache miss)"""
+    width = round(SLIDE_WIDTH * dpi / 96)
+    height = round(SLIDE_HEIGHT * dpi / 96)
+    svg = (f'<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+           f' width="{width}" height="{height}"{attrs}>{inner}</svg>')
+    name = hashlib.sha256(svg.encode('utf-8')).hexdigest()[:32] + ".png"
+    path = os.path.join(BG_RASTER_DIR, name)
+
+    if not os.path.exists(path):
+        start = time.perf_counter()
+        png = cairosvg.svg2png(bytestring=svg.encode('utf-8'))
+        os.makedirs(BG_RASTER_DIR, exist_ok=True)
+        _write_if_changed(path, png)
+        BG_RASTER_STATS['rendered'] += 1
+        BG_RASTER_STATS['seconds'] += time.perf_counter() - start
+    BG_RASTER_STATS['layers'] += 1
+    BG_RASTER_STATS['bytes'] += os.path.getsize(path)
+    return name
+
+def rasterize_backgrounds(body, dpi=BG_RASTER_DPI):
+    """
+    Swap every <svg class="bg-shapes"> in body for a cached PNG at dpi.
 
+    The layers must be self-contained (no <use> of a deck-level symbol);
+    images are linked relative to BASE_PATH, like fonts.css.
+    """
+    if cairosvg is None:
+        raise RuntimeError("Rasterized backgrounds need cairosvg (pip install cairosvg)")
+    href = os.path.basename(BG_RASTER_DIR)
 
-def svg_circle(cx, cy, r, color, opacity=1.0):
-    """Simple circle for UI elements like buttons"""
-    return f'<circle cx="{cx}" cy="{cy}" r="{r}" fill="{color}" fill-opacity="{opacity}" />'
+    def replace(match):
+        name = _bg_layer_png(match.group(1), match.group(2), dpi)
+        return f'<img class="bg-shapes" src="{href}/{name}" alt="">'
+    return _BG_SHAPES_RE.sub(replace, body)
 
 # =============================================================================
 # BASE CSS
 # =============================================================================
 
-def get_base_css():
+# Drop layout rules and fonts the built slides never use (see css_prune);
+# False keeps the whole stylesheet (--keep-unused-css)
+CSS_PRUNE = True
+
+# Filled in by build_all_slides(): style rules before/kept, layout CSS
+# bytes before/after and the fonts left out
+CSS_STATS = {'rules': 0, 'kept': 0, 'before': 0, 'after': 0, 'fonts': []}
+
+def get_base_css(text=None, font_format='truetype', font_mode='inline', weights=None):
+    font_css = get_font_css(text, font_format, weights) if font_mode == 'inline' else ""
+    return font_css + get_layout_css()
+
+def get_layout_css():
+    """Every non-font rule of the deck stylesheet"""
     return f"""
-{get_font_css()}
 
 * {{
     margin: 0;
@@ -351,12 +1360,93 @@ def get_base_css():
 }}
 """
 
+# =============================================================================
+# HEADLINE FITTING
+# =============================================================================
+
+# Inner box of .content (padding 100px 120px)
+CONTENT_WIDTH = SLIDE_WIDTH - 2 * 120
+CONTENT_HEIGHT = SLIDE_HEIGHT - 2 * 100
+
+def fit_display(text, width, height, max_size, line_height=1.2, letter_spacing=0.0,
+                font_name='Ogg Bold', max_lines=None):
+    """
+    Largest px size <= max_size at which display text fits width x height.
+
+    Computed from cached font metrics, so it needs no render; falls back to
+    max_size when no metrics are available.
+    """
+    try:
+        fit = fit_text(text, font_name, width, height, max_size, line_height=line_height,
+                       letter_spacing=letter_spacing, max_lines=max_lines)
+    except MetricsUnavailable:
+        return max_size
+    return fit.size
+
+def text_px_width(text, font_name, size, weight=None, letter_spacing=0.0):
+    """
+    Width in px of one line of text, from cached font metrics (no render);
+    a rough 0.6em per character when no metrics are available.
+    """
+    try:
+        return text_width(text, font_name, size, weight, letter_spacing)
+    except MetricsUnavailable:
+        return len(text) * (size * 0.6 + letter_spacing)
+
+# SVG badges: their label plus this much on either side
+BADGE_PADDING_X = 19
+
+def badge_width(text, font_name, size, weight=None, padding=BADGE_PADDING_X):
+    """Width of an SVG badge sized to its label"""
+    return round(text_px_width(text, font_name, size, weight)) + 2 * padding
+
+def _fitted_font_style(text, width, height, class_size, line_height, letter_spacing=0.0):
+    """Inline font-size override when text would overflow at its class size"""
+    size = fit_display(text, width, height, class_size, line_height, letter_spacing, max_lines=1)
+    return f" font-size: {size:g}px;" if size < class_size else ""
+
+
+def _headline_text(inner):
+    """Plain text of headline markup: <br> breaks lines, tags and entities resolved"""
+    text = re.sub(r'\s+', ' ', inner)
+    text = re.sub(r'\s*<br\s*/?>\s*', '\n', text, flags=re.I)
+    return unescape(re.sub(r'<[^>]+>', '', text)).strip()
+
+
+def display_heading(tag, inner, size, classes="", style="", width=CONTENT_WIDTH,
+                    height=CONTENT_HEIGHT, line_height=None, letter_spacing=0.0, wrap=False):
+    """
+    A .display headline at font-size `size`, shrunk until inner fits
+    width x height.  line_height (None: the font's normal spacing) and
+    letter_spacing are measured and written out.  Unless wrap, the headline
+    keeps the lines its <br>s give it.
+    """
+    text = _headline_text(inner)
+    fit_size = fit_display(text, width, height, size, line_height, letter_spacing,
+                           max_lines=None if wrap else text.count('\n') + 1)
+    rules = [f"font-size: {fit_size:g}px;"]
+    if line_height is not None:
+        rules.append(f"line-height: {line_height:g};")
+    if letter_spacing:
+        rules.append(f"letter-spacing: {letter_spacing:g}px;")
+    if style:
+        rules.append(style)
+    return f'<{tag} class="display {classes}" style="{" ".join(rules)}">{inner}</{tag}>'
+
 # =============================================================================
 # SLIDE BUILDERS
 # =============================================================================
 
+# Slide builders in deck order: every @SLIDES.slide function, as defined
+SLIDES = SlideRegistry()
+
 def svg_shop_mockup_messy():
     """Create SVG for the messy/cluttered Etsy shop - FEELS chaotic and stressful"""
+    markup = _shop_mockup_messy()
+    return svg_symbol(('shop-messy',), lambda: markup, '', markup)
+
+@svg_component
+def _shop_mockup_messy():
     # Desaturated, slightly sad colors with warning tint
     sad_bg = '#D8D8D8'
     sad_header = '#C4C4C4'
@@ -398,7 +1488,7 @@ def svg_shop_mockup_messy():
             listings.append(f'<line x1="{cx-8}" y1="{cy-8}" x2="{cx+8}" y2="{cy+8}" stroke="#C45C5C" stroke-width="2.5" opacity="0.7" {transform}/>')
             listings.append(f'<line x1="{cx+8}" y1="{cy-8}" x2="{cx-8}" y2="{cy+8}" stroke="#C45C5C" stroke-width="2.5" opacity="0.7" {transform}/>')
 
-    return f'''
+    markup = f'''
     <g transform="translate(0, 0)">
         <!-- Sad shadow underneath -->
         <ellipse cx="115" cy="320" rx="100" ry="12" fill="#00000" opacity="0.08"/>
@@ -436,13 +1526,19 @@ def svg_shop_mockup_messy():
 
         <!-- $127 in painful coral/red - BIGGER text -->
         <text x="45" y="302" font-family="Satoshi, sans-serif" font-size="22" fill="#C45050" font-weight="700">$127</text>
-        <text x="105" y="302" font-family="Satoshi, sans-serif" font-size="16" fill="#C45050" font-weight="500">this month</text>
+        <text x="{45 + round(text_px_width('$127', 'Satoshi', 22, 700)) + 13}" y="302" font-family="Satoshi, sans-serif" font-size="16" fill="#C45050" font-weight="500">this month</text>
     </g>
     '''
+    return markup
 
 
 def svg_shop_mockup_focused():
     """Create SVG for the focused/successful Etsy shop - FEELS like winning"""
+    markup = _shop_mockup_focused()
+    return svg_symbol(('shop-focused',), lambda: markup, '', markup)
+
+@svg_component
+def _shop_mockup_focused():
     teal = COLORS['teal_deep']
     coral = COLORS['coral']
     mint = COLORS['mint']
@@ -466,7 +1562,7 @@ def svg_shop_mockup_focused():
         # Subtle shine/highlight
         listings.append(f'<rect x="{x+4}" y="{y+4}" width="{w-8}" height="3" rx="1" fill="white" opacity="0.25"/>')
 
-    return f'''
+    markup = f'''
     <g transform="translate(0, 0)">
         <!-- Success glow underneath -->
         <ellipse cx="115" cy="365" rx="120" ry="18" fill="{teal}" opacity="0.12"/>
@@ -512,7 +1608,7 @@ def svg_shop_mockup_focused():
 
         <!-- $3,847 - BOLD and prominent - BIGGER text with gap -->
         <text x="42" y="343" font-family="Satoshi, sans-serif" font-size="26" fill="{teal}" font-weight="800">$3,847</text>
-        <text x="140" y="343" font-family="Satoshi, sans-serif" font-size="17" fill="{teal}" font-weight="600">this month</text>
+        <text x="{42 + round(text_px_width('$3,847', 'Satoshi', 26, 800)) + 13}" y="343" font-family="Satoshi, sans-serif" font-size="17" fill="{teal}" font-weight="600">this month</text>
 
         <!-- Up arrow indicator - bigger -->
         <g transform="translate(186, 328)">
@@ -524,29 +1620,89 @@ def svg_shop_mockup_focused():
         <path d="M22 180 C22 178 24 176.5 25.5 178 C27 176.5 29 178 29 180 C29 182 25.5 185 25.5 185 C25.5 185 22 182 22 180Z" fill="{coral}" opacity="0.5"/>
     </g>
     '''
-
+    return markup
+
+
+@svg_component
+def _sparkle_paths(s, stroke, precision):
+    if precision is None:
+        cross = f"M{s/2} 0 L{s/2} {s} M0 {s/2} L{s} {s/2}"
+        diagonal = f"M{s*0.15} {s*0.15} L{s*0.85} {s*0.85} M{s*0.85} {s*0.15} L{s*0.15} {s*0.85}"
+    else:
+        cross = write_path([('M', (s/2, 0)), ('L', (s/2, s)), ('M', (0, s/2)), ('L', (s, s/2))],
+                           precision)
+        diagonal = write_path([('M', (s*0.15, s*0.15)), ('L', (s*0.85, s*0.85)),
+                               ('M', (s*0.85, s*0.15)), ('L', (s*0.15, s*0.85))], precision)
+    return (f'<path d="{cross}"{stroke} stroke-width="2" stroke-linecap="round"/>',
+            f'<path d="{diagonal}"{stroke} stroke-width="1.5" stroke-linecap="round" opacity="0.7"/>')
 
 def svg_sparkle(x, y, size=12, color='#E8C547'):
     """Create a sparkle/star decoration"""
     s = size
-    return f'''
+    cross, diagonal = _sparkle_paths(s, f' stroke="{color}"', PATH_PRECISION)
+    inline = f'''
     <g transform="translate({x}, {y})">
-        <path d="M{s/2} 0 L{s/2} {s} M0 {s/2} L{s} {s/2}" stroke="{color}" stroke-width="2" stroke-linecap="round"/>
-        <path d="M{s*0.15} {s*0.15} L{s*0.85} {s*0.85} M{s*0.85} {s*0.15} L{s*0.15} {s*0.85}" stroke="{color}" stroke-width="1.5" stroke-linecap="round" opacity="0.7"/>
+        {cross}
+        {diagonal}
     </g>
     '''
+    # The symbol leaves stroke unset so each <use> can color it
+    return svg_symbol(('sparkle', s, PATH_PRECISION), lambda: "".join(_sparkle_paths(s, '', PATH_PRECISION)),
+                      f'transform="translate({x}, {y})" stroke="{color}"', inline)
+
+
+# Seed for procedurally scattered title decorations (--scatter-seed);
+# None keeps the hand-placed layout
+SCATTER_SEED = None
+
+# Slide 1's text column and transformation visual, in slide px
+TITLE_KEEP_OUT = ((100, 150, 700, 780), (880, 140, 860, 800))
 
+# Palettes for procedurally scattered decorations
+SCATTER_BLOB_COLORS = ('mint', 'blush_soft', 'coral_pale', 'gold_soft')
+SCATTER_SPARKLE_COLORS = ('#E8C547', COLORS['teal_light'], COLORS['coral_soft'])
 
+def svg_scattered_decorations(seed, keep_out=(), blobs=3, sparkles=4, max_overlap=0.25,
+                              margin=40, candidates=64):
+    """
+    Seeded .bg-shapes content: blobs and sparkles scattered around keep_out.
+
+    keep_out holds (x, y, w, h) slide-px boxes of text and cards; blobs
+    overlap them (and each other) by at most max_overlap of their size,
+    sparkles not at all.  Every seed gives a different, reproducible layout.
+    """
+    rng = random.Random(seed)
+    decorations = []
+    for _ in range(blobs):
+        decorations.append(Decoration(BLOB, 2 * rng.uniform(160, 320), 2 * rng.uniform(140, 280)))
+    for _ in range(sparkles):
+        size = rng.choice((10, 12, 14))
+        decorations.append(Decoration('sparkle', size, size))
+
+    parts = []
+    for i, p in enumerate(scatter(SLIDE_WIDTH, SLIDE_HEIGHT, decorations, keep_out, seed=seed,
+                                  max_overlap=max_overlap, margin=margin, candidates=candidates)):
+        d = p.decoration
+        if d.kind == BLOB:
+            parts.append(svg_blob(round(p.cx), round(p.cy), round(d.width / 2), round(d.height / 2),
+                                  COLORS[rng.choice(SCATTER_BLOB_COLORS)],
+                                  round(rng.uniform(0.12, 0.3), 2), rng.randrange(-30, 31, 5),
+                                  seed=seed * 100 + i, style=rng.choice(list(BLOB_STYLES))))
+        else:
+            parts.append(svg_sparkle(round(p.cx - d.width / 2), round(p.cy - d.height / 2),
+                                     d.width, rng.choice(SCATTER_SPARKLE_COLORS)))
+    return "\n        ".join(parts)
+
+
+@SLIDES.slide('01', "Title", tags=('intro',))
 def slide_01_title():
     """Title slide - THE 2026 ETSY RESET - MASSIVE typography + transformation visual"""
     gold = '#E8C547'
     success_green = '#2D9B6E'
+    reset_width = badge_width('RESET', 'Ogg Bold', 18)
 
-    return f'''
-<div class="slide bg-cream">
-    <!-- Subtle background texture/warmth - balanced sparkles -->
-    <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
-        <!-- Warm organic shapes in background -->
+    if SCATTER_SEED is None:
+        decorations = f'''<!-- Warm organic shapes in background -->
         {svg_blob(1780, 120, 260, 220, COLORS['mint'], 0.18, 15, seed=100, style='cloud')}
         {svg_blob(30, 850, 220, 200, COLORS['blush_soft'], 0.22, -10, seed=101, style='amoeba')}
         {svg_blob(1820, 920, 180, 160, COLORS['coral_pale'], 0.12, 20, seed=102, style='organic')}
@@ -555,7 +1711,15 @@ def slide_01_title():
         {svg_sparkle(80, 140, 14, gold)}
         {svg_sparkle(1680, 320, 12, COLORS['teal_light'])}
         {svg_sparkle(160, 780, 10, COLORS['coral_soft'])}
-        {svg_sparkle(1750, 700, 14, gold)}
+        {svg_sparkle(1750, 700, 14, gold)}'''
+    else:
+        decorations = svg_scattered_decorations(SCATTER_SEED, TITLE_KEEP_OUT)
+
+    return f'''
+<div class="slide bg-cream">
+    <!-- Subtle background texture/warmth - balanced sparkles -->
+    <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
+        {decorations}
     </svg>
 
     <div class="content" style="display: flex; flex-direction: row; align-items: center; padding: 100px 180px 80px 100px; gap: 80px;">
@@ -572,9 +1736,7 @@ def slide_01_title():
 
             <!-- MASSIVE RESET with hand-drawn underline -->
             <div style="position: relative; margin-bottom: 18px;">
-                <h1 class="display text-dark" style="font-size: 190px; line-height: 0.85; letter-spacing: -4px;">
-                    RESET
-                </h1>
+                {display_heading('h1', 'RESET', 190, 'text-dark', width=700, line_height=0.85, letter_spacing=-4)}
                 <!-- Hand-drawn style underline -->
                 <svg style="position: absolute; bottom: 8px; left: 5px;" width="400" height="18" viewBox="0 0 400 18">
                     <path d="M5 10 Q70 5 140 12 Q210 4 280 11 Q350 7 395 7" stroke="{COLORS['coral']}" stroke-width="5" fill="none" stroke-linecap="round" opacity="0.75"/>
@@ -627,13 +1789,13 @@ def slide_01_title():
                     <polygon points="118,40 138,50 118,60" fill="{COLORS['coral']}"/>
 
                     <!-- RESET button - bigger and glowing -->
-                    <rect x="15" y="70" width="95" height="42" rx="10" fill="{COLORS['coral']}"
+                    <rect x="{62 - reset_width / 2:g}" y="70" width="{reset_width}" height="42" rx="10" fill="{COLORS['coral']}"
                           style="filter: drop-shadow(0 5px 14px rgba(224,123,108,0.45));"/>
                     <text x="62" y="98" text-anchor="middle" font-family="Ogg Bold, serif"
                           font-size="18" fill="white" font-weight="bold">RESET</text>
 
                     <!-- Sparkle on button -->
-                    <circle cx="100" cy="78" r="4" fill="white" opacity="0.6"/>
+                    <circle cx="{62 + reset_width / 2 - 10:g}" cy="78" r="4" fill="white" opacity="0.6"/>
                 </g>
 
                 <!-- Sparkles around success -->
@@ -647,6 +1809,7 @@ def slide_01_title():
 </div>
 '''
 
+@SLIDES.slide('02', "Before We Begin", tags=('intro',))
 def slide_02_before_begin():
     """Before We Begin - Pop Quiz"""
     return f'''
@@ -659,9 +1822,7 @@ def slide_02_before_begin():
 
     <div class="content flex-center">
         <div class="card text-center" style="max-width: 900px;">
-            <h1 class="display text-dark" style="font-size: 80px; margin-bottom: 30px;">
-                Before We Begin...
-            </h1>
+            {display_heading('h1', 'Before We Begin...', 80, 'text-dark', "margin-bottom: 30px;", width=780)}
 
             <div style="width: 120px; height: 6px; background: {COLORS['teal']}; margin: 0 auto 30px;"></div>
 
@@ -678,6 +1839,7 @@ def slide_02_before_begin():
 </div>
 '''
 
+@SLIDES.slide('03', "Get Ready Chat", tags=('intro', 'interactive'))
 def slide_03_get_ready():
     """Get ready to type in the chat"""
     return f'''
@@ -690,9 +1852,7 @@ def slide_03_get_ready():
 
     <div class="content flex-center">
         <div class="card text-center" style="max-width: 800px; position: relative;">
-            <h1 class="display text-dark" style="font-size: 72px; margin-bottom: 40px;">
-                Get ready to type<br>in the chat!
-            </h1>
+            {display_heading('h1', 'Get ready to type<br>in the chat!', 72, 'text-dark', "margin-bottom: 40px;", width=680)}
 
             <div style="display: flex; gap: 20px; justify-content: center; margin-bottom: 30px;">
                 <div style="width: 24px; height: 24px; background: {COLORS['teal']}; border-radius: 50%;"></div>
@@ -713,6 +1873,7 @@ def slide_03_get_ready():
 </div>
 '''
 
+@SLIDES.slide('04', "Quiz A/B", tags=('quiz',))
 def slide_04_quiz_ab():
     """Which design was made by professional artist?"""
     return f'''
@@ -725,9 +1886,7 @@ def slide_04_quiz_ab():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-dark text-center" style="font-size: 56px; margin-bottom: 50px;">
-            Which design was made by a professional artist?
-        </h1>
+        {display_heading('h1', 'Which design was made by a professional artist?', 56, 'text-dark text-center', "margin-bottom: 50px;", wrap=True)}
 
         <div style="display: flex; gap: 60px; justify-content: center; align-items: center;">
             <!-- Option A -->
@@ -764,6 +1923,7 @@ def slide_04_quiz_ab():
 </div>
 '''
 
+@SLIDES.slide('05', "Type A or B", tags=('quiz', 'interactive'))
 def slide_05_type_ab():
     """Type A or B in the chat"""
     return f'''
@@ -775,9 +1935,7 @@ def slide_05_type_ab():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-white" style="font-size: 90px; margin-bottom: 60px;">
-            Type A or B<br>in the chat!
-        </h1>
+        {display_heading('h1', 'Type A or B<br>in the chat!', 90, 'text-white', "margin-bottom: 60px;")}
 
         <div style="display: flex; gap: 80px; align-items: center;">
             <div style="width: 180px; min-width: 180px; height: 180px; min-height: 180px;
@@ -798,6 +1956,7 @@ def slide_05_type_ab():
 </div>
 '''
 
+@SLIDES.slide('06', "The Answer Is", tags=('quiz', 'reveal'))
 def slide_06_answer_is():
     """The Answer Is..."""
     return f'''
@@ -810,9 +1969,7 @@ def slide_06_answer_is():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-dark" style="font-size: 120px;">
-            The Answer Is...
-        </h1>
+        {display_heading('h1', 'The Answer Is...', 120, 'text-dark')}
 
         <div style="display: flex; gap: 20px; margin-top: 60px;">
             <div style="width: 20px; height: 20px; background: {COLORS['teal']}; border-radius: 50%;"></div>
@@ -823,6 +1980,7 @@ def slide_06_answer_is():
 </div>
 '''
 
+@SLIDES.slide('07', "Both AI", tags=('quiz', 'reveal'))
 def slide_07_both_ai():
     """Both Were Made by AI"""
     return f'''
@@ -834,9 +1992,7 @@ def slide_07_both_ai():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-white" style="font-size: 100px; margin-bottom: 50px;">
-            Both Were Made by AI.
-        </h1>
+        {display_heading('h1', 'Both Were Made by AI.', 100, 'text-white', "margin-bottom: 50px;")}
 
         <div class="card text-center" style="padding: 50px 80px;">
             <p class="body text-dark" style="font-size: 36px; line-height: 1.6;">
@@ -848,6 +2004,7 @@ def slide_07_both_ai():
 </div>
 '''
 
+@SLIDES.slide('08', "AI Nowadays", tags=('shift',))
 def slide_08_ai_nowadays():
     """Yes we all use AI nowadays"""
     return f'''
@@ -867,9 +2024,7 @@ def slide_08_ai_nowadays():
 
             <div style="width: 200px; height: 5px; background: {COLORS['teal']}; margin-bottom: 40px;"></div>
 
-            <h2 class="display text-dark" style="font-size: 48px; line-height: 1.4; margin-bottom: 40px;">
-                But in 2026, they've gotten so good that hiring someone REAL is starting to become just an option...
-            </h2>
+            {display_heading('h2', "But in 2026, they've gotten so good that hiring someone REAL is starting to become just an option...", 48, 'text-dark', "margin-bottom: 40px;", width=860, wrap=True, line_height=1.4)}
 
             <div class="pill" style="background: {COLORS['coral_pale']}; color: {COLORS['coral']};">
                 Just an option
@@ -879,6 +2034,7 @@ def slide_08_ai_nowadays():
 </div>
 '''
 
+@SLIDES.slide('09', "Sink In", tags=('shift',))
 def slide_09_sink_in():
     """Let that sink in"""
     return f'''
@@ -891,13 +2047,12 @@ def slide_09_sink_in():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-teal" style="font-size: 90px; text-align: center;">
-            Let that sink in<br>for a second.
-        </h1>
+        {display_heading('h1', 'Let that sink in<br>for a second.', 90, 'text-teal', "text-align: center;")}
     </div>
 </div>
 '''
 
+@SLIDES.slide('10', "Uncomfortable", tags=('shift',))
 def slide_10_uncomfortable():
     """Now let me ask you something uncomfortable"""
     return f'''
@@ -913,14 +2068,13 @@ def slide_10_uncomfortable():
             Now let me ask you
         </p>
 
-        <h1 class="display text-coral" style="font-size: 100px; text-align: center;">
-            something<br>uncomfortable...
-        </h1>
+        {display_heading('h1', 'something<br>uncomfortable...', 100, 'text-coral', "text-align: center;")}
     </div>
 </div>
 '''
 
 # Continue with more slides...
+@SLIDES.slide('11', "What Happens", tags=('shift', 'dark'))
 def slide_11_what_happens():
     """What happens to YOUR Etsy shop in 2026? - DARK/MOODY tension builder"""
     # Dark palette for uncomfortable feeling
@@ -928,6 +2082,10 @@ def slide_11_what_happens():
     dark_accent = '#3D3D4A'
     muted_coral = '#C4736A'
 
+    headline = display_heading('h1', f"""What happens to<br>
+        <span style="color: {COLORS['coral']};">YOUR</span> Etsy shop<br>
+        in 2026?""", 100, 'text-center', "color: white;", line_height=1.1)
+
     return f'''
 <div class="slide" style="background: linear-gradient(145deg, {dark_bg} 0%, #1E1E26 100%);">
     <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
@@ -943,15 +2101,12 @@ def slide_11_what_happens():
             If anyone can create designs like this in seconds...
         </p>
 
-        <h1 class="display text-center" style="font-size: 100px; line-height: 1.1; color: white;">
-            What happens to<br>
-            <span style="color: {COLORS['coral']};">YOUR</span> Etsy shop<br>
-            in 2026?
-        </h1>
+        {headline}
     </div>
 </div>
 '''
 
+@SLIDES.slide('12', "Survey Intro", tags=('survey',))
 def slide_12_survey_intro():
     """The numbers I'm about to show you"""
     return f'''
@@ -964,9 +2119,7 @@ def slide_12_survey_intro():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-dark text-center" style="font-size: 72px; margin-bottom: 60px;">
-            The numbers I'm about<br>to show you aren't random...
-        </h1>
+        {display_heading('h1', "The numbers I'm about<br>to show you aren't random...", 72, 'text-dark text-center', "margin-bottom: 60px;")}
 
         <div class="card-teal text-center" style="max-width: 800px; padding: 50px;">
             <p class="body text-white" style="font-size: 28px; margin-bottom: 20px;">
@@ -997,6 +2150,7 @@ STAT_COLORS = {
 def stat_slide_number(num, color_key, seed_base):
     """Generate a number-only stat reveal slide"""
     c = STAT_COLORS[color_key]
+    fit_style = _fitted_font_style(num, CONTENT_WIDTH, CONTENT_HEIGHT, 360, 0.85)
     return f'''
 <div class="slide bg-dark-stat">
     <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
@@ -1004,7 +2158,7 @@ def stat_slide_number(num, color_key, seed_base):
         {svg_blob(150, 800, 300, 280, c['main'], 0.06, -15, seed=seed_base+1, style='cloud')}
     </svg>
     <div class="content flex-center">
-        <h1 class="display stat-num stat-num-huge" style="color: {c['main']}; text-shadow: 0 20px 60px {c['shadow']};">{num}</h1>
+        <h1 class="display stat-num stat-num-huge" style="color: {c['main']}; text-shadow: 0 20px 60px {c['shadow']};{fit_style}">{num}</h1>
     </div>
 </div>
 '''
@@ -1012,6 +2166,8 @@ def stat_slide_number(num, color_key, seed_base):
 def stat_slide_full(num, color_key, seed_base, text_html, visual_svg):
     """Generate a full stat slide with visualization"""
     c = STAT_COLORS[color_key]
+    # .stat-left is at most 700px wide
+    fit_style = _fitted_font_style(num, 700, CONTENT_HEIGHT, 200, 0.85)
     return f'''
 <div class="slide bg-dark-stat">
     <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
@@ -1020,7 +2176,7 @@ def stat_slide_full(num, color_key, seed_base, text_html, visual_svg):
     </svg>
     <div class="content stat-layout">
         <div class="stat-left">
-            <h1 class="display stat-num stat-num-large" style="color: {c['main']}; text-shadow: 0 15px 40px {c['shadow'].replace('0.3','0.25')};">{num}</h1>
+            <h1 class="display stat-num stat-num-large" style="color: {c['main']}; text-shadow: 0 15px 40px {c['shadow'].replace('0.3','0.25')};{fit_style}">{num}</h1>
             <p class="body stat-text">{text_html}</p>
         </div>
         <div>{visual_svg}</div>
@@ -1028,6 +2184,7 @@ def stat_slide_full(num, color_key, seed_base, text_html, visual_svg):
 </div>
 '''
 
+@svg_component
 def svg_declining_bars():
     """SVG for declining bar chart visualization"""
     return '''<svg width="400" height="350" viewBox="0 0 400 350">
@@ -1044,6 +2201,7 @@ def svg_declining_bars():
         <text x="200" y="335" text-anchor="middle" font-family="Satoshi, sans-serif" font-size="16" fill="rgba(255,255,255,0.5)">SHOP REVENUE TREND</text>
     </svg>'''
 
+@svg_component
 def svg_zero_visibility():
     """SVG for zero/empty visualization"""
     return '''<svg width="350" height="350" viewBox="0 0 350 350">
@@ -1057,6 +2215,7 @@ def svg_zero_visibility():
         <text x="175" y="340" text-anchor="middle" font-family="Satoshi, sans-serif" font-size="14" fill="rgba(255,255,255,0.4)">VISIBILITY</text>
     </svg>'''
 
+@svg_component
 def svg_confusion():
     """SVG for confusion/paralysis visualization"""
     return '''<svg width="350" height="350" viewBox="0 0 350 350">
@@ -1073,31 +2232,38 @@ def svg_confusion():
         <text x="175" y="345" text-anchor="middle" font-family="Satoshi, sans-serif" font-size="14" fill="rgba(255,255,255,0.4)">PARALYSIS</text>
     </svg>'''
 
+@SLIDES.slide('13a', "Stat 75+ (number)", tags=('survey', 'stat'))
 def slide_13a_stat_75_number():
     return stat_slide_number('75+', 'red', 50)
 
+@SLIDES.slide('13b', "Stat 75+", tags=('survey', 'stat'))
 def slide_13b_stat_75_full():
     return stat_slide_full('75+', 'red', 50,
         'of sellers report their shops <span style="color: #C45050; font-weight: bold;">tanked</span> in the last 2 months...',
         svg_declining_bars())
 
+@SLIDES.slide('14a', "Stat 58+ (number)", tags=('survey', 'stat'))
 def slide_14a_stat_58_number():
     return stat_slide_number('58+', 'gray', 52)
 
+@SLIDES.slide('14b', "Stat 58+", tags=('survey', 'stat'))
 def slide_14b_stat_58_full():
     return stat_slide_full('58+', 'gray', 52,
         'sellers said their #1 problem:<br><span style="color: #9CA3AF; font-weight: bold;">"No views anymore"</span>',
         svg_zero_visibility())
 
+@SLIDES.slide('15a', "Stat 47+ (number)", tags=('survey', 'stat'))
 def slide_15a_stat_47_number():
     return stat_slide_number('47+', 'purple', 54)
 
+@SLIDES.slide('15b', "Stat 47+", tags=('survey', 'stat'))
 def slide_15b_stat_47_full():
     return stat_slide_full('47+', 'purple', 54,
         'said they have<br><span style="color: #A89BD4; font-weight: bold;">"No idea what to design"</span>',
         svg_confusion())
 
 
+@SLIDES.slide('16', "Engagement", tags=('survey', 'interactive'))
 def slide_16_engagement():
     """Does anyone else feel that way? - Engagement moment with custom chat bubble"""
     return f'''
@@ -1110,9 +2276,7 @@ def slide_16_engagement():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-dark text-center" style="font-size: 72px; margin-bottom: 50px; line-height: 1.2;">
-            Does anyone else<br>feel that way?
-        </h1>
+        {display_heading('h1', 'Does anyone else<br>feel that way?', 72, 'text-dark text-center', "margin-bottom: 50px;", line_height=1.2)}
 
         <!-- Custom chat bubble graphic -->
         <div style="position: relative; margin-bottom: 40px;">
@@ -1141,6 +2305,7 @@ def slide_16_engagement():
 '''
 
 
+@SLIDES.slide('17', "Reframe Setup", tags=('reframe',))
 def slide_17_reframe_setup():
     """The reframe setup - strikethrough old thinking"""
     wrong_red = '#C45050'
@@ -1160,9 +2325,7 @@ def slide_17_reframe_setup():
 
         <!-- Strikethrough treatment -->
         <div style="position: relative; display: inline-block;">
-            <h1 class="display text-dark text-center" style="font-size: 64px; opacity: 0.5;">
-                "how do I make more listings?"
-            </h1>
+            {display_heading('h1', '"how do I make more listings?"', 64, 'text-dark text-center', "opacity: 0.5;")}
 
             <!-- SVG X / Strikethrough overlay -->
             <svg style="position: absolute; top: 50%; left: 50%; transform: translate(-50%, -50%);" width="900" height="120" viewBox="0 0 900 120">
@@ -1191,11 +2354,16 @@ def slide_17_reframe_setup():
 '''
 
 
+@SLIDES.slide('18', "Big Question", tags=('reframe', 'dark'))
 def slide_18_big_question():
     """The Big Question - Is Etsy even worth pursuing in 2026?"""
     dark_bg = '#1E1E26'
     dark_accent = '#2A2A35'
 
+    headline = display_heading('h1', f"""Is Etsy even<br>
+        <span style="color: {COLORS['coral']};">worth pursuing</span><br>
+        in 2026?""", 90, 'text-center', "color: white;", line_height=1.15)
+
     return f'''
 <div class="slide" style="background: linear-gradient(145deg, {dark_bg} 0%, #141418 100%);">
     <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
@@ -1205,18 +2373,18 @@ def slide_18_big_question():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-center" style="font-size: 90px; line-height: 1.15; color: white;">
-            Is Etsy even<br>
-            <span style="color: {COLORS['coral']};">worth pursuing</span><br>
-            in 2026?
-        </h1>
+        {headline}
     </div>
 </div>
 '''
 
 
+@SLIDES.slide('19', "Promise", tags=('reframe',))
 def slide_19_promise():
     """The Promise - I'm going to answer that question tonight"""
+    headline = display_heading('h2', f"""And the answer?<br>
+        <span style="color: {COLORS['coral']};">It might honestly surprise you.</span>""", 52, 'text-teal text-center', line_height=1.3)
+
     return f'''
 <div class="slide" style="background: linear-gradient(135deg, {COLORS['cream']}, {COLORS['mint']});">
     <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
@@ -1227,9 +2395,7 @@ def slide_19_promise():
     </svg>
 
     <div class="content flex-center">
-        <h1 class="display text-dark text-center" style="font-size: 64px; margin-bottom: 40px; line-height: 1.3;">
-            I'm going to answer that<br>question tonight.
-        </h1>
+        {display_heading('h1', "I'm going to answer that<br>question tonight.", 64, 'text-dark text-center', "margin-bottom: 40px;", line_height=1.3)}
 
         <div style="display: flex; align-items: center; gap: 30px; margin-bottom: 40px;">
             <div style="width: 100px; height: 4px; background: {COLORS['teal']}; border-radius: 2px;"></div>
@@ -1242,17 +2408,21 @@ def slide_19_promise():
             <div style="width: 100px; height: 4px; background: {COLORS['teal']}; border-radius: 2px;"></div>
         </div>
 
-        <h2 class="display text-teal text-center" style="font-size: 52px; line-height: 1.3;">
-            And the answer?<br>
-            <span style="color: {COLORS['coral']};">It might honestly surprise you.</span>
-        </h2>
+        {headline}
     </div>
 </div>
 '''
 
 
+@SLIDES.slide('20a', "AI Opportunity (part 1)", tags=('reframe', 'reveal'))
 def slide_20a_opportunity_part1():
     """The Opportunity Reveal - Part 1: Just the opportunity statement"""
+    # Line sizes in em (80px and 52px at 64px) so they shrink with the fit
+    headline = display_heading('h1', f"""The AI flood actually<br>
+        <span style="color: {COLORS['teal_deep']}; font-size: 1.25em;">CREATES</span> an opportunity<br>
+        <span style="font-size: 0.8125em;">for a very specific type of seller...</span>""",
+        64, 'text-dark text-center', line_height=1.3)
+
     return f'''
 <div class="slide bg-cream">
     <svg class="bg-shapes" viewBox="0 0 {SLIDE_WIDTH} {SLIDE_HEIGHT}" preserveAspectRatio="none">
@@ -1266,19 +2436,22 @@ def slide_20a_opportunity_part1():
             Because what nobody is talking about is this:
         </p>
 
-        <h1 class="display text-dark text-center" style="font-size: 64px; line-height: 1.3;">
-            The AI flood actually<br>
-            <span style="color: {COLORS['teal_deep']}; font-size: 80px;">CREATES</span> an opportunity<br>
-            <span style="font-size: 52px;">for a very specific type of seller...</span>
-        </h1>
+        {headline}
     </div>
 </div>
 '''
 
 
+@SLIDES.slide('20b', "AI Opportunity", tags=('reframe', 'reveal'))
 def slide_20b_opportunity_full():
     """The Opportunity Reveal - Full with the BUT condition"""
     gold = '#D4AF37'
+    # Line sizes in em (72px and 46px at 56px) so they shrink with the fit
+    headline = display_heading('h1', f"""The AI flood actually<br>
+        <span style="color: {COLORS['teal_deep']}; font-size: 1.2857em;">CREATES</span> an
+        <span style="background: linear-gradient(135deg, {COLORS['gold']}, {gold}); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">opportunity</span><br>
+        <span style="font-size: 0.8214em;">for a very specific type of seller...</span>""",
+        56, 'text-dark text-center', "margin-bottom: 10px;", line_height=1.3)
 
     return f'''
 <div class="slide bg-cream">
@@ -1294,12 +2467,7 @@ def slide_20b_opportunity_full():
             Because what nobody is talking about is this:
         </p>
 
-        <h1 class="display text-dark text-center" style="font-size: 56px; line-height: 1.3; margin-bottom: 10px;">
-            The AI flood actually<br>
-            <span style="color: {COLORS['teal_deep']}; font-size: 72px;">CREATES</span> an
-            <span style="background: linear-gradient(135deg, {COLORS['gold']}, {gold}); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;">opportunity</span><br>
-            <span style="font-size: 46px;">for a very specific type of seller...</span>
-        </h1>
+        {headline}
 
         <!-- The BUT condition - visual gate -->
         <div style="background: linear-gradient(135deg, {COLORS['teal_deep']}, {COLORS['teal']}); padding: 30px 60px; border-radius: 20px; margin-top: 20px; box-shadow: 0 15px 40px rgba(27,138,138,0.25);">
@@ -1320,82 +2488,624 @@ def slide_20b_opportunity_full():
 '''
 
 
+# =============================================================================
+# SLIDE FRAGMENT CACHE
+# =============================================================================
+
+# Each slide's markup is cached on disk under a hash of everything that can
+# change it: the builder's source, the source of every helper it reaches,
+# the design tokens (module constants) those read, and its parameters.
+# Editing one slide or helper only regenerates the slides that use it.
+FRAGMENT_CACHE_DIR = os.path.join(CACHE_DIR, "fragments")
+FRAGMENT_CACHE_VERSION = 1
+
+# Records kept (most recently used first) - a few versions of the whole deck
+FRAGMENT_CACHE_KEEP = 400
+
+# False regenerates every slide and leaves the cache alone (--no-slide-cache)
+SLIDE_CACHE = True
+
+# builder name -> 'reused' (read from disk) or 'built' (regenerated), for the build report
+FRAGMENT_STATS = {}
+
+_source_hashes = {}   # function, class or module file -> sha256 of its source
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_TOKEN_TYPES = (str, int, float, bool, tuple, list, dict, frozenset, set, type(None))
+
+def _source_hash(obj):
+    digest = _source_hashes.get(obj)
+    if digest is None:
+        if isinstance(obj, str):
+            with open(obj, 'rb') as f:
+                data = f.read()
+        else:
+            data = inspect.getsource(obj).encode('utf-8')
+        digest = _source_hashes[obj] = hashlib.sha256(data).hexdigest()
+    return digest
+
+def _local_module_file(obj):
+    """Source file of obj's module when it is one of the deck's own modules, else None"""
+    module = sys.modules.get(getattr(obj, '__module__', None) or getattr(obj, '__name__', ''))
+    path = getattr(module, '__file__', None)
+    if path and os.path.dirname(os.path.abspath(path)) == _MODULE_DIR:
+        return path
+    return None
+
+def _code_names(code):
+    """Global and attribute names used by code, nested lambdas/comprehensions included"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _code_names(const)
+    return names
+
+def _collect_inputs(fn, parts, seen):
+    """Append fn's source hash, then those of the helpers and tokens it reaches"""
+    fn = inspect.unwrap(fn)
+    if fn in seen:
+        return
+    seen.add(fn)
+    parts.append(f"{fn.__qualname__}:{_source_hash(fn)}")
+    scope = fn.__globals__
+    for name in sorted(_code_names(fn.__code__)):
+        if name not in scope:
+            continue  # an attribute, a local or a builtin
+        value = scope[name]
+        if inspect.isfunction(inspect.unwrap(value)) and inspect.unwrap(value).__globals__ is scope:
+            _collect_inputs(value, parts, seen)
+        elif inspect.isclass(value) and hasattr(value, '_fields'):
+            parts.append(f"{name}={value._fields!r}")  # namedtuple: no source of its own
+        elif inspect.isclass(value) and getattr(value, '__module__', None) == fn.__module__:
+            if value not in seen:
+                seen.add(value)
+                parts.append(f"{name}:{_source_hash(value)}")
+                for member in vars(value).values():
+                    if inspect.isfunction(member):
+                        _collect_inputs(member, parts, seen)
+        elif isinstance(value, _TOKEN_TYPES):
+            if name.startswith('_') or name.endswith(('_STATS', '_REPORT')):
+                continue  # build state and report counters, not inputs
+            if isinstance(value, (set, frozenset)):
+                value = sorted(value, key=repr)
+            parts.append(f"{name}={value!r}")
+        else:
+            # Functions, classes and modules of the other deck modules
+            # (text_fit, placement...): the whole file stands in for them
+            _collect_module(_local_module_file(value), parts, seen)
+
+def _collect_module(path, parts, seen):
+    """Append a deck module's file hash, then those of the deck modules it imports"""
+    if path is None or path in seen:
+        return
+    seen.add(path)
+    parts.append(f"{os.path.basename(path)}:{_source_hash(path)}")
+    # e.g. text_fit -> font_metrics: fitted sizes depend on both
+    scope = getattr(sys.modules.get(inspect.getmodulename(path)), '__dict__', {})
+    for name in sorted(scope):
+        _collect_module(_local_module_file(scope[name]), parts, seen)
+
+def fragment_key(builder, with_defs=True):
+    """Hash of every input of builder's markup (see SLIDE FRAGMENT CACHE)"""
+    parts = [f"v{FRAGMENT_CACHE_VERSION}", f"defs={with_defs}",
+             f"params={builder.__defaults__!r} {builder.__kwdefaults__!r}"]
+    _collect_inputs(builder, parts, set())
+    # Fitted headline sizes come from the font files' metrics
+    for _, font_file in FONTS:
+        try:
+            st = os.stat(os.path.join(BASE_PATH, font_file))
+            parts.append(f"{font_file}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{font_file}:missing")
+    return hashlib.sha256("\n".join(parts).encode('utf-8')).hexdigest()[:32]
+
+def _record_fragment(builder, with_defs):
+    """
+    Run builder and keep what it produced as plain data: the markup and, with
+    with_defs, the decorations and gradients it registered, so they can be
+    replayed into a later build's SvgDefsRegistry.  The absolute sizes of
+    its paths go along for path_report().
+    """
+    global _defs_registry
+    recorder = SvgDefsRegistry() if with_defs else None
+    _defs_registry = recorder
+    try:
+        markup = builder()
+    finally:
+        _defs_registry = None
+    record = {'markup': markup}
+    if recorder is not None:
+        symbols = {}
+        uses = []
+        for key, use_attrs, inline in recorder.occurrences:
+            if key not in symbols:
+                symbols[key] = len(symbols)
+            uses.append([symbols[key], use_attrs, inline])
+        record['symbols'] = [[list(key), recorder.bodies[key]()] for key in symbols]
+        record['uses'] = uses
+        record['gradients'] = list(recorder.gradients.items())
+        markup = "".join([markup] + [body for _, body in record['symbols']] +
+                         [inline for _, _, inline in uses])
+    record['paths'] = {d: _path_absolute_sizes[d] for d in _PATH_DATA_RE.findall(markup)
+                       if d in _path_absolute_sizes}
+    return record
+
+def _replay_fragment(record, registry):
+    _path_absolute_sizes.update(record['paths'])
+    if registry is None:
+        return record['markup']
+    for gradient_id, definition in record['gradients']:
+        registry.add_gradient(gradient_id, definition)
+    marks = []
+    for index, use_attrs, inline in record['uses']:
+        key, body = record['symbols'][index]
+        marks.append(registry.ref(tuple(key), lambda body=body: body, use_attrs, inline))
+    return _SYMBOL_MARK_RE.sub(lambda m: marks[int(m.group(1))], record['markup'])
+
+def slide_record(builder, with_defs=True):
+    """
+    One slide as a fragment record (see _record_fragment), ready to be
+    replayed into a registry with _replay_fragment().
+
+    The slide is only rebuilt when fragment_key() changes; otherwise the
+    record is read back from FRAGMENT_CACHE_DIR.  Records aren't kept in
+    memory, so a long deck costs one slide's record at a time.
+    """
+    if not SLIDE_CACHE:
+        return _record_fragment(builder, with_defs)
+
+    key = fragment_key(builder, with_defs)
+    path = os.path.join(FRAGMENT_CACHE_DIR, f"{key}.json")
+    try:
+        with open(path, encoding='utf-8') as f:
+            record = json.load(f)
+        os.utime(path)  # most recently used, for evict_fragments()
+    except (OSError, ValueError):
+        record = _record_fragment(builder, with_defs)
+        os.makedirs(FRAGMENT_CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+        FRAGMENT_STATS[builder.__name__] = 'built'
+    FRAGMENT_STATS.setdefault(builder.__name__, 'reused')
+    return record
+
+def evict_fragments(keep=None):
+    """
+    Delete all but the keep (default FRAGMENT_CACHE_KEEP) most recently
+    used fragment records, as pdf_render.evict_pages() does for pages;
+    returns how many files were deleted
+    """
+    if not os.path.isdir(FRAGMENT_CACHE_DIR):
+        return 0
+    return evict_pages(FRAGMENT_CACHE_DIR, (), FRAGMENT_CACHE_KEEP if keep is None else keep,
+                       ext=".json")
+
+def slide_fragment(builder, registry=None):
+    """Markup of one slide, its decorations registered with registry"""
+    return _replay_fragment(slide_record(builder, registry is not None), registry)
+
 # =============================================================================
 # BUILD ALL SLIDES
 # =============================================================================
 
-def build_all_slides():
-    """Generate all slides as HTML"""
-    slides = [
-        slide_01_title(),
-        slide_02_before_begin(),
-        slide_03_get_ready(),
-        slide_04_quiz_ab(),
-        slide_05_type_ab(),
-        slide_06_answer_is(),
-        slide_07_both_ai(),
-        slide_08_ai_nowadays(),
-        slide_09_sink_in(),
-        slide_10_uncomfortable(),
-        slide_11_what_happens(),
-        slide_12_survey_intro(),
-        slide_13a_stat_75_number(),
-        slide_13b_stat_75_full(),
-        slide_14a_stat_58_number(),
-        slide_14b_stat_58_full(),
-        slide_15a_stat_47_number(),
-        slide_15b_stat_47_full(),
-        slide_16_engagement(),
-        slide_17_reframe_setup(),
-        slide_18_big_question(),
-        slide_19_promise(),
-        slide_20a_opportunity_part1(),
-        slide_20b_opportunity_full(),
-    ]
+# Every slide's PDF page is cached under a hash of its standalone document
+# (see iter_slide_documents and pdf_render.render_pages); False renders the
+# deck as one document (--no-page-cache)
+PAGE_CACHE = True
+PAGE_CACHE_DIR = os.path.join(CACHE_DIR, "pages")
+
+# Filled in by build_all_slides(): number of builds and their total time
+BUILD_STATS = {'builds': 0, 'seconds': 0.0}
 
-    html = f'''<!DOCTYPE html>
+def iter_deck_html(font_format='truetype', font_mode='inline', static_weights=False,
+                   symbol_scope='svg', raster_dpi=None, slides=None, subset_fonts=True):
+    """
+    Yield the deck HTML piece by piece: head, each @font-face rule, the
+    layout CSS, then one slide at a time.  Arguments as build_all_slides();
+    subset_fonts=False embeds whole fonts instead of the deck's subset.
+    """
+    for _, piece in iter_deck_pieces(font_format, font_mode, static_weights,
+                                     symbol_scope, raster_dpi, slides, subset_fonts):
+        yield piece
+
+def iter_deck_pieces(font_format='truetype', font_mode='inline', static_weights=False,
+                     symbol_scope='svg', raster_dpi=None, slides=None, subset_fonts=True):
+    """
+    iter_deck_html() as (kind, html) pairs: kind is 'head' for everything
+    up to the first slide, 'slide' for each slide and 'tail' after them,
+    so a caller can cut the deck into standalone documents (see pdf_render).
+
+    The embedded fonts are subset to the whole deck's text and the CSS comes
+    first, so slides are read twice: a first pass builds each slide's
+    fragment record, collects characters, weights and decoration counts and
+    spills the record to a temporary file; the second reads the records
+    back one at a time, replays, resolves and yields each slide.  Builders
+    run once and memory doesn't grow with the length of the deck.
+    """
+    start = time.perf_counter()
+    if font_mode not in FONT_MODES:
+        raise ValueError(f"Unknown font mode: {font_mode!r}")
+    if symbol_scope is not None and symbol_scope not in SYMBOL_SCOPES:
+        raise ValueError(f"Unknown symbol scope: {symbol_scope!r}")
+    if raster_dpi and symbol_scope == 'document':
+        # Rasterized layers are rendered standalone and can't see a deck-level sprite
+        symbol_scope = 'svg'
+
+    registry = SvgDefsRegistry() if symbol_scope else None
+    inline_fonts = font_mode == 'inline'
+    slides = list(SLIDES) if slides is None else slides
+
+    # Pass 1: what the whole deck needs
+    layout_css = get_layout_css()
+    chars = set()
+    weights = set() if inline_fonts and static_weights else None
+    used = UsedNames() if CSS_PRUNE else None
+    counts = {}
+    spill = tempfile.TemporaryFile('w+', encoding='utf-8')
+    for entry in slides:
+        record = slide_record(entry.builder, registry is not None)
+        spill.write(json.dumps(record) + "\n")
+        slide = _replay_fragment(record, registry)
+        if registry is not None:
+            for key in registry.keys_in(slide):
+                counts[key] = counts.get(key, 0) + 1
+            slide = registry.substitute(slide, ())
+        if inline_fonts:
+            chars.update(collect_used_text(slide))
+        if weights is not None:
+            weights.update(collect_used_weights(slide, layout_css))
+        if used is not None:
+            used.feed(slide)
+
+    families = None
+    if used is not None:
+        used.close()
+        pruned = prune_css(layout_css, used)
+        families = pruned.families
+        CSS_STATS.update(rules=pruned.rules, kept=pruned.kept,
+                         before=len(layout_css), after=len(pruned.css),
+                         fonts=[name for name, _ in FONTS if name.lower() not in families])
+        layout_css = pruned.css
+
+    text = "".join(sorted(chars)) if inline_fonts and subset_fonts else None
+    font_link = '<link rel="stylesheet" href="fonts.css">' if font_mode == 'link' else ''
+    yield 'head', f'''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
+    {font_link}
     <style>
-        {get_base_css()}
+        '''
+    if inline_fonts:
+        for block in iter_font_css(text, font_format, sorted(weights) if weights else None, families):
+            yield 'head', block
+    yield 'head', layout_css
+    yield 'head', '''
     </style>
 </head>
 <body>
-    {"".join(slides)}
+    '''
+
+    # Pass 2: the slides themselves
+    path_stats = dict.fromkeys(PATH_STATS, 0)
+    shared = set()
+    gradient_ids = set()  # inline gradients already defined in this document
+    if registry is not None:
+        registry.new_pass()
+    if symbol_scope == 'document':
+        shared = {key for key, n in counts.items() if n > 1}
+        sprite = registry.sprite([key for key in counts if key in shared])
+        path_stats.update(path_report(sprite))
+        yield 'head', sprite
+    with spill:
+        spill.seek(0)
+        for line in spill:
+            slide = _replay_fragment(json.loads(line), registry)
+            if symbol_scope == 'document':
+                slide = registry.substitute(slide, shared)
+            elif symbol_scope == 'svg':
+                slide = registry.resolve_svg(slide)
+            else:
+                slide = drop_repeated_gradients(slide, gradient_ids)
+            for name, value in path_report(slide).items():
+                path_stats[name] += value
+            if raster_dpi:
+                slide = rasterize_backgrounds(slide, raster_dpi)
+            yield 'slide', slide
+
+    yield 'tail', '''
 </body>
 </html>
 '''
-    return html
+    PATH_STATS.update(path_stats)
+    if registry is not None:
+        SYMBOL_STATS.update(registry.stats)
+    BUILD_STATS['builds'] += 1
+    BUILD_STATS['seconds'] += time.perf_counter() - start
+
+def build_all_slides(font_format='truetype', font_mode='inline', static_weights=False,
+                     symbol_scope='svg', raster_dpi=None, slides=None):
+    """
+    Generate all slides as HTML.
+
+    font_mode 'inline' embeds fonts as font_format (see FONT_FORMATS);
+    'link' references the shared bundle from write_font_bundle() instead.
+    static_weights embeds variable fonts as static instances of the weights
+    the deck uses - no variable-font shaping in WeasyPrint - unless the
+    instances add up to more bytes than the variable font.
+    symbol_scope (see SYMBOL_SCOPES) is where repeated decorations are
+    defined once; None inlines every decoration, each gradient defined at
+    its first use only (document-wide ids, as with 'document').
+    raster_dpi swaps the .bg-shapes layers for cached PNGs at that DPI
+    (see rasterize_backgrounds).
+    slides limits the build to some SLIDES entries (SLIDES.select());
+    None builds the whole deck.
+
+    Prefer write_deck_html(path, iter_deck_html(...)) for output files: it
+    never holds the whole document in memory.
+    """
+    return "".join(iter_deck_html(font_format, font_mode, static_weights, symbol_scope,
+                                  raster_dpi, slides))
+
+def iter_slide_documents(slides=None, **options):
+    """
+    One standalone HTML document per slide, with the CSS pruned to that
+    slide and whole (not subset) fonts, so a document only changes when its
+    own slide does and every page embeds byte-identical font programs that
+    the PDF merge keeps once.  options as iter_deck_html().
+
+    Once exhausted, CSS_STATS, FONT_SIZE_REPORT and FONT_INSTANCE_CHOICES
+    cover all the documents.
+    """
+    totals = dict.fromkeys(('rules', 'kept', 'before', 'after'), 0)
+    left_out = None
+    fonts = {}
+    choices = {}
+    for slide in (list(SLIDES) if slides is None else slides):
+        yield "".join(iter_deck_html(slides=[slide], subset_fonts=False, **options))
+        for name in totals:
+            totals[name] += CSS_STATS[name]
+        left_out = set(CSS_STATS['fonts']) if left_out is None else left_out & set(CSS_STATS['fonts'])
+        fonts.update((label, (label, before, after)) for label, before, after in FONT_SIZE_REPORT)
+        choices.update(FONT_INSTANCE_CHOICES)
+    CSS_STATS.update(totals, fonts=[name for name, _ in FONTS if name in (left_out or ())])
+    FONT_SIZE_REPORT[:] = fonts.values()
+    FONT_INSTANCE_CHOICES.clear()
+    FONT_INSTANCE_CHOICES.update(choices)
+
+def write_deck_html(path, chunks):
+    """Stream HTML chunks into path (atomically); returns the bytes written"""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp_path, path)
+    return os.path.getsize(path)
+
+def print_font_report(label):
+    print(f"  Fonts ({label}):")
+    for font_name, before, after in FONT_SIZE_REPORT:
+        print(f"    {font_name:<16} {before:>9,} -> {after:>9,} bytes "
+              f"({100 * (after - before) / before:+.0f}%)")
+    for font_name, (choice, static_size, variable_size) in FONT_INSTANCE_CHOICES.items():
+        print(f"    {font_name}: {choice} embedded (static instances {static_size:,} bytes, "
+              f"variable font {variable_size:,} bytes)")
+
+def print_component_report():
+    calls, compiles, seconds, uncached = component_report()
+    build_ms = BUILD_STATS['seconds'] * 1000
+    print(f"  Static components: {calls} calls, {compiles} compiled in {seconds * 1000:.2f} ms "
+          f"(uncompiled {uncached * 1000:.2f} ms) of {build_ms:.1f} ms in "
+          f"{BUILD_STATS['builds']} build(s)")
+    for name, stats in COMPONENT_STATS.items():
+        if stats['calls']:
+            print(f"    {name:<22} {stats['calls']:>4} calls, {stats['compiles']:>3} compiled, "
+                  f"{stats['seconds'] * 1000:.3f} ms")
+
+def print_fragment_report(evicted=0):
+    built = [name for name, how in FRAGMENT_STATS.items() if how == 'built']
+    if not SLIDE_CACHE:
+        print("  Slide cache: off, every slide regenerated")
+        return
+    print(f"  Slide cache: {len(FRAGMENT_STATS) - len(built)} reused, {len(built)} regenerated"
+          + (f" ({', '.join(built)})" if built else "") + f", {evicted} evicted")
+
+def print_css_report(label):
+    if not CSS_PRUNE:
+        return
+    fonts = ", ".join(CSS_STATS['fonts']) or "none"
+    print(f"  CSS ({label}): {CSS_STATS['kept']}/{CSS_STATS['rules']} rules kept, "
+          f"{CSS_STATS['before']:,} -> {CSS_STATS['after']:,} bytes; fonts left out: {fonts}")
+
+def print_path_report(label):
+    saved = PATH_STATS['absolute'] - PATH_STATS['written']
+    print(f"  SVG paths ({label}): {PATH_STATS['paths']} paths, {PATH_STATS['absolute']:,} -> "
+          f"{PATH_STATS['written']:,} bytes ({saved:,} saved, precision {PATH_PRECISION})")
+
+def print_symbol_report(label):
+    print(f"  SVG defs ({label}): {SYMBOL_STATS['symbols']} symbols, "
+          f"{SYMBOL_STATS['uses']} uses, {SYMBOL_STATS['gradients']} gradients, "
+          f"{SYMBOL_STATS['saved']:,} bytes saved")
+
+def reset_build_state():
+    """
+    Options and report counters back to their defaults, so a build in a
+    long-lived process (render_daemon.py) matches a cold one
+    """
+    global PATH_PRECISION, SLIDE_CACHE, CSS_PRUNE, PAGE_CACHE, SCATTER_SEED
+    PATH_PRECISION = DEFAULT_PATH_PRECISION
+    SCATTER_SEED = None
+    SLIDE_CACHE = CSS_PRUNE = PAGE_CACHE = True
+    FONT_CACHE_STATS.update(hits=0, misses=0, seconds=0.0)
+    del FONT_SIZE_REPORT[:]
+    FONT_INSTANCE_CHOICES.clear()
+    PATH_STATS.update(paths=0, absolute=0, written=0)
+    _path_absolute_sizes.clear()
+    clear_blob_cache()
+    clear_component_cache()
+    SYMBOL_STATS.update(symbols=0, uses=0, gradients=0, saved=0)
+    for stats in COMPONENT_STATS.values():
+        stats.update(calls=0, compiles=0, seconds=0.0)
+    BG_RASTER_STATS.update(layers=0, rendered=0, bytes=0, seconds=0.0)
+    CSS_STATS.update(rules=0, kept=0, before=0, after=0, fonts=[])
+    FRAGMENT_STATS.clear()
+    BUILD_STATS.update(builds=0, seconds=0.0)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Etsy Reset deck as HTML + PDF")
+    parser.add_argument('--fonts', choices=FONT_MODES, default='inline',
+                        help="inline base64 fonts (single-file sharing) or link the shared fonts.css bundle")
+    parser.add_argument('--link-decks', nargs='*', metavar='HTML', default=None,
+                        help="rewrite existing decks to use the shared font bundle, then exit")
+    parser.add_argument('--raster-bg', type=float, nargs='?', const=BG_RASTER_DPI, metavar='DPI',
+                        help=f"render background blob layers to cached PNGs (default {BG_RASTER_DPI} dpi)")
+    parser.add_argument('--jobs', type=int, default=1, metavar='N',
+                        help="PDF render processes (0: one per CPU); chunks the deck with --no-page-cache")
+    parser.add_argument('--no-page-cache', action='store_true',
+                        help="render the PDF as one document instead of assembling cached slide pages")
+    parser.add_argument('--keep-unused-css', action='store_true',
+                        help="embed every layout rule and font, used or not")
+    parser.add_argument('--no-slide-cache', action='store_true',
+                        help="regenerate every slide instead of reusing cached fragments")
+    precision = parser.add_mutually_exclusive_group()
+    precision.add_argument('--path-precision', type=int, metavar='N',
+                           help=f"decimals in generated SVG paths (default {DEFAULT_PATH_PRECISION})")
+    precision.add_argument('--path-dpi', type=float, metavar='DPI',
+                           help="pick the path precision for output at this resolution")
+    parser.add_argument('--scatter-seed', type=int, metavar='N',
+                        help="scatter the title slide's blobs and sparkles with this seed")
+    add_selection_args(parser)
+    args = parser.parse_args(argv)
+    args.selection = selected_slides(SLIDES, args, parser)
+    return args
+
+def main(argv=None):
+    global PATH_PRECISION, SLIDE_CACHE, CSS_PRUNE, PAGE_CACHE, SCATTER_SEED
+    reset_build_state()
+    args = parse_args(argv)
+    SCATTER_SEED = args.scatter_seed
+    SLIDE_CACHE = not args.no_slide_cache
+    PAGE_CACHE = not args.no_page_cache
+    CSS_PRUNE = not args.keep_unused_css
+    if args.path_precision is not None:
+        PATH_PRECISION = args.path_precision
+    elif args.path_dpi is not None:
+        PATH_PRECISION = path_precision_for(args.path_dpi)
 
-def main():
     print("=" * 60)
     print("BAILEY VANN - THE 2026 ETSY RESET")
     print("HTML Slide Builder with WeasyPrint")
     print("=" * 60)
 
-    # Generate HTML
-    html_content = build_all_slides()
-
-    # Save HTML for preview
-    html_path = "/home/user/webby-slides-bailey/slides_preview.html"
-    with open(html_path, 'w') as f:
-        f.write(html_content)
-    print(f"  HTML saved: {html_path}")
+    if ft_subset is None:
+        print("  fontTools not installed - embedding full fonts (pip install fonttools)")
+    elif not woff2_available():
+        print("  brotli not installed - preview uses truetype (pip install brotli)")
+
+    jobs = args.jobs or os.cpu_count() or 1
+    if (jobs > 1 or PAGE_CACHE) and not merge_available():
+        print("  pypdf not installed - rendering the PDF in one pass (pip install pypdf)")
+
+    if args.raster_bg and not raster_available():
+        print("  cairosvg not installed - keeping vector backgrounds (pip install cairosvg)")
+        args.raster_bg = None
+
+    if args.fonts == 'link' or args.link_decks is not None:
+        print(f"  Font bundle: {write_font_bundle()}")
+
+    if args.link_decks is not None:
+        for deck_path in args.link_decks:
+            with open(deck_path, encoding='utf-8') as f:
+                original = f.read()
+            linked = link_deck_fonts(original)
+            with open(deck_path, 'w', encoding='utf-8') as f:
+                f.write(linked)
+            print(f"  Linked {deck_path}: {len(original):,} -> {len(linked):,} bytes")
+        return
+
+    if args.selection is not None:
+        print(f"  Building {len(args.selection)} of {len(SLIDES)} slides: "
+              f"{', '.join(s.id for s in args.selection)}")
+
+    # HTML is streamed straight to disk, one slide at a time
+    html_path = os.path.join(BASE_PATH, "slides_preview.html")
+    if args.fonts == 'link':
+        # One document serves both the browser preview and WeasyPrint
+        pdf_options = dict(font_mode='link', raster_dpi=args.raster_bg, slides=args.selection)
+        size = write_deck_html(html_path, iter_deck_html(**pdf_options))
+    else:
+        # HTML for browser preview (woff2, deck-wide SVG symbols)
+        pdf_options = dict(font_format='truetype', static_weights=True, raster_dpi=args.raster_bg,
+                           slides=args.selection)
+        size = write_deck_html(html_path, iter_deck_html(font_format='woff2', symbol_scope='document',
+                                                         raster_dpi=args.raster_bg,
+                                                         slides=args.selection))
+        print_font_report("preview")
+        print_css_report("preview")
+        print_symbol_report("preview")
+        print_path_report("preview")
+    print(f"  HTML saved: {html_path} ({size:,} bytes)")
+
+    # PDF from cached per-slide pages, parallel chunks or one WeasyPrint pass
+    pdf_mode = 'single'
+    if merge_available() and PAGE_CACHE:
+        pdf_mode = 'pages'
+    elif merge_available() and jobs > 1:
+        pdf_mode = 'chunks'
+        pdf_pieces = list(iter_deck_pieces(**pdf_options))
+    elif args.fonts == 'link':
+        pdf_source = html_path
+    else:
+        # HTML for WeasyPrint (truetype, static Satoshi weights)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        pdf_source = os.path.join(CACHE_DIR, "slides_pdf.html")
+        write_deck_html(pdf_source, iter_deck_html(**pdf_options))
+    if pdf_mode != 'pages':
+        if args.fonts == 'inline':
+            print_font_report("PDF")
+        print_css_report("PDF")
+        print_symbol_report("PDF")
+        print_path_report("PDF")
+    if args.raster_bg:
+        print(f"  Backgrounds: {BG_RASTER_STATS['layers']} layers at {args.raster_bg:g} dpi, "
+              f"{BG_RASTER_STATS['rendered']} rendered ({BG_RASTER_STATS['seconds']:.2f}s), "
+              f"{BG_RASTER_STATS['bytes']:,} bytes")
 
     # Convert to PDF
     print("  Converting to PDF...")
-    font_config = FontConfiguration()
-
-    pdf_path = "/home/user/webby-slides-bailey/Bailey_Etsy_Reset_HTML.pdf"
-    HTML(string=html_content).write_pdf(
-        pdf_path,
-        font_config=font_config
-    )
+    pdf_path = os.path.join(BASE_PATH, "Bailey_Etsy_Reset_HTML.pdf")
+    if pdf_mode == 'pages':
+        render_pages(iter_slide_documents(**pdf_options), pdf_path, BASE_PATH + os.sep,
+                     PAGE_CACHE_DIR, jobs=jobs)
+        if args.fonts == 'inline':
+            print_font_report("PDF pages")
+        print_css_report("PDF pages")
+        print(f"  Pages: {RENDER_STATS['pages']} ({RENDER_STATS['rendered']} rendered in "
+              f"{RENDER_STATS['render']:.2f}s, {RENDER_STATS['pages'] - RENDER_STATS['rendered']} "
+              f"cached, {RENDER_STATS['evicted']} evicted), assembled in {RENDER_STATS['merge']:.2f}s")
+    elif pdf_mode == 'chunks':
+        render_pdf(pdf_pieces, pdf_path, BASE_PATH + os.sep, jobs=jobs)
+        print(f"  Rendered {RENDER_STATS['chunks']} chunks on {RENDER_STATS['jobs']} processes "
+              f"in {RENDER_STATS['wall']:.2f}s (merge {RENDER_STATS['merge']:.2f}s), "
+              f"{RENDER_STATS['chunk_bytes']:,} -> {RENDER_STATS['pdf_bytes']:,} bytes merged")
+    else:
+        render_file(pdf_source, pdf_path, BASE_PATH + os.sep)
+
+    # Cache reports last: in pages mode the slides are built while rendering
+    print_fragment_report(evict_fragments() if SLIDE_CACHE else 0)
+    print_component_report()
+    print(f"  Font cache: {FONT_CACHE_STATS['hits']} hits, "
+          f"{FONT_CACHE_STATS['misses']} misses "
+          f"({FONT_CACHE_STATS['seconds'] * 1000:.1f} ms)")
+    for name, info in blob_cache_info().items():
+        print(f"  Blob cache ({name}): {info.hits} hits, {info.misses} misses, "
+              f"{info.currsize}/{info.maxsize} entries")
 
     print(f"  PDF saved: {pdf_path}")
     print("=" * 60)
     print("DONE!")
 
 if __name__ == "__main__":
-    main()
+    main(sys.argv[1:])
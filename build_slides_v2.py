@@ -24,6 +24,12 @@ from lxml import etree
 import os
 import random
 import math
+import argparse
+
+from font_metrics import measure_text, get_metrics, MetricsUnavailable
+from text_fit import fit_text
+from placement import BLOB, Decoration, scatter
+from slide_registry import SlideRegistry, add_selection_args, selected_slides
 
 # =============================================================================
 # DESIGN SYSTEM - PREMIUM EDITORIAL
@@ -71,6 +77,47 @@ class Fonts:
     LIGHT = "Ogg TRIAL Light"
 
 
+# PowerPoint font name -> font_metrics family (same files, different names)
+METRICS_FAMILIES = {
+    Fonts.DISPLAY: 'Ogg Bold',
+    Fonts.BODY: 'Ogg Text',
+    Fonts.BODY_MEDIUM: 'Ogg Text Medium',
+    Fonts.LIGHT: 'Ogg Light',
+}
+
+# The same with bold=True: the family's bold face (Ogg is bold already)
+BOLD_METRICS_FAMILIES = {
+    Fonts.DISPLAY: 'Ogg Bold',
+    Fonts.BODY: 'Ogg Text Extrabold',
+    Fonts.BODY_MEDIUM: 'Ogg Text Extrabold',
+    Fonts.LIGHT: 'Ogg Bold',
+}
+
+
+# Default python-pptx text frame insets (0.1" left/right, 0.05" top/bottom)
+TEXT_INSET_X = Inches(0.2)
+TEXT_INSET_Y = Inches(0.1)
+
+# (text, requested pt, fitted pt) for display text that overflows its box;
+# cleared at the start of every build_presentation()
+FIT_WARNINGS = []
+
+
+def measure_text_width(text, font, size, bold=False):
+    """
+    Width of one line of text as an Emu length, from the real font metrics
+    (of the bold face with bold=True).
+
+    Returns None when metrics are unavailable (no cache and no fontTools),
+    so callers can fall back to their old estimate.
+    """
+    families = BOLD_METRICS_FAMILIES if bold else METRICS_FAMILIES
+    try:
+        return Pt(measure_text(text, families[font], size.pt))
+    except (KeyError, MetricsUnavailable):
+        return None
+
+
 # =============================================================================
 # SMOOTH ORGANIC SHAPE BUILDERS
 # =============================================================================
@@ -239,9 +286,40 @@ def add_text(slide, left, top, width, height, text,
     return box
 
 
+def fit_display_size(text, width, height, size, font=Fonts.DISPLAY, line_spacing=1.0, check_height=True):
+    """
+    Largest point size <= size at which text fits the text box, or None
+    when font metrics are unavailable.
+
+    With check_height=False only the line widths are checked - text boxes
+    here are routinely shorter than their text and overflow downwards.
+    """
+    family = METRICS_FAMILIES[font]
+    try:
+        line_height = get_metrics(family).line_height(1) * line_spacing
+    except MetricsUnavailable:
+        return None
+    inner_height = Emu(height - TEXT_INSET_Y).pt if check_height else float('inf')
+    fit = fit_text(text, family, Emu(width - TEXT_INSET_X).pt, inner_height,
+                   max_size=size.pt, min_size=min(8, size.pt), line_height=line_height)
+    return Pt(fit.size)
+
+
 def add_display_text(slide, left, top, width, height, text,
-                     size=Pt(72), color=Colors.DARK, align=PP_ALIGN.LEFT):
-    """Add large display/headline text with OGG"""
+                     size=Pt(72), color=Colors.DARK, align=PP_ALIGN.LEFT, fit=True):
+    """
+    Add large display/headline text with OGG
+
+    Size shrinks until every line fits the box width (metrics based, no
+    render, like the HTML deck's headlines); the box may still overflow
+    downwards.  fit=False keeps size and logs the overflow to FIT_WARNINGS.
+    """
+    fitted = fit_display_size(text, width, height, size, check_height=False)
+    if fitted is not None and fitted < size:
+        if fit:
+            size = fitted
+        else:
+            FIT_WARNINGS.append((text, size.pt, fitted.pt))
     return add_text(slide, left, top, width, height, text,
                     font=Fonts.DISPLAY, size=size, color=color,
                     bold=True, align=align, line_spacing=1.0)
@@ -285,8 +363,11 @@ def add_floating_card(slide, left, top, width, height,
 def add_pill_label(slide, left, top, text, bg_color=Colors.CORAL,
                    text_color=Colors.WHITE, size=Pt(11)):
     """Add a stylish pill-shaped label"""
-    # Calculate size based on text
-    width = Inches(len(text) * 0.09 + 0.5)
+    # Size from the measured label (text frame insets + rounded caps = 0.5")
+    text_width = measure_text_width(text.upper(), Fonts.BODY_MEDIUM, size, bold=True)
+    if text_width is None:
+        text_width = Inches(len(text) * 0.09)
+    width = text_width + Inches(0.5)
     height = Inches(0.32)
 
     pill = slide.shapes.add_shape(
@@ -318,11 +399,30 @@ def add_pill_label(slide, left, top, text, bg_color=Colors.CORAL,
 # BACKGROUND COMPOSITIONS
 # =============================================================================
 
+# Seed for scattered editorial backgrounds (--scatter-seed); None keeps the
+# hand-placed compositions
+SCATTER_SEED = None
+
+# The content area the scattered blobs stay (mostly) clear of
+EDITORIAL_KEEP_OUT = ((Inches(1.2), Inches(1.0), Inches(10.9), Inches(5.5)),)
+
+
+def _scattered_editorial(slide):
+    """create_scattered_background() for this slide, or None without --scatter-seed"""
+    if SCATTER_SEED is None:
+        return None
+    return create_scattered_background(slide, SCATTER_SEED * 1000 + slide.slide_id, EDITORIAL_KEEP_OUT)
+
+
 def create_editorial_background_1(slide):
     """
     Clean editorial background - cream with subtle soft shapes
     Minimal, elegant, Pinterest-worthy
     """
+    scattered = _scattered_editorial(slide)
+    if scattered is not None:
+        return scattered
+
     # Base cream
     bg = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE, 0, 0,
@@ -366,6 +466,10 @@ def create_editorial_background_2(slide):
     """
     Warm blush background - clean and elegant
     """
+    scattered = _scattered_editorial(slide)
+    if scattered is not None:
+        return scattered
+
     # Base blush gradient feel
     bg = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE, 0, 0,
@@ -395,6 +499,42 @@ def create_editorial_background_2(slide):
     return [bg, blob1, blob2]
 
 
+def create_scattered_background(slide, seed, keep_out=(), blobs=3, max_overlap=0.25):
+    """
+    Cream background with seeded blobs kept clear of keep_out.
+
+    keep_out holds (left, top, width, height) boxes (EMU) of the slide's
+    text and cards; each seed gives a different, reproducible layout.
+    """
+    bg = slide.shapes.add_shape(
+        MSO_SHAPE.RECTANGLE, 0, 0,
+        Inches(13.333), Inches(7.5)
+    )
+    bg.fill.solid()
+    bg.fill.fore_color.rgb = Colors.CREAM
+    bg.line.fill.background()
+
+    rng = random.Random(seed)
+    decorations = [
+        Decoration(BLOB, Inches(rng.uniform(3, 6)), Inches(rng.uniform(2.5, 5)))
+        for _ in range(blobs)
+    ]
+    palette = [Colors.MINT, Colors.BLUSH_SOFT, Colors.CORAL_PALE, Colors.GOLD_SOFT]
+
+    shapes = [bg]
+    for p in scatter(Inches(13.333), Inches(7.5), decorations, keep_out, seed=seed,
+                     max_overlap=max_overlap):
+        d = p.decoration
+        shapes.append(create_organic_blob(
+            slide,
+            int(p.cx - d.width / 2), int(p.cy - d.height / 2),
+            int(d.width), int(d.height),
+            rng.choice(palette), opacity=rng.randrange(30, 55, 5),
+            rotation=rng.randrange(-25, 30, 5)
+        ))
+    return shapes
+
+
 def create_bold_teal_background(slide):
     """Bold teal background for impact slides"""
     bg = slide.shapes.add_shape(
@@ -463,6 +603,10 @@ def create_coral_accent_background(slide):
 # SLIDE BUILDERS - PREMIUM EDITORIAL
 # =============================================================================
 
+# Slide builders in deck order: every @SLIDES.slide function, as defined
+SLIDES = SlideRegistry()
+
+@SLIDES.slide('01', "Title", tags=('intro',))
 def build_slide_01_title(prs):
     """
     THE 2026 ETSY RESET - Title Slide
@@ -535,6 +679,7 @@ def build_slide_01_title(prs):
     return slide
 
 
+@SLIDES.slide('02', "Before We Begin", tags=('intro',))
 def build_slide_02_before_begin(prs):
     """
     Before We Begin... Quick Pop Quiz
@@ -594,6 +739,7 @@ def build_slide_02_before_begin(prs):
     return slide
 
 
+@SLIDES.slide('03', "Get Ready Chat", tags=('intro', 'interactive'))
 def build_slide_03_get_ready_chat(prs):
     """
     Get ready to type in the chat!
@@ -663,6 +809,7 @@ def build_slide_03_get_ready_chat(prs):
     return slide
 
 
+@SLIDES.slide('04', "Quiz A/B", tags=('quiz',))
 def build_slide_04_quiz_ab(prs):
     """
     A/B Quiz - Which design was made by professional?
@@ -766,6 +913,7 @@ def build_slide_04_quiz_ab(prs):
     return slide
 
 
+@SLIDES.slide('05', "Type A or B", tags=('quiz', 'interactive'))
 def build_slide_05_type_ab(prs):
     """
     Type A or B in the chat!
@@ -826,6 +974,7 @@ def build_slide_05_type_ab(prs):
     return slide
 
 
+@SLIDES.slide('06', "The Answer Is", tags=('quiz', 'reveal'))
 def build_slide_06_answer_is(prs):
     """
     The Answer Is...
@@ -856,6 +1005,7 @@ def build_slide_06_answer_is(prs):
     return slide
 
 
+@SLIDES.slide('07', "Both AI", tags=('quiz', 'reveal'))
 def build_slide_07_both_ai(prs):
     """
     Both Were Made by AI.
@@ -902,6 +1052,7 @@ def build_slide_07_both_ai(prs):
     return slide
 
 
+@SLIDES.slide('08', "AI Nowadays", tags=('shift',))
 def build_slide_08_ai_nowadays(prs):
     """
     Yes, we all use AI nowadays...
@@ -954,6 +1105,7 @@ def build_slide_08_ai_nowadays(prs):
     return slide
 
 
+@SLIDES.slide('09', "Sink In", tags=('shift',))
 def build_slide_09_sink_in(prs):
     """
     Let that sink in for a second.
@@ -988,6 +1140,7 @@ def build_slide_09_sink_in(prs):
     return slide
 
 
+@SLIDES.slide('10', "Uncomfortable", tags=('shift',))
 def build_slide_10_uncomfortable(prs):
     """
     Now let me ask you something uncomfortable...
@@ -1025,6 +1178,7 @@ def build_slide_10_uncomfortable(prs):
     return slide
 
 
+@SLIDES.slide('11', "What Happens", tags=('shift', 'dark'))
 def build_slide_11_what_happens(prs):
     """
     If anyone can create designs like this in seconds...
@@ -1069,6 +1223,7 @@ def build_slide_11_what_happens(prs):
     return slide
 
 
+@SLIDES.slide('12', "Survey Intro", tags=('survey',))
 def build_slide_12_survey_intro(prs):
     """
     The numbers I'm about to show you aren't random...
@@ -1116,6 +1271,7 @@ def build_slide_12_survey_intro(prs):
     return slide
 
 
+@SLIDES.slide('13', "Stat 75+", tags=('survey', 'stat'))
 def build_slide_13_stat_75(prs):
     """
     75+ sellers report shops tanked
@@ -1183,6 +1339,7 @@ def build_slide_13_stat_75(prs):
     return slide
 
 
+@SLIDES.slide('14', "Stat 58+", tags=('survey', 'stat'))
 def build_slide_14_stat_58(prs):
     """
     58+ sellers said "No views anymore"
@@ -1264,6 +1421,7 @@ def build_slide_14_stat_58(prs):
     return slide
 
 
+@SLIDES.slide('15', "Stat 47+", tags=('survey', 'stat'))
 def build_slide_15_stat_47(prs):
     """
     47+ don't know what to design
@@ -1334,6 +1492,7 @@ def build_slide_15_stat_47(prs):
     return slide
 
 
+@SLIDES.slide('16', "Type YES", tags=('survey', 'interactive'))
 def build_slide_16_type_yes(prs):
     """
     Does anyone else feel that way? Type YES
@@ -1397,6 +1556,7 @@ def build_slide_16_type_yes(prs):
     return slide
 
 
+@SLIDES.slide('17', "Real Question", tags=('reframe',))
 def build_slide_17_real_question(prs):
     """
     The real question isn't "how do I make more listings?"
@@ -1460,6 +1620,7 @@ def build_slide_17_real_question(prs):
     return slide
 
 
+@SLIDES.slide('18', "Worth Pursuing", tags=('reframe', 'dark'))
 def build_slide_18_worth_pursuing(prs):
     """
     Is Etsy even worth pursuing in 2026?
@@ -1490,6 +1651,7 @@ def build_slide_18_worth_pursuing(prs):
     return slide
 
 
+@SLIDES.slide('19', "Answer Tonight", tags=('reframe',))
 def build_slide_19_answer_tonight(prs):
     """
     I'm going to answer that question tonight.
@@ -1532,6 +1694,7 @@ def build_slide_19_answer_tonight(prs):
     return slide
 
 
+@SLIDES.slide('20', "AI Opportunity", tags=('reframe', 'reveal'))
 def build_slide_20_ai_opportunity(prs):
     """
     The AI flood CREATES an opportunity
@@ -1609,8 +1772,14 @@ def build_slide_20_ai_opportunity(prs):
 # MAIN BUILD
 # =============================================================================
 
-def build_presentation():
-    """Build the premium editorial presentation"""
+def build_presentation(slides=None, scatter_seed=None):
+    """
+    Build the premium editorial presentation (slides: SLIDES.select() subset,
+    None = all; scatter_seed: seeded editorial backgrounds)
+    """
+    global SCATTER_SEED
+    SCATTER_SEED = scatter_seed
+    del FIT_WARNINGS[:]
     print("=" * 60)
     print("BAILEY VANN - THE 2026 ETSY RESET")
     print("Premium Editorial Slide Deck - Version 2")
@@ -1620,32 +1789,13 @@ def build_presentation():
     prs.slide_width = Inches(13.333)
     prs.slide_height = Inches(7.5)
 
-    builders = [
-        ("01", "Title", build_slide_01_title),
-        ("02", "Before We Begin", build_slide_02_before_begin),
-        ("03", "Get Ready Chat", build_slide_03_get_ready_chat),
-        ("04", "Quiz A/B", build_slide_04_quiz_ab),
-        ("05", "Type A or B", build_slide_05_type_ab),
-        ("06", "The Answer Is", build_slide_06_answer_is),
-        ("07", "Both AI", build_slide_07_both_ai),
-        ("08", "AI Nowadays", build_slide_08_ai_nowadays),
-        ("09", "Sink In", build_slide_09_sink_in),
-        ("10", "Uncomfortable", build_slide_10_uncomfortable),
-        ("11", "What Happens", build_slide_11_what_happens),
-        ("12", "Survey Intro", build_slide_12_survey_intro),
-        ("13", "Stat 75+", build_slide_13_stat_75),
-        ("14", "Stat 58+", build_slide_14_stat_58),
-        ("15", "Stat 47+", build_slide_15_stat_47),
-        ("16", "Type YES", build_slide_16_type_yes),
-        ("17", "Real Question", build_slide_17_real_question),
-        ("18", "Worth Pursuing", build_slide_18_worth_pursuing),
-        ("19", "Answer Tonight", build_slide_19_answer_tonight),
-        ("20", "AI Opportunity", build_slide_20_ai_opportunity),
-    ]
+    for slide in (SLIDES if slides is None else slides):
+        print(f"  Building Slide {slide.id}: {slide.name}...")
+        slide.builder(prs)
 
-    for num, name, builder in builders:
-        print(f"  Building Slide {num}: {name}...")
-        builder(prs)
+    for text, requested, fitted in FIT_WARNINGS:
+        first_line = text.split('\n')[0]
+        print(f"  WARNING: '{first_line}' overflows its box at {requested:g}pt (fits at {fitted:g}pt)")
 
     output = "/home/user/webby-slides-bailey/Bailey_Etsy_Reset_V2.pptx"
     prs.save(output)
@@ -1657,5 +1807,16 @@ def build_presentation():
     return output
 
 
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the Etsy Reset deck as PowerPoint")
+    parser.add_argument('--scatter-seed', type=int, metavar='N',
+                        help="scatter the editorial background blobs with this seed")
+    add_selection_args(parser)
+    args = parser.parse_args(argv)
+    args.selection = selected_slides(SLIDES, args, parser)
+    return args
+
+
 if __name__ == "__main__":
-    build_presentation()
+    args = parse_args()
+    build_presentation(args.selection, args.scatter_seed)
@@ -0,0 +1,297 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+DATA URI COMPACTOR for the hand-exported HTML decks
+
+The DAY 1/2/3 decks inline the same fonts and photos as base64 data URIs
+over and over.  This tool streams through every deck, moves each payload
+into a content-addressed asset store (assets/<sha256>.<ext>) and rewrites
+the reference, so each font or image is stored exactly once.
+
+- Streams in fixed-size chunks: a deck never has to fit in memory
+- Decks are processed in parallel (one process per deck)
+- Identical payloads across decks land in the same asset file
+- Prints an exact byte report (decks before/after + assets written)
+
+Usage:
+    python compact_decks.py                   # compacted copies in ./compacted
+    python compact_decks.py --in-place        # rewrite decks, assets beside them in assets/
+    python compact_decks.py "DAY 2 slides 1-37.html" --jobs 4
+
+Only --in-place leaves the decks usable as they are: the copies in
+./compacted link their own assets/, but their other relative references
+(<img src="photo.jpg">, url(...) outside data URIs) still point beside the
+original decks.  The copies are for measuring, or for moving back there.
+"""
+
+import os
+import re
+import glob
+import time
+import base64
+import hashlib
+import argparse
+import binascii
+from concurrent.futures import ProcessPoolExecutor
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+CHUNK_SIZE = 1 << 20          # bytes read from a deck at a time
+MIN_PAYLOAD_BYTES = 1024      # smaller data URIs stay inline (not worth a request)
+
+# data:<mime>;base64,   (bytes - decks are scanned without decoding them)
+DATA_URI_RE = re.compile(rb"data:([A-Za-z0-9.+-]+/[A-Za-z0-9.+-]+);base64,")
+MAX_PREFIX_LEN = 96           # longest "data:<mime>;base64," we look for
+BASE64_RUN_RE = re.compile(rb"[A-Za-z0-9+/=]*")
+
+MIME_EXTENSIONS = {
+    'font/truetype': 'ttf',
+    'font/ttf': 'ttf',
+    'font/otf': 'otf',
+    'font/woff': 'woff',
+    'font/woff2': 'woff2',
+    'application/font-woff': 'woff',
+    'application/x-font-ttf': 'ttf',
+    'image/jpeg': 'jpg',
+    'image/jpg': 'jpg',
+    'image/png': 'png',
+    'image/gif': 'gif',
+    'image/webp': 'webp',
+    'image/svg+xml': 'svg',
+}
+
+# =============================================================================
+# STREAMING PAYLOAD EXTRACTION
+# =============================================================================
+
+class _AssetWriter:
+    """
+    Decodes one base64 payload incrementally into the asset store.
+
+    The payload is held in memory until it passes MIN_PAYLOAD_BYTES; after
+    that it is decoded straight into a temp file while being hashed.
+    """
+
+    def __init__(self, asset_dir, mime, min_bytes):
+        self.asset_dir = asset_dir
+        self.mime = mime
+        self.min_bytes = min_bytes
+        self.pending = []         # raw base64 kept while the payload is small
+        self.pending_len = 0
+        self.carry = b""          # base64 tail not yet a multiple of 4
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.tmp_path = None
+        self.tmp_file = None
+
+    def feed(self, b64):
+        if self.tmp_file is None:
+            self.pending.append(b64)
+            self.pending_len += len(b64)
+            if self.pending_len * 3 // 4 < self.min_bytes:
+                return
+            b64 = b"".join(self.pending)
+            self.pending = None
+            self.tmp_path = os.path.join(self.asset_dir, f".tmp-{os.getpid()}-{id(self)}")
+            self.tmp_file = open(self.tmp_path, 'wb')
+        self._decode(b64)
+
+    def _decode(self, b64, final=False):
+        data = self.carry + b64
+        cut = len(data) if final else len(data) - len(data) % 4
+        self.carry = data[cut:]
+        if cut:
+            raw = base64.b64decode(data[:cut])
+            self.hasher.update(raw)
+            self.size += len(raw)
+            self.tmp_file.write(raw)
+
+    def finish(self):
+        """Return (reference, asset record) or (original base64, None) for small payloads"""
+        if self.tmp_file is None:
+            return b"".join(self.pending), None
+
+        self._decode(b"", final=True)
+        self.tmp_file.close()
+        digest = self.hasher.hexdigest()
+        ext = MIME_EXTENSIONS.get(self.mime.decode('ascii').lower(), 'bin')
+        name = f"{digest}.{ext}"
+        final_path = os.path.join(self.asset_dir, name)
+        if os.path.exists(final_path):
+            os.remove(self.tmp_path)
+        else:
+            os.replace(self.tmp_path, final_path)
+        return name.encode('ascii'), (name, self.size)
+
+    def abort(self):
+        if self.tmp_file is not None:
+            self.tmp_file.close()
+            os.remove(self.tmp_path)
+
+
+def compact_deck(src_path, dst_path, asset_dir, asset_href, min_bytes=MIN_PAYLOAD_BYTES):
+    """
+    Stream src_path to dst_path, replacing base64 data URIs with asset links.
+
+    asset_href is the asset directory as seen from dst_path (e.g. "assets").
+    Returns a dict with byte counts and the list of (asset name, size) used.
+    """
+    start = time.perf_counter()
+    assets = []
+    payloads = 0
+    tmp_dst = dst_path + ".tmp"
+    href_prefix = asset_href.rstrip('/').encode('utf-8') + b"/"
+
+    with open(src_path, 'rb') as src, open(tmp_dst, 'wb') as dst:
+        buf = b""
+        eof = False
+        writer = None   # set while inside a payload
+        prefix = b""    # the "data:...;base64," of the current payload
+
+        try:
+            while True:
+                # Always more than a prefix's worth buffered, so keeping
+                # MAX_PREFIX_LEN bytes back below still writes something
+                if not eof and len(buf) < max(CHUNK_SIZE, MAX_PREFIX_LEN + 1):
+                    chunk = src.read(CHUNK_SIZE)
+                    eof = not chunk
+                    buf += chunk
+
+                if writer is not None:
+                    # Inside a payload: take base64 characters up to the first other byte
+                    end = BASE64_RUN_RE.match(buf).end()
+                    at_edge = end == len(buf)
+                    writer.feed(buf[:end])
+                    buf = buf[end:]
+                    if at_edge and not eof:
+                        continue
+
+                    replacement, record = writer.finish()
+                    writer = None
+                    if record is None:
+                        dst.write(prefix + replacement)
+                    else:
+                        dst.write(href_prefix + replacement)
+                        assets.append(record)
+                        payloads += 1
+                    continue
+
+                match = DATA_URI_RE.search(buf)
+                if match is None:
+                    if eof:
+                        dst.write(buf)
+                        break
+                    # Keep a tail in case a data URI prefix straddles the chunk edge
+                    keep = min(len(buf), MAX_PREFIX_LEN)
+                    dst.write(buf[:len(buf) - keep])
+                    buf = buf[len(buf) - keep:]
+                    continue
+
+                dst.write(buf[:match.start()])
+                prefix = match.group(0)
+                writer = _AssetWriter(asset_dir, match.group(1), min_bytes)
+                buf = buf[match.end():]
+        except (binascii.Error, ValueError):
+            if writer is not None:
+                writer.abort()
+            dst.close()
+            os.remove(tmp_dst)
+            raise
+
+    os.replace(tmp_dst, dst_path)
+    return {
+        'deck': os.path.basename(src_path),
+        'payloads': payloads,
+        'assets': assets,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def _compact_job(job):
+    src_path, dst_path, asset_dir, asset_href, min_bytes = job
+    before = os.path.getsize(src_path)
+    result = compact_deck(src_path, dst_path, asset_dir, asset_href, min_bytes)
+    result['before'] = before
+    result['after'] = os.path.getsize(dst_path)
+    return result
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def discover_decks(root, exclude_dir=None):
+    decks = sorted(glob.glob(os.path.join(root, "*.html")))
+    if exclude_dir:
+        exclude_dir = os.path.abspath(exclude_dir)
+        decks = [d for d in decks if os.path.dirname(os.path.abspath(d)) != exclude_dir]
+    return decks
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Move base64 data URIs out of the HTML decks")
+    parser.add_argument('decks', nargs='*', help="decks to compact (default: every *.html in the project)")
+    parser.add_argument('--in-place', action='store_true',
+                        help="rewrite the decks themselves, assets go to assets/ beside each deck")
+    parser.add_argument('--out', default=os.path.join(BASE_PATH, "compacted"),
+                        help="output directory for compacted copies (ignored with --in-place); "
+                             "their relative links to other files only work beside the originals")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="decks processed in parallel")
+    parser.add_argument('--min-bytes', type=int, default=MIN_PAYLOAD_BYTES,
+                        help="payloads smaller than this stay inline")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("BAILEY VANN - DECK DATA URI COMPACTOR")
+    print("=" * 60)
+
+    out_dir = None if args.in_place else os.path.abspath(args.out)
+    decks = args.decks or discover_decks(BASE_PATH, exclude_dir=out_dir)
+    jobs = []
+    for deck in decks:
+        # --in-place rewrites each deck where it is, wherever that is
+        dst_dir = os.path.dirname(os.path.abspath(deck)) if out_dir is None else out_dir
+        asset_dir = os.path.join(dst_dir, "assets")
+        jobs.append((deck, os.path.join(dst_dir, os.path.basename(deck)), asset_dir, "assets",
+                     args.min_bytes))
+    existing_assets = set()
+    for asset_dir in {job[2] for job in jobs}:
+        os.makedirs(asset_dir, exist_ok=True)
+        existing_assets.update(os.path.join(asset_dir, name) for name in os.listdir(asset_dir))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = list(pool.map(_compact_job, jobs))
+    elapsed = time.perf_counter() - start
+
+    unique = {}     # asset path -> size
+    payload_bytes = 0
+    for job, r in zip(jobs, results):
+        print(f"  {r['deck']:<52} {r['before']:>11,} -> {r['after']:>9,} bytes "
+              f"({r['payloads']} payloads, {r['seconds']:.2f}s)")
+        for name, size in r['assets']:
+            unique[os.path.join(job[2], name)] = size
+            payload_bytes += size
+
+    decks_before = sum(r['before'] for r in results)
+    decks_after = sum(r['after'] for r in results)
+    new_assets = {n: s for n, s in unique.items() if n not in existing_assets}
+    asset_bytes = sum(new_assets.values())
+    saved = decks_before - decks_after - asset_bytes
+
+    print("-" * 60)
+    print(f"  Decks:          {decks_before:>13,} -> {decks_after:,} bytes")
+    print(f"  Payloads:       {sum(r['payloads'] for r in results):>13,} "
+          f"({payload_bytes:,} decoded bytes)")
+    print(f"  Unique assets:  {len(unique):>13,} ({sum(unique.values()):,} bytes, "
+          f"{len(new_assets)} new = {asset_bytes:,} bytes written)")
+    print(f"  Net saved:      {saved:>13,} bytes")
+    print(f"  Time:           {elapsed:>13.2f} s ({len(decks)} decks, {args.jobs} jobs)")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,422 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+CSS TREE-SHAKING - drop style rules and @font-face blocks a deck never uses
+
+Collects the elements, classes, ids and font families present in a deck's
+markup and removes every rule whose selector needs something that isn't
+there, every @font-face whose family nothing asks for and every
+@keyframes no animation names.  Smaller stylesheets, and fewer selectors
+for WeasyPrint's cascade to match against every element.
+
+    from css_prune import UsedNames, prune_css
+    used = UsedNames()
+    used.feed(slide_markup)            # as many times as needed
+    pruned = prune_css(css, used)
+    pruned.css, pruned.rules, pruned.kept, pruned.families
+
+Pruning is conservative: a class, id or family mentioned anywhere in a
+<script> or inline event handler is treated as used (the hand-made decks
+toggle classes like .open from JS), and selectors it can't reason about
+(escapes, namespaces, malformed preludes) are always kept.
+
+Usage on the hand-exported decks:
+    python css_prune.py                     # pruned copies in ./pruned
+    python css_prune.py --in-place
+    python css_prune.py "DAY 2 slides 1-37.html"
+"""
+
+import os
+import re
+import time
+import argparse
+from collections import namedtuple
+from html.parser import HTMLParser
+
+from compact_decks import discover_decks
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+
+# Present in every rendered document, even when the markup is a fragment
+IMPLIED_TAGS = {'html', 'head', 'body'}
+
+# At-rules holding ordinary style rules, pruned recursively
+GROUPING_RULES = {'media', 'supports', 'layer', 'container', 'document'}
+
+PruneResult = namedtuple('PruneResult', 'css rules kept families')
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_LEAD_RE = re.compile(r'(?:\s+|/\*.*?\*/)*', re.S)
+_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'')
+_WORD_RE = re.compile(r'[\w-]+')
+
+_ATTR_SELECTOR_RE = re.compile(r'\[[^\]]*\]')
+_PSEUDO_FN_RE = re.compile(r'::?[\w-]+\([^()]*\)')
+_PSEUDO_RE = re.compile(r'::?[\w-]+')
+_CLASS_RE = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+_ID_RE = re.compile(r'#(-?[_a-zA-Z][\w-]*)')
+_TYPE_RE = re.compile(r'(?:^|[\s>+~])([a-zA-Z][\w-]*)')
+
+_FONT_DECL_RE = re.compile(r'font(?:-family)?\s*:\s*([^;{}]+)', re.I)
+_FACE_FAMILY_RE = re.compile(r'font-family\s*:\s*([^;}]+)', re.I)
+_KEYFRAMES_NAME_RE = re.compile(r'@[\w-]*keyframes\s+([^\s{]+)', re.I)
+
+
+class UsedNames(HTMLParser):
+    """Elements, classes, ids, inline styles and script text found in markup"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.tags = set(IMPLIED_TAGS)
+        self.classes = set()
+        self.ids = set()
+        self.families = set()    # lower-case families named by style/font-family attributes
+        self.inline_css = []     # style attribute values
+        self.scripts = []        # <script> bodies and inline event handlers
+        self.script_words = set()
+        self._raw = None
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag.lower())
+        for name, value in attrs:
+            if value is None:
+                continue
+            if name == 'class':
+                self.classes.update(value.split())
+            elif name == 'id':
+                self.ids.add(value)
+            elif name == 'style':
+                self.inline_css.append(value)
+                for match in _FONT_DECL_RE.finditer(value):
+                    self.families |= _family_names(match.group(1))
+            elif name == 'font-family':
+                self.families |= _family_names(value)
+            elif name.startswith('on'):
+                self.scripts.append(value)
+                self.script_words.update(_WORD_RE.findall(value))
+        if tag in ('style', 'script'):
+            self._raw = tag
+
+    def handle_endtag(self, tag):
+        if tag == self._raw:
+            self._raw = None
+
+    def handle_data(self, data):
+        if self._raw == 'script':
+            self.scripts.append(data)
+            self.script_words.update(_WORD_RE.findall(data))
+
+    def has(self, kind, name):
+        if kind == 'tag':
+            return name.lower() in self.tags or name in self.script_words
+        found = self.classes if kind == 'class' else self.ids
+        return name in found or name in self.script_words
+
+
+def _family_names(value):
+    """Lower-case family names in a font-family list or font shorthand value"""
+    names = set()
+    for item in value.split(','):
+        item = item.replace('!important', '').strip()
+        quoted = _STRING_RE.search(item)
+        if quoted:
+            names.add(quoted.group(0)[1:-1].strip().lower())
+            continue
+        # "bold 20px Ogg Text": the family is some suffix of the words
+        words = item.split()
+        for i in range(len(words)):
+            names.add(" ".join(words[i:]).lower())
+    return names
+
+# =============================================================================
+# PARSING
+# =============================================================================
+
+def _skip_string(css, i):
+    quote = css[i]
+    i += 1
+    while i < len(css) and css[i] != quote:
+        i += 2 if css[i] == '\\' else 1
+    return i + 1
+
+
+def _scan(css, i, stops):
+    """Index of the first char in stops at paren depth 0, skipping strings and comments"""
+    depth = 0
+    n = len(css)
+    while i < n:
+        c = css[i]
+        if c in '"\'':
+            i = _skip_string(css, i)
+            continue
+        if c == '/' and css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            i = n if end < 0 else end + 2
+            continue
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif depth <= 0 and c in stops:
+            return i
+        i += 1
+    return n
+
+
+def _block_end(css, i):
+    """Index just past the '}' closing the '{' at i"""
+    depth = 0
+    while i < len(css):
+        i = _scan(css, i, '{}')
+        if i >= len(css):
+            break
+        depth += 1 if css[i] == '{' else -1
+        i += 1
+        if depth == 0:
+            break
+    return i
+
+
+def split_statements(css):
+    """
+    Top-level statements of css as [lead, prelude, block] lists, plus the
+    trailing text.  lead is the whitespace/comments before the statement,
+    block the '{...}' part (None for '@import ...;' style statements).
+    """
+    statements = []
+    i = 0
+    n = len(css)
+    while True:
+        start = _LEAD_RE.match(css, i).end()
+        lead = css[i:start]
+        if start >= n:
+            return statements, lead
+        stops = '{;}' if css[start] == '@' else '{}'
+        k = _scan(css, start, stops)
+        if k >= n or css[k] != '{':
+            # ';'-terminated at-rule, stray '}' or unterminated tail: keep verbatim
+            end = min(k + 1, n)
+            statements.append([lead, css[start:end], None])
+            i = end
+            continue
+        end = _block_end(css, k)
+        statements.append([lead, css[start:k], css[k:end]])
+        i = end
+
+
+def split_selectors(prelude):
+    """Comma-separated selectors of a rule prelude (commas inside () and [] kept)"""
+    selectors = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(prelude):
+        c = prelude[i]
+        if c in '"\'':
+            i = _skip_string(prelude, i)
+            continue
+        if c in '([':
+            depth += 1
+        elif c in ')]':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            selectors.append(prelude[start:i].strip())
+            start = i + 1
+        i += 1
+    selectors.append(prelude[start:].strip())
+    return selectors
+
+# =============================================================================
+# PRUNING
+# =============================================================================
+
+def selector_matches_something(selector, used):
+    """False only when selector needs an element, class or id absent from used"""
+    if any(c in selector for c in '\\|;{}'):
+        return True
+    s = _ATTR_SELECTOR_RE.sub('', _STRING_RE.sub('', selector))
+    previous = None
+    while previous != s:
+        previous = s
+        s = _PSEUDO_FN_RE.sub('', s)
+    s = _PSEUDO_RE.sub('', s)
+    return (all(used.has('class', name) for name in _CLASS_RE.findall(s)) and
+            all(used.has('id', name) for name in _ID_RE.findall(s)) and
+            all(used.has('tag', name) for name in _TYPE_RE.findall(s)))
+
+
+def _at_keyword(prelude):
+    return _WORD_RE.match(prelude, 1).group(0).lower() if len(prelude) > 1 else ''
+
+
+def _prune_rules(statements, used, counts, deferred=None):
+    """
+    Drop dead style rules; top-level @font-face / @keyframes go to deferred
+    (nested ones are kept).  counts is [rules seen, rules kept].
+    """
+    kept = []
+    for statement in statements:
+        lead, prelude, block = statement
+        if block is None:
+            kept.append(statement)
+            continue
+        if prelude.startswith('@'):
+            keyword = _at_keyword(prelude)
+            if keyword in GROUPING_RULES:
+                inner, tail = split_statements(block[1:-1])
+                inner = _prune_rules(inner, used, counts)
+                if not inner:
+                    continue
+                statement[2] = "{" + _join(inner, tail) + "}"
+            elif keyword == 'font-face' or keyword.endswith('keyframes'):
+                counts[0] += 1
+                if deferred is None:
+                    counts[1] += 1
+                else:
+                    deferred.append(statement)
+            kept.append(statement)
+            continue
+
+        counts[0] += 1
+        selectors = split_selectors(_COMMENT_RE.sub('', prelude))
+        alive = [s for s in selectors if selector_matches_something(s, used)]
+        if not alive:
+            continue
+        if len(alive) < len(selectors):
+            statement[1] = ",\n".join(alive) + " "
+        counts[1] += 1
+        kept.append(statement)
+    return kept
+
+
+def _join(statements, tail=""):
+    return "".join(lead + prelude + (block or "") for lead, prelude, block in statements) + tail
+
+
+def prune_stylesheets(sheets, used):
+    """
+    Prune several stylesheets of one document together (a @font-face in one
+    may serve rules in another).  Returns one PruneResult per sheet;
+    families is the same document-wide set in each.
+    """
+    parsed = []
+    deferred = []
+    counts_per_sheet = []
+    for css in sheets:
+        counts = [0, 0]
+        statements, tail = split_statements(css)
+        parsed.append((_prune_rules(statements, used, counts, deferred), tail))
+        counts_per_sheet.append(counts)
+
+    # What the surviving rules and the markup ask for
+    deferred_ids = {id(s) for s in deferred}
+    live_css = "".join(_join([s for s in statements if id(s) not in deferred_ids])
+                       for statements, _ in parsed)
+    families = set(used.families)
+    for match in _FONT_DECL_RE.finditer(_COMMENT_RE.sub('', live_css)):
+        families |= _family_names(match.group(1))
+    animation_text = live_css + " ".join(used.inline_css)
+    script_text = " ".join(used.scripts).lower()
+
+    dropped = set()
+    for statement in deferred:
+        lead, prelude, block = statement
+        if _at_keyword(prelude) == 'font-face':
+            match = _FACE_FAMILY_RE.search(block)
+            family = match and _STRING_RE.sub(lambda m: m.group(0)[1:-1], match.group(1)).strip().lower()
+            if not family or family in families or family in script_text:
+                continue
+        else:
+            match = _KEYFRAMES_NAME_RE.match(prelude)
+            name = match and match.group(1).strip('"\'')
+            if (not name or name in used.script_words or
+                    re.search(r'(?<![\w-])' + re.escape(name) + r'(?![\w-])', animation_text)):
+                continue
+        dropped.add(id(statement))
+
+    results = []
+    for (statements, tail), counts in zip(parsed, counts_per_sheet):
+        kept = [s for s in statements if id(s) not in dropped]
+        survivors = sum(1 for s in statements if id(s) in deferred_ids and id(s) not in dropped)
+        results.append(PruneResult(_join(kept, tail), counts[0], counts[1] + survivors, families))
+    return results
+
+
+def prune_css(css, used):
+    """Drop the rules of css that can't match the markup fed to used (see PruneResult)"""
+    return prune_stylesheets([css], used)[0]
+
+
+_STYLE_BLOCK_RE = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.S | re.I)
+
+
+def prune_html(html):
+    """(html with every <style> block pruned against its own markup, rules before, rules kept)"""
+    used = UsedNames()
+    used.feed(html)
+    used.close()
+    blocks = list(_STYLE_BLOCK_RE.finditer(html))
+    results = prune_stylesheets([m.group(2) for m in blocks], used)
+
+    out = []
+    pos = 0
+    for match, result in zip(blocks, results):
+        out.append(html[pos:match.start(2)])
+        out.append(result.css)
+        pos = match.end(2)
+    out.append(html[pos:])
+    return "".join(out), sum(r.rules for r in results), sum(r.kept for r in results)
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Drop unused CSS rules and fonts from the HTML decks")
+    parser.add_argument('decks', nargs='*', help="decks to prune (default: every *.html in the project)")
+    parser.add_argument('--in-place', action='store_true', help="rewrite the decks themselves")
+    parser.add_argument('--out', default=os.path.join(BASE_PATH, "pruned"),
+                        help="output directory for pruned decks (ignored with --in-place)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("BAILEY VANN - DECK CSS TREE-SHAKING")
+    print("=" * 60)
+
+    out_dir = None if args.in_place else os.path.abspath(args.out)
+    if out_dir is not None:
+        os.makedirs(out_dir, exist_ok=True)
+    decks = args.decks or discover_decks(BASE_PATH, exclude_dir=out_dir)
+
+    start = time.perf_counter()
+    total_before = total_after = 0
+    for deck in decks:
+        with open(deck, encoding='utf-8') as f:
+            html = f.read()
+        pruned, rules, kept = prune_html(html)
+        # --in-place rewrites each deck where it is, wherever that is
+        dst_dir = os.path.dirname(os.path.abspath(deck)) if out_dir is None else out_dir
+        dst_path = os.path.join(dst_dir, os.path.basename(deck))
+        tmp_path = dst_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(pruned)
+        os.replace(tmp_path, dst_path)
+
+        before = len(html.encode('utf-8'))
+        after = len(pruned.encode('utf-8'))
+        total_before += before
+        total_after += after
+        print(f"  {os.path.basename(deck):<52} {before:>11,} -> {after:>11,} bytes "
+              f"({kept}/{rules} rules kept)")
+
+    print("-" * 60)
+    print(f"  Decks: {total_before:,} -> {total_after:,} bytes "
+          f"({total_before - total_after:,} saved) in {time.perf_counter() - start:.2f}s")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
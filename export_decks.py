@@ -0,0 +1,260 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+BATCH PDF EXPORT for the hand-exported HTML decks (replaces convert-to-pdf.js)
+
+Finds every deck in the project (Day 1, 2 and 3 alike), skips the ones
+whose PDF is newer than the deck and every local file it references
+(fonts, photos), and converts the rest on a bounded pool of worker
+processes, each keeping one warm PDF backend (see pdf_backends.py:
+wkhtmltopdf by default, weasyprint or chromium with --backend).
+
+- Each worker gets one batch of decks, rendered with render_many() (a
+  single wkhtmltopdf process for the whole batch)
+- Batches are balanced on the timings from the previous export (file
+  size for decks never exported), so one big deck does not run alone at
+  the end
+- Each PDF is written to a temp file and moved into place, so an
+  interrupted export never leaves a truncated PDF that looks up to date
+- Prints a per-deck timing summary (optionally saved as CSV)
+
+Usage:
+    python export_decks.py                         # stale decks, one worker per CPU
+    python export_decks.py --force --jobs 4        # re-export everything on 4 workers
+    python export_decks.py "DAY 2 slides 1-37.html" --summary export_times.csv
+    python export_decks.py --backend chromium
+"""
+
+import os
+import re
+import csv
+import json
+import time
+import argparse
+import urllib.parse
+from multiprocessing.util import Finalize
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from compact_decks import discover_decks
+from pdf_backends import BACKENDS, get_backend
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(BASE_PATH, ".build_cache")
+TIMINGS_PATH = os.path.join(CACHE_DIR, "export_times.json")
+
+# Written by build_slides_html.py, which renders its own PDF
+GENERATED_DECKS = {'slides_preview.html'}
+
+# src="..." / href="..." / url(...) - candidates for local assets
+LOCAL_REF_RE = re.compile(rb"""(?:src|href)\s*=\s*["']([^"'#?]+)|url\(\s*["']?([^"')#?]+)""")
+REMOTE_PREFIXES = (b'data:', b'http:', b'https:', b'//', b'mailto:', b'javascript:')
+
+# =============================================================================
+# STALENESS
+# =============================================================================
+
+def pdf_path_for(deck):
+    return os.path.splitext(deck)[0] + ".pdf"
+
+
+def local_assets(deck):
+    """Existing local files a deck references (fonts, images, stylesheets)"""
+    with open(deck, 'rb') as f:
+        data = f.read()
+    root = os.path.dirname(os.path.abspath(deck))
+    assets = set()
+    for src, url in LOCAL_REF_RE.findall(data):
+        ref = (src or url).strip()
+        if not ref or ref.startswith(REMOTE_PREFIXES):
+            continue
+        path = os.path.join(root, urllib.parse.unquote(ref.decode('utf-8', 'replace')))
+        if os.path.isfile(path):
+            assets.add(path)
+    return assets
+
+
+def stale_reason(deck, pdf_path):
+    """Why the deck needs exporting, or None when its PDF is up to date"""
+    if not os.path.exists(pdf_path):
+        return "no PDF"
+    pdf_mtime = os.path.getmtime(pdf_path)
+    if os.path.getmtime(deck) > pdf_mtime:
+        return "deck changed"
+    for asset in sorted(local_assets(deck)):
+        if os.path.getmtime(asset) > pdf_mtime:
+            return f"{os.path.basename(asset)} changed"
+    return None
+
+# =============================================================================
+# CONVERSION
+# =============================================================================
+
+_backend = None  # the warm backend of a worker process
+
+
+def _start_worker(backend_name):
+    """Pool initializer: open one backend per worker, closed when the worker exits"""
+    global _backend
+    _backend = get_backend(backend_name).open()
+    Finalize(_backend, _backend.close, exitpriority=10)
+
+
+def convert_batch(pairs):
+    """
+    Worker: [(deck, pdf_path), ...] -> PDFs on the warm backend in one
+    render_many() call (one wkhtmltopdf process for the whole batch);
+    returns {deck: (seconds, error or None)}.  Whatever goes wrong is
+    reported as failed decks, so the export still writes its summary.
+    """
+    start = time.perf_counter()
+    try:
+        return _backend.render_many(pairs)
+    except Exception as e:  # e.g. OSError starting wkhtmltopdf
+        return _failed_batch(pairs, time.perf_counter() - start, e)
+
+
+def _failed_batch(pairs, seconds, error):
+    """Every deck of a batch failed with one error (its time split evenly)"""
+    error = f"{type(error).__name__}: {error}"
+    return {deck: (seconds / len(pairs), error) for deck, _ in pairs}
+
+
+def load_timings():
+    """{backend: {deck name: seconds}} from the previous exports"""
+    try:
+        with open(TIMINGS_PATH, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_timings(timings):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = TIMINGS_PATH + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(timings, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, TIMINGS_PATH)
+
+
+def schedule(decks, timings):
+    """Longest first: decks never exported (largest first), then by last export time"""
+    def key(deck):
+        seconds = timings.get(os.path.basename(deck))
+        return (seconds is None, seconds or 0.0, os.path.getsize(deck))
+    return sorted(decks, key=key, reverse=True)
+
+
+def plan_batches(decks, timings, jobs):
+    """
+    Split the decks into at most `jobs` batches of about equal expected time,
+    one per worker: each deck, longest first, joins the lightest batch.
+    Decks never exported are estimated from their size at the seconds per
+    byte of the ones that were (or by size alone when none were).
+    """
+    known = [(timings[os.path.basename(d)], os.path.getsize(d))
+             for d in decks if os.path.basename(d) in timings]
+    rate = sum(s for s, _ in known) / (sum(b for _, b in known) or 1) if known else 1.0
+    batches = [[0.0, []] for _ in range(max(1, min(jobs, len(decks))))]
+    for deck in schedule(decks, timings):
+        seconds = timings.get(os.path.basename(deck))
+        batch = min(batches, key=lambda b: b[0])
+        batch[0] += os.path.getsize(deck) * rate if seconds is None else seconds
+        batch[1].append(deck)
+    return [batch for _, batch in batches if batch]
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Export the HTML decks to PDF")
+    parser.add_argument('decks', nargs='*', help="decks to export (default: every *.html in the project)")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="decks converted in parallel")
+    parser.add_argument('--force', action='store_true', help="export even up-to-date decks")
+    parser.add_argument('--summary', metavar='CSV', help="also write the per-deck timings to this file")
+    parser.add_argument('--backend', choices=sorted(BACKENDS), default='wkhtmltopdf',
+                        help="PDF renderer (default wkhtmltopdf)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    print("=" * 60)
+    print("BAILEY VANN - DECK PDF EXPORT")
+    print("=" * 60)
+
+    decks = args.decks or [d for d in discover_decks(BASE_PATH)
+                           if os.path.basename(d) not in GENERATED_DECKS]
+    results = {}
+    todo = []
+    for deck in decks:
+        reason = "forced" if args.force else stale_reason(deck, pdf_path_for(deck))
+        if reason is None:
+            results[deck] = {'status': "up to date", 'seconds': 0.0}
+        else:
+            todo.append(deck)
+            results[deck] = {'status': reason, 'seconds': 0.0}
+    print(f"  {len(decks)} decks, {len(todo)} to export, {len(decks) - len(todo)} up to date")
+
+    if todo and not BACKENDS[args.backend].available():
+        print(f"  {args.backend} not installed - nothing exported")
+        return
+
+    all_timings = load_timings()
+    timings = all_timings.setdefault(args.backend, {})
+    jobs = max(1, min(args.jobs, len(todo) or 1))
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_start_worker,
+                             initargs=(args.backend,)) as pool:
+        futures = {}
+        for batch in plan_batches(todo, timings, jobs):
+            pairs = [(deck, pdf_path_for(deck)) for deck in batch]
+            futures[pool.submit(convert_batch, pairs)] = pairs
+        for future in as_completed(futures):
+            try:
+                batch_results = future.result()
+            except Exception as e:  # the worker itself died (BrokenProcessPool)
+                batch_results = _failed_batch(futures[future], 0.0, e)
+            for deck, (seconds, error) in batch_results.items():
+                name = os.path.basename(deck)
+                if error is None:
+                    results[deck] = {'status': "exported", 'seconds': seconds,
+                                     'bytes': os.path.getsize(pdf_path_for(deck))}
+                    timings[name] = round(seconds, 3)
+                    print(f"  Created: {os.path.basename(pdf_path_for(deck))} ({seconds:.2f}s)")
+                else:
+                    results[deck] = {'status': "failed", 'seconds': seconds, 'error': error}
+                    print(f"  Error converting {name}: {error}")
+    elapsed = time.perf_counter() - start
+    if todo:
+        save_timings(all_timings)
+
+    print("-" * 60)
+    for deck in decks:
+        r = results[deck]
+        print(f"  {os.path.basename(deck):<52} {r['status']:<12} {r['seconds']:>7.2f}s "
+              f"{r.get('bytes', 0):>12,}")
+    exported = [r for r in results.values() if r['status'] == "exported"]
+    failed = [r for r in results.values() if r['status'] == "failed"]
+    busy = sum(r['seconds'] for r in results.values())
+    print("-" * 60)
+    print(f"  Exported:   {len(exported)}, failed: {len(failed)}, "
+          f"up to date: {len(decks) - len(todo)}")
+    print(f"  Time:       {elapsed:.2f}s wall, {busy:.2f}s of {args.backend} conversions on {jobs} workers "
+          f"({busy / elapsed if elapsed else 0:.1f}x)")
+
+    if args.summary:
+        with open(args.summary, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['deck', 'status', 'seconds', 'bytes', 'error'])
+            for deck in decks:
+                r = results[deck]
+                writer.writerow([os.path.basename(deck), r['status'], f"{r['seconds']:.3f}",
+                                 r.get('bytes', ''), r.get('error', '')])
+        print(f"  Summary:    {args.summary}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
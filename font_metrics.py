@@ -0,0 +1,291 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+FONT METRICS - real text measurement without a render round-trip
+
+Advance widths and pair kerning of the Ogg / Satoshi files are read once
+with fontTools, packed into compact arrays and cached on disk, so later
+builds measure strings in microseconds with no font parsing at all.
+
+    from font_metrics import measure_text
+    measure_text("QUICK POP QUIZ", 'Ogg Text Medium', 11)   # -> width in pt
+
+Units follow the size you pass: pt in, pt out; px in, px out.
+"""
+
+import os
+import array
+import pickle
+import hashlib
+from bisect import bisect_left
+
+try:
+    from fontTools.ttLib import TTFont
+    from fontTools.varLib import instancer
+except ImportError:  # measuring then only works from an existing disk cache
+    TTFont = None
+    instancer = None
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+METRICS_CACHE_DIR = os.path.join(BASE_PATH, ".build_cache", "metrics")
+METRICS_CACHE_VERSION = 2
+
+# Family name (as used in the CSS / design system) -> font file
+FONT_FILES = {
+    'Ogg Bold': 'Ogg Bold Font.ttf',
+    'Ogg Medium': 'Ogg Medium Font.ttf',
+    'Ogg Light': 'Ogg Light Font.ttf',
+    'Ogg Text': 'Ogg Text Book.ttf',
+    'Ogg Text Medium': 'Ogg Text Medium.ttf',
+    'Ogg Text Extrabold': 'Ogg Text Extrabold.ttf',
+    'Satoshi': 'Satoshi-Variable.ttf',
+}
+
+# Families whose metrics depend on the requested weight
+VARIABLE_FONTS = {'Satoshi'}
+
+# Codepoints below this live in a dense array; the rest in a small dict
+DENSE_LIMIT = 0x250
+
+
+class MetricsUnavailable(RuntimeError):
+    """Raised when a font has no cached metrics and fontTools is not installed"""
+
+
+class FontMetrics:
+    """Advance widths + pair kerning of one font (at one weight), in font units"""
+
+    __slots__ = ('units_per_em', 'advances', 'extra', 'kern_pairs', 'kern_values',
+                 'missing', 'vertical')
+
+    def __init__(self, units_per_em, advances, extra, kern_pairs, kern_values, missing, vertical):
+        self.units_per_em = units_per_em
+        self.advances = advances      # array('H'), index = codepoint < DENSE_LIMIT
+        self.extra = extra            # {codepoint: advance} for everything else
+        self.kern_pairs = kern_pairs  # array('Q') of sorted (left << 21) | right
+        self.kern_values = kern_values  # array('h') of adjustments, same order
+        self.missing = missing        # .notdef advance for unmapped characters
+        self.vertical = vertical      # (ascent, descent, line gap) from hhea
+
+    def kerning(self, left, right):
+        """Pair kerning adjustment between two codepoints (0 if none)"""
+        pairs = self.kern_pairs
+        key = (left << 21) | right
+        i = bisect_left(pairs, key)
+        if i < len(pairs) and pairs[i] == key:
+            return self.kern_values[i]
+        return 0
+
+    def advance(self, cp):
+        if cp < DENSE_LIMIT:
+            return self.advances[cp]
+        return self.extra.get(cp, self.missing)
+
+    def measure(self, text, size, letter_spacing=0.0):
+        """Width of a single line of text set at size (same unit back)"""
+        advances = self.advances
+        extra = self.extra
+        pairs = self.kern_pairs
+        values = self.kern_values
+        count = len(pairs)
+        missing = self.missing
+
+        total = 0
+        prev = -1
+        for ch in text:
+            cp = ord(ch)
+            if cp < DENSE_LIMIT:
+                total += advances[cp]
+            else:
+                total += extra.get(cp, missing)
+            if prev >= 0 and count:
+                key = (prev << 21) | cp
+                i = bisect_left(pairs, key)
+                if i < count and pairs[i] == key:
+                    total += values[i]
+            prev = cp
+
+        return total * size / self.units_per_em + letter_spacing * len(text)
+
+    def line_height(self, size):
+        """Default line box height (ascent - descent + gap) at size"""
+        ascent, descent, line_gap = self.vertical
+        return (ascent - descent + line_gap) * size / self.units_per_em
+
+    def to_bytes(self):
+        return pickle.dumps((METRICS_CACHE_VERSION, self.units_per_em, self.advances.tobytes(),
+                             self.extra, self.kern_pairs.tobytes(), self.kern_values.tobytes(),
+                             self.missing, self.vertical),
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data):
+        version, upem, advances, extra, kern_pairs, kern_values, missing, vertical = pickle.loads(data)
+        if version != METRICS_CACHE_VERSION:
+            raise ValueError("stale metrics cache")
+        tables = [array.array('H'), array.array('Q'), array.array('h')]
+        for table, raw in zip(tables, (advances, kern_pairs, kern_values)):
+            table.frombytes(raw)
+        return cls(upem, tables[0], extra, tables[1], tables[2], missing, vertical)
+
+# =============================================================================
+# EXTRACTION (fontTools, only on a cache miss)
+# =============================================================================
+
+def _pair_lookups(font):
+    """Yield the PairPos subtables of the font's kern feature"""
+    if 'GPOS' not in font or font['GPOS'].table.LookupList is None:
+        return
+    gpos = font['GPOS'].table
+    kern_lookups = set()
+    if gpos.FeatureList is not None:
+        for record in gpos.FeatureList.FeatureRecord:
+            if record.FeatureTag == 'kern':
+                kern_lookups.update(record.Feature.LookupListIndex)
+
+    for i, lookup in enumerate(gpos.LookupList.Lookup):
+        if i not in kern_lookups:
+            continue
+        for subtable in lookup.SubTable:
+            if lookup.LookupType == 9:  # Extension
+                subtable = subtable.ExtSubTable
+            if subtable.LookupType == 2:
+                yield subtable
+
+
+def _x_advance(value_record):
+    if value_record is None:
+        return 0
+    return getattr(value_record, 'XAdvance', 0) or 0
+
+
+def _extract_kerning(font, glyph_to_cps):
+    """Flatten GPOS pair kerning to {(left_cp << 21) | right_cp: value} for mapped glyphs"""
+    kerning = {}
+    for subtable in _pair_lookups(font):
+        coverage = subtable.Coverage.glyphs
+
+        if subtable.Format == 1:
+            for first, pair_set in zip(coverage, subtable.PairSet):
+                for left in glyph_to_cps.get(first, ()):
+                    for record in pair_set.PairValueRecord:
+                        value = _x_advance(record.Value1)
+                        if not value:
+                            continue
+                        for right in glyph_to_cps.get(record.SecondGlyph, ()):
+                            kerning.setdefault((left << 21) | right, value)
+
+        elif subtable.Format == 2:
+            class1 = subtable.ClassDef1.classDefs
+            class2 = subtable.ClassDef2.classDefs
+            seconds = {}
+            for glyph, cps in glyph_to_cps.items():
+                seconds.setdefault(class2.get(glyph, 0), []).extend(cps)
+            for first in coverage:
+                row = subtable.Class1Record[class1.get(first, 0)].Class2Record
+                for left in glyph_to_cps.get(first, ()):
+                    for c2, record in enumerate(row):
+                        value = _x_advance(record.Value1)
+                        if not value:
+                            continue
+                        for right in seconds.get(c2, ()):
+                            kerning.setdefault((left << 21) | right, value)
+
+    # Legacy 'kern' table for fonts without GPOS kerning
+    if not kerning and 'kern' in font:
+        for table in font['kern'].kernTables:
+            for (left_glyph, right_glyph), value in table.kernTable.items():
+                for left in glyph_to_cps.get(left_glyph, ()):
+                    for right in glyph_to_cps.get(right_glyph, ()):
+                        kerning[(left << 21) | right] = value
+    return kerning
+
+
+def pack_kerning(kerning):
+    """{pair key: value} -> (array('Q') of sorted pair keys, array('h') of their values)"""
+    keys = sorted(kerning)
+    return array.array('Q', keys), array.array('h', [kerning[key] for key in keys])
+
+
+def extract_metrics(font_path, weight=None):
+    """Read metrics straight from a font file (pins variable fonts to weight)"""
+    if TTFont is None:
+        raise MetricsUnavailable(f"fontTools is needed to read {os.path.basename(font_path)}")
+
+    font = TTFont(font_path)
+    if weight is not None and 'fvar' in font:
+        axis = next(a for a in font['fvar'].axes if a.axisTag == 'wght')
+        weight = min(max(weight, axis.minValue), axis.maxValue)
+        font = instancer.instantiateVariableFont(font, {'wght': weight})
+
+    hmtx = font['hmtx'].metrics
+    cmap = font.getBestCmap()
+    missing = hmtx['.notdef'][0] if '.notdef' in hmtx else font['hhea'].advanceWidthMax // 2
+
+    advances = array.array('H', [missing] * DENSE_LIMIT)
+    extra = {}
+    glyph_to_cps = {}
+    for cp, glyph in cmap.items():
+        width = hmtx[glyph][0]
+        if cp < DENSE_LIMIT:
+            advances[cp] = width
+        else:
+            extra[cp] = width
+        glyph_to_cps.setdefault(glyph, []).append(cp)
+
+    hhea = font['hhea']
+    kern_pairs, kern_values = pack_kerning(_extract_kerning(font, glyph_to_cps))
+    return FontMetrics(font['head'].unitsPerEm, advances, extra, kern_pairs, kern_values,
+                       missing, (hhea.ascent, hhea.descent, hhea.lineGap))
+
+# =============================================================================
+# CACHED ACCESS
+# =============================================================================
+
+_loaded = {}
+
+
+def _cache_path(font_path, weight):
+    st = os.stat(font_path)
+    key = f"{os.path.basename(font_path)}|{st.st_size}|{st.st_mtime_ns}|{weight}|{METRICS_CACHE_VERSION}"
+    return os.path.join(METRICS_CACHE_DIR, hashlib.sha256(key.encode('utf-8')).hexdigest()[:32] + ".bin")
+
+
+def get_metrics(font_name, weight=None):
+    """
+    Metrics for a FONT_FILES family, memoized per process and cached on disk.
+
+    weight only matters for VARIABLE_FONTS (None = the font's default
+    instance); static fonts ignore it.
+    """
+    if font_name not in VARIABLE_FONTS:
+        weight = None
+    memo_key = (font_name, weight)
+    metrics = _loaded.get(memo_key)
+    if metrics is not None:
+        return metrics
+
+    font_path = os.path.join(BASE_PATH, FONT_FILES[font_name])
+    cache_path = _cache_path(font_path, weight)
+    try:
+        with open(cache_path, 'rb') as f:
+            metrics = FontMetrics.from_bytes(f.read())
+    except (OSError, ValueError, TypeError, pickle.UnpicklingError):
+        metrics = extract_metrics(font_path, weight)
+        os.makedirs(METRICS_CACHE_DIR, exist_ok=True)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(metrics.to_bytes())
+        os.replace(tmp_path, cache_path)
+
+    _loaded[memo_key] = metrics
+    return metrics
+
+
+def measure_text(text, font_name, size, weight=None, letter_spacing=0.0):
+    """Width of one line of text in font_name at size (pt -> pt, px -> px)"""
+    return get_metrics(font_name, weight).measure(text, size, letter_spacing)
+
+
+def line_height(font_name, size, weight=None):
+    """Default line box height of font_name at size"""
+    return get_metrics(font_name, weight).line_height(size)
@@ -0,0 +1,256 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+PDF BACKENDS - one interface over WeasyPrint, wkhtmltopdf and headless Chromium
+
+Every backend is opened once and then renders any number of HTML files,
+keeping whatever is expensive to start warm between them:
+
+- weasyprint:  in-process; one FontConfiguration per distinct @font-face
+               set (pdf_render.FontSets), so files sharing their fonts
+               load and index them once and no deck sees another's faces
+- wkhtmltopdf: render_many() converts a whole batch in one wkhtmltopdf
+               process (--read-args-from-stdin); render() is one process
+               per file
+- chromium:    a locally installed Chromium driven through Playwright; the
+               browser and one page are reused for every file.  Without the
+               playwright package, falls back to one `chromium --headless
+               --print-to-pdf` process per file
+
+    from pdf_backends import get_backend
+    with get_backend('chromium') as backend:
+        for deck in decks:
+            backend.render(deck, deck[:-5] + ".pdf")
+
+PDFs are written to a temp file and moved into place, as everywhere else.
+"""
+
+import os
+import time
+import shutil
+import tempfile
+import subprocess
+import urllib.request
+
+try:
+    from weasyprint import HTML
+    from pdf_render import FontSets, split_font_faces
+except (ImportError, OSError):  # OSError: pango / cairo libraries missing
+    HTML = None
+
+try:
+    from playwright.sync_api import sync_playwright
+except ImportError:  # chromium falls back to one CLI process per file
+    sync_playwright = None
+
+# Landscape A4 without backgrounds, as the decks were always exported (a
+# CSS @page size wins).  WkhtmltopdfBackend(backgrounds=True) prints them,
+# like WeasyPrint always does - bench_pdf_backends.py, for comparable PDFs.
+WKHTMLTOPDF_ARGS = ['--quiet', '--orientation', 'Landscape', '--page-size', 'A4',
+                    '--no-background', '--enable-local-file-access']
+CHROMIUM_PDF_OPTIONS = {'format': 'A4', 'landscape': True, 'print_background': True,
+                        'prefer_css_page_size': True}
+CHROMIUM_NAMES = ('chromium', 'chromium-browser', 'google-chrome', 'google-chrome-stable', 'chrome')
+CHROMIUM_TIMEOUT_MS = 120_000
+
+
+def _tmp_path(pdf_path):
+    return pdf_path + ".tmp"
+
+
+def _error_line(stderr, fallback):
+    lines = stderr.decode('utf-8', 'replace').strip().splitlines()
+    return lines[-1] if lines else fallback
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class PdfBackend:
+    """
+    Base class: open() starts the warm state, render() converts one file,
+    close() shuts everything down.  Backends are context managers.
+    """
+
+    name = None
+
+    @classmethod
+    def available(cls):
+        return False
+
+    def open(self):
+        return self
+
+    def close(self):
+        pass
+
+    def render(self, html_path, pdf_path):
+        raise NotImplementedError
+
+    def render_many(self, pairs):
+        """
+        Render [(html_path, pdf_path), ...]; returns {html_path: (seconds,
+        error or None)}
+        """
+        results = {}
+        for html_path, pdf_path in pairs:
+            start = time.perf_counter()
+            try:
+                self.render(html_path, pdf_path)
+                error = None
+            except Exception as e:  # e.g. OSError: one bad file must not stop the batch
+                error = f"{type(e).__name__}: {e}"
+            results[html_path] = (time.perf_counter() - start, error)
+        return results
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class WeasyPrintBackend(PdfBackend):
+    name = 'weasyprint'
+
+    @classmethod
+    def available(cls):
+        return HTML is not None
+
+    def open(self):
+        self.font_sets = FontSets()
+        return self
+
+    def render(self, html_path, pdf_path):
+        tmp_path = _tmp_path(pdf_path)
+        base_url = os.path.abspath(html_path)
+        root = os.path.dirname(base_url)
+        try:
+            with open(html_path, encoding='utf-8') as f:
+                html, faces, links = split_font_faces(f.read(), root)
+            # Keyed on the faces and their directory: decks side by side
+            # with the same fonts share one configuration
+            font_config, sheets = self.font_sets.get(faces, root + os.sep, links)
+            HTML(string=html, base_url=base_url).write_pdf(
+                tmp_path, stylesheets=sheets, font_config=font_config)
+        except Exception as e:  # WeasyPrint raises whatever its parsers raise
+            raise RuntimeError(f"{type(e).__name__}: {e}") from e
+        os.replace(tmp_path, pdf_path)
+
+
+class WkhtmltopdfBackend(PdfBackend):
+    name = 'wkhtmltopdf'
+    executable = 'wkhtmltopdf'
+
+    def __init__(self, backgrounds=False):
+        self.args = list(WKHTMLTOPDF_ARGS)
+        if backgrounds:
+            self.args[self.args.index('--no-background')] = '--background'
+
+    @classmethod
+    def available(cls):
+        return shutil.which(cls.executable) is not None
+
+    def render(self, html_path, pdf_path):
+        tmp_path = _tmp_path(pdf_path)
+        result = subprocess.run([self.executable, *self.args, html_path, tmp_path],
+                                capture_output=True)
+        if result.returncode != 0:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise RuntimeError(_error_line(result.stderr, f"wkhtmltopdf exited with {result.returncode}"))
+        os.replace(tmp_path, pdf_path)
+
+    def render_many(self, pairs):
+        """The whole batch in one wkhtmltopdf process, one argument line per file"""
+        if len(pairs) < 2:
+            return super().render_many(pairs)
+        lines = "".join(f'"{html_path}" "{_tmp_path(pdf_path)}"\n' for html_path, pdf_path in pairs)
+        start = time.time()
+        result = subprocess.run([self.executable, *self.args, '--read-args-from-stdin'],
+                                input=lines.encode('utf-8'), capture_output=True)
+        end = time.time()
+        # Files are converted in order: each one took from the previous
+        # PDF's last write to its own
+        results, done = {}, start
+        for html_path, pdf_path in pairs:
+            tmp_path = _tmp_path(pdf_path)
+            if os.path.exists(tmp_path) and os.path.getsize(tmp_path):
+                finished = min(max(os.path.getmtime(tmp_path), done), end)
+                os.replace(tmp_path, pdf_path)
+                results[html_path] = (finished - done, None)
+                done = finished
+            else:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                results[html_path] = (0.0, _error_line(result.stderr, "no PDF written"))
+        return results
+
+
+class ChromiumBackend(PdfBackend):
+    name = 'chromium'
+
+    @staticmethod
+    def executable():
+        for name in CHROMIUM_NAMES:
+            path = shutil.which(name)
+            if path:
+                return path
+        return None
+
+    @classmethod
+    def available(cls):
+        return cls.executable() is not None
+
+    def open(self):
+        self.playwright = self.browser = self.page = None
+        if sync_playwright is not None:
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(executable_path=self.executable())
+            self.page = self.browser.new_page()
+        return self
+
+    def close(self):
+        if self.browser is not None:
+            self.browser.close()
+        if self.playwright is not None:
+            self.playwright.stop()
+        self.playwright = self.browser = self.page = None
+
+    def render(self, html_path, pdf_path):
+        tmp_path = _tmp_path(pdf_path)
+        url = 'file://' + urllib.request.pathname2url(os.path.abspath(html_path))
+        if self.page is not None:
+            try:
+                self.page.goto(url, wait_until='load', timeout=CHROMIUM_TIMEOUT_MS)
+                self.page.pdf(path=tmp_path, **CHROMIUM_PDF_OPTIONS)
+            except Exception as e:  # playwright.sync_api.Error and timeouts
+                raise RuntimeError(f"{type(e).__name__}: {e}") from e
+        else:
+            # A throwaway profile keeps parallel CLI runs from sharing one
+            with tempfile.TemporaryDirectory(prefix="chromium-profile-") as profile:
+                result = subprocess.run(
+                    [self.executable(), '--headless', '--disable-gpu', '--no-pdf-header-footer',
+                     f'--user-data-dir={profile}', f'--print-to-pdf={tmp_path}', url],
+                    capture_output=True)
+            if result.returncode != 0 or not os.path.exists(tmp_path):
+                raise RuntimeError(_error_line(result.stderr, f"chromium exited with {result.returncode}"))
+        os.replace(tmp_path, pdf_path)
+
+
+BACKENDS = {cls.name: cls for cls in (WeasyPrintBackend, WkhtmltopdfBackend, ChromiumBackend)}
+
+
+def available_backends():
+    return [name for name, cls in BACKENDS.items() if cls.available()]
+
+
+def get_backend(name, **options):
+    """
+    A backend by name, not yet opened, created with options; raises
+    ValueError if unknown or not installed
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown PDF backend {name!r}; known: {', '.join(BACKENDS)}")
+    if not BACKENDS[name].available():
+        raise ValueError(f"PDF backend {name!r} is not installed here")
+    return BACKENDS[name](**options)
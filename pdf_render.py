@@ -0,0 +1,366 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+PARALLEL PDF RENDERING - chunked WeasyPrint renders, merged in slide order
+
+WeasyPrint lays a document out on one core.  Here the deck is cut into
+chunks of consecutive slides that all share the deck's <head> (fonts and
+layout CSS), every chunk is rendered in its own process and the chunk PDFs
+are merged back in order with pypdf.
+
+Each chunk embeds the deck's fonts whole (they are already subset to the
+deck's text), so the font programs come out byte-identical in every chunk
+and the merge keeps a single copy; identical images collapse the same way.
+
+    from pdf_render import render_pdf
+    render_pdf(deck.iter_deck_pieces(static_weights=True), "deck.pdf",
+               base_url=deck.BASE_PATH + os.sep, jobs=4)
+
+render_pages() goes one step further for rebuilds: every slide is its own
+standalone document, rendered once to a PDF page cached under the hash of
+that document (and of the local files it links), and the deck is assembled
+from the cached pages.  Editing one slide re-renders one page.  Pages embed
+whole fonts too, so the merge again keeps one copy of each; the least
+recently used pages beyond PAGE_CACHE_KEEP are evicted.
+
+    render_pages(deck.iter_slide_documents(static_weights=True), "deck.pdf",
+                 base_url=deck.BASE_PATH + os.sep, cache_dir=".cache/pages")
+
+Renderers that stay warm across documents share FontSets: split_font_faces()
+cuts a document's @font-face rules out, and each distinct set is loaded
+into its own FontConfiguration once.
+"""
+
+import os
+import re
+import time
+import hashlib
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from weasyprint import CSS, HTML, VERSION as WEASYPRINT_VERSION
+from weasyprint.text.fonts import FontConfiguration
+
+from css_prune import split_statements
+
+try:
+    from pypdf import PdfWriter
+except ImportError:  # no merging - everything renders in one process
+    PdfWriter = None
+
+# Filled in by render_pdf() / render_pages() for the build report
+RENDER_STATS = {'chunks': 0, 'jobs': 0, 'render': 0.0, 'merge': 0.0, 'wall': 0.0,
+                'chunk_bytes': 0, 'pdf_bytes': 0, 'pages': 0, 'rendered': 0, 'evicted': 0}
+
+# Bump when the page render options change, to drop every cached page
+PAGE_CACHE_VERSION = 2
+PAGE_OPTIONS = {'full_fonts': True}
+
+# Cached pages kept (most recently used first), at least every page of the deck
+PAGE_CACHE_KEEP = 200
+
+# Page temp files older than this (seconds) were left by a crashed render
+PAGE_TMP_MAX_AGE = 3600
+
+# render_daemon.py installs its warm renderer here: called as
+# (html_path, pdf_path, base_url, **options) instead of a fresh WeasyPrint
+# render with a new FontConfiguration
+WARM_RENDERER = None
+
+# Warm FontConfigurations a FontSets keeps (one per distinct font set)
+FONT_SET_CACHE_SIZE = 64
+
+# Relative href/src references - local files a page document pulls in
+_LOCAL_REF_RE = re.compile(r'(?:href|src)=["\']([^"\'#?:]+)["\']')
+
+_STYLE_BLOCK_RE = re.compile(r'(<style\b[^>]*>)(.*?)(</style>)', re.S | re.I)
+_LINK_RE = re.compile(r'<link\b[^>]*>', re.I)
+_ATTR_RE = re.compile(r'''([\w-]+)\s*=\s*["']([^"']*)["']''')
+
+
+def merge_available():
+    return PdfWriter is not None
+
+
+def split_chunks(items, count):
+    """count runs of consecutive items whose lengths differ by at most one"""
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    chunks = []
+    start = 0
+    for i in range(count):
+        end = start + size + (i < extra)
+        chunks.append(items[start:end])
+        start = end
+    return chunks
+
+
+def split_document(pieces):
+    """(head, [slide html, ...], tail) from iter_deck_pieces() output"""
+    head, slides, tail = [], [], []
+    for kind, html in pieces:
+        {'head': head, 'slide': slides, 'tail': tail}[kind].append(html)
+    return "".join(head), slides, "".join(tail)
+
+
+def render_file(html_path, pdf_path, base_url, **options):
+    """One HTML file -> PDF, on the warm renderer when one is installed"""
+    if WARM_RENDERER is not None:
+        WARM_RENDERER(html_path, pdf_path, base_url, **options)
+    else:
+        HTML(filename=html_path, base_url=base_url).write_pdf(
+            pdf_path, font_config=FontConfiguration(), **options)
+
+
+# Font sets: a warm renderer (render_daemon.py, pdf_backends.py) cuts the
+# @font-face rules out of every document and loads each distinct set once
+
+def _is_font_face(prelude):
+    return prelude.strip().lower().startswith('@font-face')
+
+
+def _font_only_stylesheet(path):
+    """True when a local stylesheet holds nothing but @font-face rules"""
+    with open(path, encoding='utf-8') as f:
+        statements, _ = split_statements(f.read())
+    return bool(statements) and all(_is_font_face(prelude) for _, prelude, _ in statements)
+
+
+def split_font_faces(html, root):
+    """
+    (html without its @font-face rules and font-only <link>s, the @font-face
+    css, [font-only stylesheet paths]).  root resolves relative hrefs.
+    """
+    faces = []
+
+    def strip_style(match):
+        statements, tail = split_statements(match.group(2))
+        kept = []
+        for lead, prelude, block in statements:
+            if _is_font_face(prelude) and block is not None:
+                faces.append(prelude + block)
+            else:
+                kept.append(lead + prelude + (block or ""))
+        return match.group(1) + "".join(kept) + tail + match.group(3)
+
+    links = []
+
+    def strip_link(match):
+        attrs = {k.lower(): v for k, v in _ATTR_RE.findall(match.group(0))}
+        href = attrs.get('href', '')
+        if attrs.get('rel', '').lower() != 'stylesheet' or ':' in href or href.startswith('/'):
+            return match.group(0)
+        path = os.path.join(root, href)
+        if not os.path.isfile(path) or not _font_only_stylesheet(path):
+            return match.group(0)
+        links.append(path)
+        return ""
+
+    html = _STYLE_BLOCK_RE.sub(strip_style, html)
+    html = _LINK_RE.sub(strip_link, html)
+    return html, "\n".join(faces), links
+
+
+class FontSets:
+    """
+    LRU of font set key -> (FontConfiguration, [CSS]) with the fonts loaded.
+    layout_css, when given, is parsed into the same entry after the fonts.
+    """
+
+    def __init__(self, size=FONT_SET_CACHE_SIZE):
+        self.size = size
+        self.sets = OrderedDict()
+        self.hits = self.misses = 0
+
+    def get(self, faces, base_url, links, layout_css=None):
+        h = hashlib.sha256(faces.encode('utf-8'))
+        h.update(base_url.encode('utf-8'))
+        if layout_css is not None:
+            h.update(b"\0layout\0" + layout_css.encode('utf-8'))
+        for path in links:
+            st = os.stat(path)
+            h.update(f"\n{path}:{st.st_size}:{st.st_mtime_ns}".encode())
+        key = h.hexdigest()
+        if key in self.sets:
+            self.sets.move_to_end(key)
+            self.hits += 1
+            return self.sets[key]
+
+        self.misses += 1
+        font_config = FontConfiguration()
+        sheets = [CSS(filename=path, font_config=font_config) for path in links]
+        if faces:
+            sheets.append(CSS(string=faces, base_url=base_url, font_config=font_config))
+        if layout_css is not None:
+            sheets.append(CSS(string=layout_css, base_url=base_url, font_config=font_config))
+        self.sets[key] = (font_config, sheets)
+        if len(self.sets) > self.size:
+            self.sets.popitem(last=False)
+        return self.sets[key]
+
+
+def _render_chunk(job):
+    """Worker: one chunk document -> PDF; returns the seconds it took"""
+    html_path, pdf_path, base_url, options = job
+    start = time.perf_counter()
+    render_file(html_path, pdf_path, base_url, **options)
+    return time.perf_counter() - start
+
+
+def _render_all(work, jobs):
+    """Render (html, pdf, base_url, options) jobs on up to jobs processes; total seconds"""
+    if jobs <= 1 or len(work) <= 1:
+        return sum(map(_render_chunk, work))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        return sum(pool.map(_render_chunk, work))
+
+
+def merge_pdfs(paths, pdf_path):
+    """Concatenate PDFs in order, keeping one copy of identical fonts and images"""
+    writer = PdfWriter()
+    for path in paths:
+        writer.append(path)
+    writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+    tmp_path = pdf_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        writer.write(f)
+    os.replace(tmp_path, pdf_path)
+
+
+def render_pdf(pieces, pdf_path, base_url, jobs=1, chunks=None):
+    """
+    Render a deck given as iter_deck_pieces() output into pdf_path.
+
+    The slides are split into chunks (default: one per job) rendered by up
+    to jobs processes.  A single chunk is one plain WeasyPrint render, as
+    before.  Without pypdf everything renders as a single chunk.
+    """
+    wall = time.perf_counter()
+    head, slides, tail = split_document(pieces)
+    if not merge_available():
+        chunks = 1
+    parts = split_chunks(slides, chunks or jobs)
+    stats = dict.fromkeys(RENDER_STATS, 0)
+    stats.update(chunks=len(parts), jobs=min(jobs, len(parts)), render=0.0, merge=0.0)
+
+    with tempfile.TemporaryDirectory(prefix="deck-chunks-") as workdir:
+        if len(parts) == 1:
+            html_path = os.path.join(workdir, "deck.html")
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(head + "".join(slides) + tail)
+            stats['render'] = _render_chunk((html_path, pdf_path, base_url, {}))
+            stats['chunk_bytes'] = os.path.getsize(pdf_path)
+        else:
+            work = []
+            for i, part in enumerate(parts):
+                html_path = os.path.join(workdir, f"chunk-{i:03d}.html")
+                with open(html_path, 'w', encoding='utf-8') as f:
+                    f.write(head + "".join(part) + tail)
+                # Whole fonts: identical streams in every chunk, deduplicated on merge
+                work.append((html_path, os.path.join(workdir, f"chunk-{i:03d}.pdf"),
+                             base_url, {'full_fonts': True}))
+            stats['render'] = _render_all(work, stats['jobs'])
+
+            start = time.perf_counter()
+            chunk_pdfs = [pdf for _, pdf, _, _ in work]
+            stats['chunk_bytes'] = sum(os.path.getsize(pdf) for pdf in chunk_pdfs)
+            merge_pdfs(chunk_pdfs, pdf_path)
+            stats['merge'] = time.perf_counter() - start
+
+    stats['pdf_bytes'] = os.path.getsize(pdf_path)
+    stats['wall'] = time.perf_counter() - wall
+    RENDER_STATS.update(stats)
+    return pdf_path
+
+
+def page_key(html, base_url):
+    """
+    Cache key of a page document: its HTML, the WeasyPrint version and the
+    size/mtime of every local file it links (fonts.css, images)
+    """
+    h = hashlib.sha256(f"{PAGE_CACHE_VERSION}:{WEASYPRINT_VERSION}\n".encode())
+    h.update(html.encode('utf-8'))
+    root = base_url if os.path.isdir(base_url) else os.path.dirname(base_url)
+    for ref in sorted(set(_LOCAL_REF_RE.findall(html))):
+        path = os.path.join(root, ref)
+        if os.path.isfile(path):
+            st = os.stat(path)
+            h.update(f"\n{ref}:{st.st_size}:{st.st_mtime_ns}".encode())
+    return h.hexdigest()[:32]
+
+
+def evict_pages(cache_dir, used, keep, ext=".pdf"):
+    """
+    Mark the pages in used as just used, then delete all but the keep most
+    recently used pages (files ending in ext) of cache_dir, and any temp
+    file older than PAGE_TMP_MAX_AGE; returns how many files were deleted
+    """
+    for path in used:
+        os.utime(path)
+    pages = []
+    evicted = 0
+    stale = time.time() - PAGE_TMP_MAX_AGE
+    for entry in os.scandir(cache_dir):
+        if not entry.is_file():
+            continue
+        if entry.name.endswith(ext):
+            pages.append((entry.stat().st_mtime_ns, entry.path))
+        elif entry.name.endswith(".tmp") and entry.stat().st_mtime < stale:
+            os.remove(entry.path)
+            evicted += 1
+    pages.sort(reverse=True)
+    for _, path in pages[keep:]:
+        if path not in used:
+            os.remove(path)
+            evicted += 1
+    return evicted
+
+
+def render_pages(documents, pdf_path, base_url, cache_dir, jobs=1):
+    """
+    Render one standalone HTML document per page (see
+    iter_slide_documents()) through the page cache and assemble the deck
+    into pdf_path.  Only pages missing from cache_dir are rendered, on up
+    to jobs processes.  Needs pypdf (merge_available()).
+    """
+    wall = time.perf_counter()
+    os.makedirs(cache_dir, exist_ok=True)
+    stats = dict.fromkeys(RENDER_STATS, 0)
+    stats.update(render=0.0, merge=0.0)
+
+    page_pdfs = []
+    with tempfile.TemporaryDirectory(prefix="deck-pages-") as workdir:
+        work = {}
+        for html in documents:
+            key = page_key(html, base_url)
+            page_pdf = os.path.join(cache_dir, key + ".pdf")
+            page_pdfs.append(page_pdf)
+            if key in work or os.path.exists(page_pdf):
+                continue
+            html_path = os.path.join(workdir, key + ".html")
+            with open(html_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            # Rendered beside the cache entry and moved in whole
+            work[key] = (html_path, f"{page_pdf}.{os.getpid()}.tmp", base_url, PAGE_OPTIONS)
+        try:
+            stats['render'] = _render_all(list(work.values()), jobs)
+            for key, (_, tmp_path, _, _) in work.items():
+                os.replace(tmp_path, os.path.join(cache_dir, key + ".pdf"))
+        finally:
+            # A failed render leaves its temp file (and its batch's) behind
+            for _, tmp_path, _, _ in work.values():
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    start = time.perf_counter()
+    stats['chunk_bytes'] = sum(os.path.getsize(pdf) for pdf in page_pdfs)
+    merge_pdfs(page_pdfs, pdf_path)
+    stats['merge'] = time.perf_counter() - start
+    stats['evicted'] = evict_pages(cache_dir, set(page_pdfs), max(PAGE_CACHE_KEEP, len(page_pdfs)))
+
+    stats.update(pages=len(page_pdfs), rendered=len(work), chunks=len(work),
+                 jobs=min(jobs, len(work)))
+    stats['pdf_bytes'] = os.path.getsize(pdf_path)
+    stats['wall'] = time.perf_counter() - wall
+    RENDER_STATS.update(stats)
+    return pdf_path
@@ -0,0 +1,128 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+DECORATION PLACEMENT - seeded, collision-free scattering
+
+Scatters blobs and sparkles around the content of a slide.  A uniform grid
+spatial index means each candidate is only checked against the few cells it
+touches, so thousands of candidates per slide stay linear instead of
+pairwise-quadratic.
+
+    from placement import Decoration, scatter
+    placed = scatter(1920, 1080, keep_out=[(120, 100, 900, 400)],
+                     decorations=[Decoration('blob', 600, 520)] * 3 +
+                                 [Decoration('sparkle', 14, 14)] * 6,
+                     seed=7)
+    for p in placed:
+        p.cx, p.cy, p.decoration
+
+Units are whatever the caller uses (px for HTML, EMU for PPTX).  Boxes are
+(x, y, width, height).
+"""
+
+import random
+from collections import namedtuple
+
+# kind 'blob' may overlap other blobs and keep-out boxes up to max_overlap
+# of its own box (they are soft background shapes) and may bleed off the
+# slide edge; any other kind must sit fully inside the slide, clear of
+# keep-out boxes and of every other non-blob decoration.
+Decoration = namedtuple('Decoration', 'kind width height')
+Placed = namedtuple('Placed', 'decoration cx cy')
+
+BLOB = 'blob'
+
+
+class SpatialGrid:
+    """Uniform grid of boxes: insert() once, query() the boxes near an area"""
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size)
+        self.cells = {}
+        self.boxes = []      # (x0, y0, x1, y1, layer)
+
+    def _cells(self, x0, y0, x1, y1):
+        size = self.cell_size
+        for ix in range(int(x0 // size), int(x1 // size) + 1):
+            for iy in range(int(y0 // size), int(y1 // size) + 1):
+                yield ix, iy
+
+    def insert(self, box, layer):
+        x, y, w, h = box
+        entry = (x, y, x + w, y + h, layer)
+        index = len(self.boxes)
+        self.boxes.append(entry)
+        for cell in self._cells(*entry[:4]):
+            self.cells.setdefault(cell, []).append(index)
+
+    def query(self, box):
+        """Yield (x0, y0, x1, y1, layer) of every stored box whose cells touch box"""
+        x, y, w, h = box
+        seen = set()
+        for cell in self._cells(x, y, x + w, y + h):
+            for index in self.cells.get(cell, ()):
+                if index not in seen:
+                    seen.add(index)
+                    yield self.boxes[index]
+
+
+def _intersection(box, other):
+    x, y, w, h = box
+    x0, y0, x1, y1 = other[:4]
+    dx = min(x + w, x1) - max(x, x0)
+    dy = min(y + h, y1) - max(y, y0)
+    return dx * dy if dx > 0 and dy > 0 else 0.0
+
+
+def _fits(grid, box, is_blob, max_overlap):
+    area = box[2] * box[3]
+    for other in grid.query(box):
+        overlap = _intersection(box, other)
+        if not overlap:
+            continue
+        layer = other[4]
+        if is_blob:
+            # Blobs only care about content and other blobs; sparkles may sit on them
+            if layer != 'decoration' and overlap > max_overlap * area:
+                return False
+        elif layer != BLOB:
+            return False
+    return True
+
+
+def scatter(width, height, decorations, keep_out=(), seed=0, max_overlap=0.25,
+            margin=0, candidates=64, cell_size=None):
+    """
+    Place decorations (largest first) at seeded random positions.
+
+    keep_out boxes (text, cards) are grown by margin.  Each decoration tries
+    up to `candidates` positions and takes the first that fits; ones that
+    never fit are left out.  Returns Placed(decoration, cx, cy) in the order
+    they were placed.
+    """
+    rng = random.Random(seed)
+    if cell_size is None:
+        sizes = [max(d.width, d.height) for d in decorations if d.kind != BLOB]
+        cell_size = max(min(sizes) * 4 if sizes else 0, min(width, height) / 8)
+    grid = SpatialGrid(cell_size)
+    for x, y, w, h in keep_out:
+        grid.insert((x - margin, y - margin, w + 2 * margin, h + 2 * margin), 'content')
+
+    placed = []
+    order = sorted(decorations, key=lambda d: d.width * d.height, reverse=True)
+    for decoration in order:
+        w, h = decoration.width, decoration.height
+        is_blob = decoration.kind == BLOB
+        for _ in range(candidates):
+            if is_blob:
+                # Centre anywhere on the slide: blobs may bleed off the edges
+                cx = rng.uniform(0, width)
+                cy = rng.uniform(0, height)
+            else:
+                cx = rng.uniform(margin + w / 2, width - margin - w / 2)
+                cy = rng.uniform(margin + h / 2, height - margin - h / 2)
+            box = (cx - w / 2, cy - h / 2, w, h)
+            if _fits(grid, box, is_blob, max_overlap):
+                grid.insert(box, BLOB if is_blob else 'decoration')
+                placed.append(Placed(decoration, cx, cy))
+                break
+    return placed
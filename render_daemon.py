@@ -0,0 +1,326 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+WARM RENDER DAEMON - WeasyPrint kept loaded behind a Unix socket
+
+A one-off `python build_slides_html.py` pays for importing WeasyPrint and
+fontTools, loading every @font-face into a fresh FontConfiguration and
+parsing the font-laden CSS before it renders a page.  The daemon pays once:
+
+- WeasyPrint, fontTools and the deck builder stay imported, with their
+  in-memory caches (slide fragments, font subsets)
+- @font-face rules (and font-only stylesheets such as fonts.css) are cut
+  out of every document and parsed once into a CSS object; each distinct
+  font set keeps its own FontConfiguration with the fonts already loaded,
+  so documents sharing a font set never load a font twice.  The rest of
+  a document's CSS stays in the document, so the cascade is unchanged
+- HTML fragments are rendered inside the deck's head: its layout CSS and
+  whole fonts, parsed once into CSS objects kept with the font set
+- builds run in-process and render through pdf_render.WARM_RENDERER;
+  edited project modules are reloaded before the next build
+
+Requests are one JSON line each way.  The client:
+
+    python render_daemon.py serve &                # start the daemon
+    python render_daemon.py build --slides 13-15   # build_slides_html.py, warm
+    python render_daemon.py render "DAY 2 slides 1-37.html"
+    python render_daemon.py render - -o frag.pdf < fragment.html
+    python render_daemon.py status
+    python render_daemon.py stop
+
+Without a running daemon, `build` falls back to an ordinary in-process build.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import types
+import socket
+import argparse
+import importlib
+import contextlib
+import socketserver
+
+from weasyprint import HTML
+
+import pdf_render
+from pdf_render import FontSets, split_font_faces
+
+BASE_PATH = os.path.dirname(os.path.abspath(__file__))
+SOCKET_PATH = os.path.join(BASE_PATH, ".build_cache", "render.sock")
+
+# Filled in by the daemon; returned by the 'status' request
+DAEMON_STATS = {'requests': 0, 'renders': 0, 'builds': 0, 'reloads': 0, 'render_seconds': 0.0}
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+class RenderServer(socketserver.UnixStreamServer):
+    """One request at a time: WeasyPrint and the deck builder are not thread-safe"""
+
+    def __init__(self, path):
+        if os.path.exists(path):
+            # Only a stale socket left by a dead daemon may be replaced
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                try:
+                    probe.connect(path)
+                except (ConnectionRefusedError, FileNotFoundError):
+                    pass
+                else:
+                    raise RuntimeError(f"a render daemon is already listening on {path}")
+            os.remove(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Requests name arbitrary files to read and write: owner only, from
+        # the moment the socket exists
+        umask = os.umask(0o177)
+        try:
+            super().__init__(path, RenderHandler)
+        finally:
+            os.umask(umask)
+        os.chmod(path, 0o600)
+        self.font_sets = FontSets()
+        self.deck_styles = None  # (layout css, {weights: font css}) of the loaded deck builder
+        self.stopping = False
+        import build_slides_html  # noqa: F401 - imported once, warm for every build
+        self.module_mtimes = self._local_module_mtimes()
+        self.install()
+
+    # Rendering
+
+    def render_html(self, html, pdf_path, base_url, layout_css=None, fonts_css="", **options):
+        start = time.perf_counter()
+        root = base_url if base_url.endswith(os.sep) else os.path.dirname(base_url)
+        html, faces, links = split_font_faces(html, root)
+        font_config, sheets = self.font_sets.get(fonts_css + faces, base_url, links, layout_css)
+        tmp_path = pdf_path + ".tmp"
+        HTML(string=html, base_url=base_url).write_pdf(
+            tmp_path, stylesheets=sheets, font_config=font_config, **options)
+        os.replace(tmp_path, pdf_path)
+        DAEMON_STATS['renders'] += 1
+        DAEMON_STATS['render_seconds'] += time.perf_counter() - start
+
+    def render_file(self, html_path, pdf_path, base_url=None, **options):
+        with open(html_path, encoding='utf-8') as f:
+            html = f.read()
+        self.render_html(html, pdf_path, base_url or os.path.abspath(html_path), **options)
+
+    def render_fragment(self, fragment, pdf_path, base_url):
+        """An HTML fragment (e.g. one slide) styled like the deck: its layout CSS and whole fonts"""
+        deck = self.reload_changed()
+        if self.deck_styles is None:
+            self.deck_styles = deck.get_layout_css(), {}
+        layout_css, fonts_by_weights = self.deck_styles
+        weights = tuple(deck.collect_used_weights(fragment, layout_css))
+        if weights not in fonts_by_weights:
+            fonts_by_weights[weights] = deck.get_font_css(font_format='truetype', weights=list(weights))
+        fonts_css = fonts_by_weights[weights]
+        html = f'<!DOCTYPE html>\n<html>\n<head><meta charset="UTF-8"></head>\n<body>\n{fragment}\n</body>\n</html>'
+        self.render_html(html, pdf_path, base_url, layout_css=layout_css, fonts_css=fonts_css)
+
+    def install(self):
+        """Route pdf_render (and so the deck builder) through the warm renderer"""
+        pdf_render.WARM_RENDERER = self.render_file
+
+    # Builds
+
+    @staticmethod
+    def _local_module_mtimes():
+        mtimes = {}
+        for name, module in list(sys.modules.items()):
+            path = getattr(module, '__file__', None)
+            if name != '__main__' and path and os.path.dirname(os.path.abspath(path)) == BASE_PATH:
+                mtimes[name] = os.path.getmtime(path)
+        return mtimes
+
+    @staticmethod
+    def _reload_order(names):
+        """names ordered so every module comes after the project modules it imports from"""
+        def imports(name):
+            deps = set()
+            for value in list(vars(sys.modules[name]).values()):
+                dep = value.__name__ if isinstance(value, types.ModuleType) else getattr(value, '__module__', None)
+                if isinstance(dep, str) and dep in names and dep != name:
+                    deps.add(dep)
+            return deps
+
+        order, seen = [], set()
+
+        def visit(name):
+            if name not in seen:
+                seen.add(name)
+                for dep in sorted(imports(name)):
+                    visit(dep)
+                order.append(name)
+        for name in names:
+            visit(name)
+        return order
+
+    def reload_changed(self):
+        """
+        Reload every project module once any of them is edited, so none
+        keeps a stale binding (text_fit's `get_metrics`, say) to an old one.
+        Each module reloads after the ones it imports from (font_metrics,
+        text_fit, placement, ...), the builder last.
+        """
+        import build_slides_html
+        mtimes = self._local_module_mtimes()
+        if mtimes == self.module_mtimes:
+            return build_slides_html
+        for name in self._reload_order(mtimes):
+            if name not in ('build_slides_html', 'render_daemon'):
+                importlib.reload(sys.modules[name])
+        build_slides_html = importlib.reload(sys.modules['build_slides_html'])
+        self.deck_styles = None
+        self.install()
+        self.module_mtimes = self._local_module_mtimes()
+        DAEMON_STATS['reloads'] += 1
+        return build_slides_html
+
+    def build(self, argv):
+        deck = self.reload_changed()
+        out = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+                deck.main(argv)
+        except SystemExit as e:  # argparse errors and --help
+            if e.code:
+                raise RuntimeError(out.getvalue().strip()) from None
+        DAEMON_STATS['builds'] += 1
+        return out.getvalue()
+
+
+class RenderHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        DAEMON_STATS['requests'] += 1
+        start = time.perf_counter()
+        try:
+            request = json.loads(self.rfile.readline())
+            if not isinstance(request, dict):
+                raise ValueError("a request is one JSON object")
+            response = self.dispatch(request)
+            response['ok'] = True
+        except Exception as e:  # reported to the client; the daemon keeps serving
+            response = {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        response['seconds'] = time.perf_counter() - start
+        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+
+    def dispatch(self, request):
+        server = self.server
+        op = request.get('op')
+        if op == 'render':
+            if request.get('deck'):
+                server.render_file(request['deck'], request['pdf'], request.get('base_url'))
+            else:
+                server.render_fragment(request['html'], request['pdf'],
+                                       request.get('base_url') or BASE_PATH + os.sep)
+            return {'pdf': request['pdf'], 'bytes': os.path.getsize(request['pdf'])}
+        if op == 'build':
+            return {'output': server.build(request.get('argv', []))}
+        if op == 'status':
+            font_sets = server.font_sets
+            stats = dict(DAEMON_STATS, font_hits=font_sets.hits, font_misses=font_sets.misses)
+            return {'stats': stats, 'font_sets': len(font_sets.sets), 'pid': os.getpid()}
+        if op == 'stop':
+            server.stopping = True
+            return {}
+        raise ValueError(f"Unknown request {op!r}")
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+def request(path, **payload):
+    """Send one request to the daemon; ConnectionError when none is listening"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"no render daemon on {path}") from e
+        with sock.makefile('rwb') as f:
+            f.write(json.dumps(payload).encode('utf-8') + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Warm WeasyPrint render daemon and its client")
+    parser.add_argument('--socket', default=SOCKET_PATH, help=f"Unix socket (default {SOCKET_PATH})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('serve', help="run the daemon in the foreground")
+    commands.add_parser('build', help="build_slides_html.py in the daemon (same options)")
+    render = commands.add_parser('render', help="render a deck, or an HTML fragment from stdin ('-')")
+    render.add_argument('source', help="HTML file, or - for a fragment on stdin")
+    render.add_argument('-o', '--output', help="PDF path (default: next to the deck, or fragment.pdf)")
+    render.add_argument('--base-url', help="base for relative URLs (default: the deck, or the project)")
+    commands.add_parser('status', help="daemon counters")
+    commands.add_parser('stop', help="shut the daemon down")
+    # Everything build does not know is passed on to build_slides_html.py
+    args, args.argv = parser.parse_known_args(argv)
+    if args.argv and args.command != 'build':
+        parser.error(f"unrecognized arguments: {' '.join(args.argv)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    path = os.path.abspath(args.socket)
+
+    if args.command == 'serve':
+        try:
+            server = RenderServer(path)
+        except RuntimeError as e:
+            sys.exit(f"  {e}")
+        print(f"  Render daemon {os.getpid()} listening on {path}")
+        try:
+            while not server.stopping:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if os.path.exists(path):
+                os.remove(path)
+        return
+
+    if args.command == 'render':
+        if args.source == '-':
+            payload = {'html': sys.stdin.read(), 'pdf': os.path.abspath(args.output or "fragment.pdf")}
+        else:
+            payload = {'deck': os.path.abspath(args.source),
+                       'pdf': os.path.abspath(args.output or os.path.splitext(args.source)[0] + ".pdf")}
+        payload['base_url'] = args.base_url
+        payload['op'] = 'render'
+    else:
+        payload = {'op': args.command, 'argv': args.argv}
+
+    try:
+        response = request(path, **payload)
+    except ConnectionError as e:
+        if args.command != 'build':
+            sys.exit(f"  {e} - start one with: python render_daemon.py serve")
+        print(f"  {e} - building in this process")
+        import build_slides_html
+        build_slides_html.main(args.argv)
+        return
+
+    if not response['ok']:
+        sys.exit(f"  Daemon error: {response['error']}")
+    if args.command == 'build':
+        print(response['output'], end="")
+    elif args.command == 'render':
+        print(f"  PDF saved: {response['pdf']} ({response['bytes']:,} bytes)")
+    elif args.command == 'status':
+        stats = response['stats']
+        print(f"  Daemon {response['pid']}: {stats['requests']} requests, {stats['builds']} builds, "
+              f"{stats['renders']} renders ({stats['render_seconds']:.2f}s), "
+              f"{stats['reloads']} reloads")
+        print(f"  Font sets: {response['font_sets']} warm, "
+              f"{stats['font_hits']} hits, {stats['font_misses']} misses")
+    if args.command != 'status':
+        print(f"  Daemon answered in {response['seconds']:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
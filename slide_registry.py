@@ -0,0 +1,124 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+SLIDE REGISTRY - slide ids, names and tags for selective builds
+
+Builders register themselves in deck order with a decorator, so the deck
+order is simply the order they are defined in:
+
+    from slide_registry import SlideRegistry
+    SLIDES = SlideRegistry()
+
+    @SLIDES.slide('13a', "Stat 75+ (number)", tags=('survey', 'stat'))
+    def slide_13a_stat_75_number():
+        ...
+
+    SLIDES.select('13-15')           # 13a, 13b, 14a, 14b, 15a, 15b
+    SLIDES.select(tags=['stat'])
+
+Ids are a slide number plus an optional letter for build-up variants
+('13a', '13b'); a bare number, alone or as a range bound, covers every
+variant of that slide.
+"""
+
+import re
+from collections import namedtuple
+
+Slide = namedtuple('Slide', 'id name tags builder')
+
+_ID_RE = re.compile(r'^(\d+)([a-z]*)$')
+
+
+def _id_key(slide_id, upper=False):
+    """Sortable (number, variant) of an id; upper makes a bare number cover its variants"""
+    match = _ID_RE.match(slide_id.strip().lower())
+    if match is None:
+        raise ValueError(f"Bad slide id: {slide_id!r} (expected e.g. 7, 13a)")
+    number, variant = match.groups()
+    if upper and not variant:
+        variant = '~'  # sorts after every letter
+    return int(number), variant
+
+
+def parse_slide_spec(spec):
+    """'1,4-6,13a' -> [(low, high), ...] inclusive id-key ranges"""
+    ranges = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        low, sep, high = part.partition('-')
+        ranges.append((_id_key(low), _id_key(high if sep else low, upper=True)))
+    if not ranges:
+        raise ValueError(f"Empty slide selection: {spec!r}")
+    return ranges
+
+
+class SlideRegistry:
+    """Slide builders in deck order, with their ids, display names and tags"""
+
+    def __init__(self):
+        self.slides = []
+
+    def slide(self, slide_id, name, tags=()):
+        """Decorator registering a builder; the builder itself is returned unchanged"""
+        key = _id_key(slide_id)
+        for s in self.slides:
+            if _id_key(s.id) == key:  # '1' and '01' are the same slide
+                raise ValueError(f"Slide id {slide_id!r} is already registered as {s.id!r}")
+
+        def register(builder):
+            self.slides.append(Slide(slide_id, name, tuple(tags), builder))
+            return builder
+        return register
+
+    def __iter__(self):
+        return iter(self.slides)
+
+    def __len__(self):
+        return len(self.slides)
+
+    def tags(self):
+        return sorted({tag for s in self.slides for tag in s.tags})
+
+    def select(self, spec=None, tags=None):
+        """
+        Slides whose id is in spec (see parse_slide_spec) and that carry any
+        of tags, in deck order; None skips that filter.  Raises ValueError
+        for unknown tags or a selection that matches nothing.
+        """
+        ranges = parse_slide_spec(spec) if spec else None
+        if tags:
+            unknown = set(tags) - set(self.tags())
+            if unknown:
+                raise ValueError(f"Unknown tag(s) {', '.join(sorted(unknown))}; "
+                                 f"known: {', '.join(self.tags())}")
+
+        chosen = []
+        for s in self.slides:
+            key = _id_key(s.id)
+            if ranges is not None and not any(low <= key <= high for low, high in ranges):
+                continue
+            if tags and not set(tags) & set(s.tags):
+                continue
+            chosen.append(s)
+        if not chosen:
+            raise ValueError("No slides match the selection")
+        return chosen
+
+
+def add_selection_args(parser):
+    """--slides / --tag options shared by the deck builders"""
+    parser.add_argument('--slides', metavar='IDS',
+                        help="build only these slides, e.g. 13-15 or 1,4-6,20a")
+    parser.add_argument('--tag', action='append', metavar='TAG',
+                        help="build only slides with this tag (repeat for several)")
+
+
+def selected_slides(registry, args, parser):
+    """The slides picked by --slides/--tag (None: all), or a parser error"""
+    if not args.slides and not args.tag:
+        return None
+    try:
+        return registry.select(args.slides, args.tag)
+    except ValueError as e:
+        parser.error(str(e))
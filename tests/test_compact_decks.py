@@ -0,0 +1,58 @@
+import base64
+import os
+import random
+import re
+
+import pytest
+
+import compact_decks
+
+# One mime per extension, to turn asset links back into data URIs
+MIMES = {'woff2': b'font/woff2', 'png': b'image/png', 'jpg': b'image/jpeg'}
+_ASSET_REF_RE = re.compile(rb'assets/([0-9a-f]{64})\.(\w+)')
+
+
+def make_deck(path):
+    rng = random.Random(5)
+    font = rng.randbytes(5000)
+    photo = rng.randbytes(3001)
+    parts = [
+        b'<html><head><style>@font-face { src: url(data:font/woff2;base64,',
+        base64.b64encode(font), b') }</style></head><body>\n',
+        b'<img src="data:image/png;base64,', base64.b64encode(photo), b'">\n',
+        b'<img src="data:image/jpeg;base64,', base64.b64encode(b'tiny'), b'">\n',  # stays inline
+        b'<img src="data:image/png;base64,', base64.b64encode(photo), b'">\n',    # same asset
+        b'<p>data:text/plain, not base64</p>\n' * 3,
+        b'<div style="background: url(data:image/png;base64,', base64.b64encode(rng.randbytes(1500)),
+        b')"></div></body></html>',
+    ]
+    with open(path, 'wb') as f:
+        f.write(b"".join(parts))
+
+
+def reinline(html, asset_dir):
+    def data_uri(match):
+        with open(os.path.join(asset_dir, f"{match.group(1).decode()}.{match.group(2).decode()}"), 'rb') as f:
+            return b"data:" + MIMES[match.group(2).decode()] + b";base64," + base64.b64encode(f.read())
+    return _ASSET_REF_RE.sub(data_uri, html)
+
+
+@pytest.mark.parametrize('chunk_size', [7, 97, 4096, 1 << 20])
+def test_compaction_round_trips(tmp_path, monkeypatch, chunk_size):
+    monkeypatch.setattr(compact_decks, 'CHUNK_SIZE', chunk_size)
+    src, dst = tmp_path / 'deck.html', tmp_path / 'out.html'
+    asset_dir = tmp_path / 'assets'
+    asset_dir.mkdir()
+    make_deck(src)
+
+    result = compact_decks.compact_deck(str(src), str(dst), str(asset_dir), 'assets')
+    compacted = dst.read_bytes()
+    original = src.read_bytes()
+
+    assert result['payloads'] == 4
+    assert len({name for name, _ in result['assets']}) == 3
+    assert sorted(os.listdir(asset_dir)) == sorted({name for name, _ in result['assets']})
+    assert len(compacted) < len(original) // 2
+    assert b'data:image/jpeg;base64,' in compacted
+    assert reinline(compacted, asset_dir) == original
+    assert not (tmp_path / 'out.html.tmp').exists()
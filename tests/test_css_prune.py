@@ -0,0 +1,42 @@
+from css_prune import UsedNames, prune_css, prune_html
+
+PAGE = """<html><head><style>
+body { margin: 0 }
+.slide { width: 1920px }
+.unused { color: red }
+#title, #missing { font-size: 96px }
+table td { padding: 4px }
+.slide:hover .badge { opacity: 1 }
+@media print { .unused { display: none } .slide { break-after: page } }
+@font-face { font-family: 'Ogg'; src: url(ogg.woff2) }
+@font-face { font-family: 'Nowhere'; src: url(nowhere.woff2) }
+@keyframes spin { to { transform: rotate(1turn) } }
+@keyframes idle { to { opacity: 0 } }
+.open { display: block }
+</style></head>
+<body><div class="slide"><h1 id="title" style="font-family: 'Ogg', serif; animation: spin 1s">Reset</h1>
+<span class="badge">New</span></div>
+<script>el.classList.toggle('open')</script></body></html>"""
+
+
+def test_prune_html_drops_only_unused_rules():
+    html, rules, kept = prune_html(PAGE)
+    css = html[html.index('<style>'):html.index('</style>')]
+    assert rules > kept
+    for gone in ('.unused', 'table td', '#missing', 'Nowhere', '@keyframes idle'):
+        assert gone not in css
+    for still in ('body', '.slide { width', '#title { font-size', '.slide:hover .badge',
+                  '.slide { break-after', "'Ogg'", '@keyframes spin', '.open'):
+        assert still in css
+    # Markup outside the <style> block is untouched
+    assert html[html.index('</style>'):] == PAGE[PAGE.index('</style>'):]
+
+
+def test_prune_css_keeps_everything_used():
+    css = ".a { color: red } .b > .c { color: blue } p::first-line { margin: 0 }"
+    used = UsedNames()
+    used.feed('<p class="a b"><span class="c">x</span></p>')
+    used.close()
+    result = prune_css(css, used)
+    assert result.kept == result.rules == 3
+    assert result.css.split() == css.split()
@@ -0,0 +1,42 @@
+import tracemalloc
+
+import pytest
+
+try:
+    import build_slides_html as deck
+except (ImportError, OSError):  # WeasyPrint without its system libraries
+    pytest.skip("build_slides_html needs WeasyPrint", allow_module_level=True)
+
+from slide_registry import SlideRegistry
+
+SLIDE_TEXT = "Etsy reset " * 4000  # ~44 KB of markup per slide
+
+
+def long_deck(count):
+    registry = SlideRegistry()
+    for n in range(1, count + 1):
+        def build(n=n):
+            return f'<div class="slide"><p class="body-text">{SLIDE_TEXT}{n}</p></div>'
+        registry.slide(str(n), f"Slide {n}")(build)
+    return list(registry)
+
+
+def peak_while_streaming(slides):
+    tracemalloc.start()
+    try:
+        for _ in deck.iter_deck_pieces(font_mode='link', symbol_scope='svg', slides=slides):
+            pass
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize('slide_cache', [True, False])
+def test_long_deck_holds_one_slide_record_at_a_time(tmp_path, monkeypatch, slide_cache):
+    monkeypatch.setattr(deck, 'FRAGMENT_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(deck, 'SLIDE_CACHE', slide_cache)
+    short, long = long_deck(5), long_deck(100)
+    peak_while_streaming(short)  # warm the module-level caches
+
+    grown = peak_while_streaming(long) - peak_while_streaming(short)
+    assert grown < 2 * len(SLIDE_TEXT)
@@ -0,0 +1,35 @@
+import re
+from collections import Counter
+
+import pytest
+
+try:
+    import build_slides_html as deck
+except (ImportError, OSError):  # WeasyPrint without its system libraries
+    pytest.skip("build_slides_html needs WeasyPrint", allow_module_level=True)
+
+from slide_registry import SlideRegistry
+
+
+def gradient_deck(count):
+    registry = SlideRegistry()
+    for n in range(1, count + 1):
+        def build(n=n):
+            blobs = [deck.svg_blob_gradient(100 * i, 100, 50, 40, '#E07B6C', '#F4C8C0', seed=n + i)
+                     for i in range(3)]
+            return f'<div class="slide"><svg>{"".join(blobs)}</svg></div>'
+        registry.slide(str(n), f"Slide {n}")(build)
+    return list(registry)
+
+
+@pytest.mark.parametrize('slide_cache', [True, False])
+def test_gradient_ids_defined_once_without_symbols(tmp_path, monkeypatch, slide_cache):
+    monkeypatch.setattr(deck, 'FRAGMENT_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(deck, 'SLIDE_CACHE', slide_cache)
+    html = deck.build_all_slides(font_mode='link', symbol_scope=None, slides=gradient_deck(3))
+
+    defined = Counter(re.findall(r'<linearGradient id="([^"]+)"', html))
+    used = set(re.findall(r'url\(#([^)]+)\)', html))
+    assert defined and max(defined.values()) == 1
+    assert used == set(defined)
+    assert html.count('url(#') == 9
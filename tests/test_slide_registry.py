@@ -0,0 +1,23 @@
+import pytest
+
+from slide_registry import SlideRegistry
+
+
+def noop():
+    return ""
+
+
+@pytest.mark.parametrize('first, second', [('1', '01'), ('13a', '13A'), ('7', ' 7'), ('13a', '013a')])
+def test_rejects_ids_that_differ_only_in_spelling(first, second):
+    registry = SlideRegistry()
+    registry.slide(first, "First")(noop)
+    with pytest.raises(ValueError, match="already registered"):
+        registry.slide(second, "Second")
+    assert [s.id for s in registry] == [first]
+
+
+def test_accepts_distinct_variants():
+    registry = SlideRegistry()
+    for slide_id in ('1', '10', '13a', '13b'):
+        registry.slide(slide_id, slide_id)(noop)
+    assert len(registry) == 4
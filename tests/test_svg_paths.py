@@ -0,0 +1,151 @@
+import math
+import random
+import re
+
+import pytest
+
+try:
+    import build_slides_html as deck
+except (ImportError, OSError):  # WeasyPrint without its system libraries
+    pytest.skip("build_slides_html needs WeasyPrint", allow_module_level=True)
+
+
+def baseline_svg_blob(cx, cy, rx, ry, color, opacity=0.3, rotation=0, seed=0, style='organic'):
+    """svg_blob as it was before the geometry kernel, path cache and writer"""
+    rng = random.Random(seed)
+    config = deck.BLOB_STYLES.get(style, deck.BLOB_STYLES['organic'])
+    points, smooth = config['points'], config['smooth']
+
+    vertices = []
+    for i in range(points):
+        angle = (2 * math.pi * i) / points
+        variation = (
+            config['var1'] * math.sin(3 * angle + seed * 0.7) +
+            config['var2'] * math.cos(2 * angle + seed * 1.3) +
+            0.08 * math.sin(5 * angle + seed * 2.1) +
+            rng.uniform(-0.05, 0.05)
+        )
+        r_x = rx * (0.85 + variation)
+        r_y = ry * (0.85 + variation * 0.9)
+        vertices.append((cx + r_x * math.cos(angle), cy + r_y * math.sin(angle)))
+
+    path_parts = [f"M {vertices[0][0]:.1f} {vertices[0][1]:.1f}"]
+    for i in range(points):
+        curr = vertices[i]
+        next_v = vertices[(i + 1) % points]
+        prev = vertices[(i - 1) % points]
+        next_next = vertices[(i + 2) % points]
+        cp1_x = curr[0] + (next_v[0] - prev[0]) * smooth
+        cp1_y = curr[1] + (next_v[1] - prev[1]) * smooth
+        cp2_x = next_v[0] - (next_next[0] - curr[0]) * smooth
+        cp2_y = next_v[1] - (next_next[1] - curr[1]) * smooth
+        path_parts.append(f"C {cp1_x:.1f} {cp1_y:.1f}, {cp2_x:.1f} {cp2_y:.1f}, {next_v[0]:.1f} {next_v[1]:.1f}")
+    path_parts.append("Z")
+
+    transform = f'transform="rotate({rotation} {cx} {cy})"' if rotation != 0 else ''
+    return f'<path d="{" ".join(path_parts)}" fill="{color}" fill-opacity="{opacity}" {transform} />'
+
+
+def blob_cases(count=300):
+    rng = random.Random(2026)
+    styles = list(deck.BLOB_STYLES) + ['unknown']
+    for _ in range(count):
+        yield (rng.choice([rng.randint(-200, 2100), round(rng.uniform(-200, 2100), 2)]),
+               rng.randint(-200, 1300), rng.randint(5, 900), round(rng.uniform(5, 900), 1),
+               '#E07B6C', rng.choice([0.3, 0.15]), rng.choice([0, 15, -30.5]),
+               rng.randint(0, 500), rng.choice(styles))
+
+
+@pytest.mark.parametrize('numpy', [True, False])
+def test_blob_matches_baseline_at_legacy_precision(monkeypatch, numpy):
+    if numpy and deck.np is None:
+        pytest.skip("NumPy not installed")
+    if not numpy:
+        monkeypatch.setattr(deck, 'np', None)
+    deck._svg_blob_cached.cache_clear()
+    try:
+        for case in blob_cases():
+            assert deck._svg_blob_cached(*case, None) == baseline_svg_blob(*case), case
+    finally:
+        deck._svg_blob_cached.cache_clear()
+
+
+_PATH_TOKEN_RE = re.compile(r'[MLCQZHVmlcqzhv]|-?(?:\d+\.?\d*|\.\d+)')
+_PATH_ARITY = {'m': 2, 'l': 2, 'c': 6, 'q': 4, 'h': 1, 'v': 1, 'z': 0}
+
+
+def parse_path(d):
+    """Path data -> absolute [(letter, coords)] in write_path()'s input form"""
+    tokens = _PATH_TOKEN_RE.findall(d)
+    assert "".join(tokens) == re.sub(r'[\s,]', '', d), d
+    commands = []
+    cur = start = (0.0, 0.0)
+    letter = None
+    i = 0
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            letter = tokens[i]
+            i += 1
+        lower = letter.lower()
+        if lower == 'z':
+            commands.append(('Z', ()))
+            cur = start
+            continue
+        values = [float(t) for t in tokens[i:i + _PATH_ARITY[lower]]]
+        i += _PATH_ARITY[lower]
+        if lower == 'h':
+            values = [values[0] + (cur[0] if letter == 'h' else 0), cur[1]]
+            lower = 'l'
+        elif lower == 'v':
+            values = [cur[0], values[0] + (cur[1] if letter == 'v' else 0)]
+            lower = 'l'
+        elif letter.islower():
+            values = [v + cur[k % 2] for k, v in enumerate(values)]
+        commands.append((lower.upper(), values))
+        cur = (values[-2], values[-1])
+        if lower == 'm':
+            start = cur
+    return commands
+
+
+def random_commands(rng):
+    commands = [('M', [rng.uniform(-50, 1970), rng.uniform(-50, 1130)])]
+    for _ in range(rng.randint(1, 12)):
+        letter = rng.choice('LLCQZ')
+        if letter == 'Z':
+            commands.append(('Z', ()))
+            commands.append(('M', [rng.uniform(-50, 1970), rng.uniform(-50, 1130)]))
+            continue
+        x, y = commands[-1][1][-2:]
+        count = {'L': 2, 'C': 6, 'Q': 4}[letter]
+        coords = [rng.uniform(-300, 300) + (x, y)[k % 2] for k in range(count)]
+        if letter == 'L' and rng.random() < 0.3:  # horizontal / vertical runs
+            axis = rng.randint(0, 1)
+            coords[axis] = (x, y)[axis]
+        commands.append((letter, coords))
+    commands.append(('Z', ()))
+    return commands
+
+
+@pytest.mark.parametrize('precision', [0, 1, 2, 3])
+def test_write_path_round_trips(precision):
+    rng = random.Random(precision)
+    scale = 10 ** precision
+    for _ in range(500):
+        commands = random_commands(rng)
+        d = deck.write_path(commands, precision)
+        parsed = parse_path(d)
+        assert [c[0] for c in parsed] == [c[0] for c in commands], d
+        for (_, want), (_, got) in zip(commands, parsed):
+            # Each coordinate is rounded once to the grid, never accumulated
+            assert [round(v * scale) for v in got] == [round(v * scale) for v in want], d
+
+
+def test_write_path_blob_round_trips():
+    for case in blob_cases(100):
+        spec = deck._blob_spec(*case[:4], case[7], case[8])
+        values = deck._blob_values_python(spec)
+        commands = deck._blob_commands(values, spec.points)
+        parsed = parse_path(deck.write_path(commands, 1))
+        flat = [v for _, coords in parsed for v in coords]
+        assert [round(v * 10) for v in flat] == [round(v * 10) for v in values], case
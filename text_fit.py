@@ -0,0 +1,127 @@
+"""
+Bailey Vann - The 2026 Etsy Reset
+HEADLINE AUTO-FIT - largest font size + line breaks that fit a box
+
+Works purely from font_metrics (cached advance widths + kerning), so copy
+edits can be checked without running WeasyPrint or PowerPoint.
+
+    from text_fit import fit_text
+    fit = fit_text("Before We Begin...", 'Ogg Bold', 1680, 300, max_size=80)
+    fit.size, fit.lines, fit.fits
+
+Sizes and box dimensions share one unit (px for HTML, pt for PPTX).
+"""
+
+from collections import namedtuple
+from functools import lru_cache
+
+from font_metrics import get_metrics
+
+FitResult = namedtuple('FitResult', 'size lines fits')
+
+
+@lru_cache(maxsize=8192)
+def _unit_width(word, font_name, weight):
+    """Width of word at size 1 - widths scale linearly, so one entry serves every size"""
+    return get_metrics(font_name, weight).measure(word, 1)
+
+
+def text_width(text, font_name, size, weight=None, letter_spacing=0.0):
+    return _unit_width(text, font_name, weight) * size + letter_spacing * len(text)
+
+
+@lru_cache(maxsize=4096)
+def break_lines(text, font_name, size, max_width, weight=None, letter_spacing=0.0):
+    """
+    Greedy word wrap of text into lines no wider than max_width.
+
+    Explicit newlines are kept as hard breaks.  A single word wider than
+    max_width still gets its own line (fit_text treats that as overflow).
+    """
+    space = text_width(' ', font_name, size, weight, letter_spacing)
+    lines = []
+    for paragraph in text.split('\n'):
+        line = ""
+        line_width = 0.0
+        for word in paragraph.split():
+            width = text_width(word, font_name, size, weight, letter_spacing)
+            if line and line_width + space + width > max_width:
+                lines.append(line)
+                line, line_width = word, width
+            elif line:
+                line += ' ' + word
+                line_width += space + width
+            else:
+                line, line_width = word, width
+        lines.append(line)
+    return tuple(lines)
+
+
+def _fits(text, font_name, size, width, height, line_height, weight, letter_spacing, max_lines):
+    lines = break_lines(text, font_name, size, width, weight, letter_spacing)
+    if max_lines is not None and len(lines) > max_lines:
+        return None
+    if len(lines) * size * line_height > height:
+        return None
+    for line in lines:
+        if text_width(line, font_name, size, weight, letter_spacing) > width:
+            return None
+    return lines
+
+
+def fit_text(text, font_name, width, height, max_size, min_size=8, line_height=None,
+             weight=None, letter_spacing=0.0, max_lines=None, step=0.5):
+    """
+    Largest size in [min_size, max_size] (multiples of step) at which text fits.
+
+    line_height is a multiple of the font size (CSS line-height); None uses
+    the font's own ascent/descent/gap, like PowerPoint single spacing.
+    Returns FitResult(size, lines, fits); fits is False when even min_size
+    overflows, in which case size is min_size.
+    """
+    if line_height is None:
+        line_height = get_metrics(font_name, weight).line_height(1)
+
+    lo = int(round(min_size / step))
+    hi = int(round(max_size / step))
+
+    def attempt(n):
+        lines = _fits(text, font_name, n * step, width, height, line_height,
+                      weight, letter_spacing, max_lines)
+        return None if lines is None else FitResult(n * step, lines, True)
+
+    # Widths grow monotonically with size, so binary search the step grid
+    best = None
+    low, high = lo, hi
+    while low <= high:
+        mid = (low + high) // 2
+        result = attempt(mid)
+        if result is not None:
+            best = result
+            low = mid + 1
+        else:
+            high = mid - 1
+
+    # Greedy wrapping with max_lines isn't guaranteed to be monotonic, so
+    # don't trust a miss: step down linearly, and check the sizes just above
+    if best is None:
+        for n in range(hi, lo - 1, -1):
+            best = attempt(n)
+            if best is not None:
+                break
+    if best is not None:
+        n = int(round(best.size / step)) + 1
+        while n <= hi:
+            result = attempt(n)
+            if result is None:
+                break
+            best, n = result, n + 1
+
+    if best is None:
+        return FitResult(min_size, break_lines(text, font_name, min_size, width, weight, letter_spacing), False)
+    return best
+
+
+def cache_info():
+    """lru_cache statistics of the width and line-break memo tables"""
+    return {'widths': _unit_width.cache_info(), 'line_breaks': break_lines.cache_info()}